@@ -0,0 +1,81 @@
+import os
+import tempfile
+import time
+import tracemalloc
+
+import click
+from src.ingest_data import ChunkedZipDataIngestor
+from src.ingestion_schema import AMES_SCHEMA
+
+
+def check_chunk_budget(file_path: str, max_chunk_bytes: int, chunksize: int) -> dict:
+    """
+    Streams the archive in chunks and checks every chunk against the memory budget.
+
+    Each chunk's deep memory usage must be at most max_chunk_bytes, unless the chunk is a
+    single row. tracemalloc is running meanwhile, so the traced peak of the whole stream
+    is reported next to the largest chunk. An AssertionError is raised as soon as a chunk
+    exceeds the budget.
+
+    Returns:
+    dict: The number of chunks and rows, the largest chunk, the traced peak and the time.
+    """
+    ingestor = ChunkedZipDataIngestor(
+        dtype=AMES_SCHEMA, chunksize=chunksize, max_chunk_bytes=max_chunk_bytes
+    )
+    n_chunks = n_rows = largest = 0
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for chunk in ingestor.ingest(file_path):
+        chunk_bytes = int(chunk.memory_usage(deep=True).sum())
+        assert chunk_bytes <= max_chunk_bytes or len(chunk) == 1, (
+            f"A chunk of {len(chunk)} rows takes {chunk_bytes} bytes, "
+            f"over the budget of {max_chunk_bytes}."
+        )
+        n_chunks += 1
+        n_rows += len(chunk)
+        largest = max(largest, chunk_bytes)
+        del chunk
+    seconds = time.perf_counter() - start
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "chunks": n_chunks,
+        "rows": n_rows,
+        "largest": largest,
+        "peak_bytes": peak_bytes,
+        "seconds": seconds,
+    }
+
+
+@click.command()
+@click.option("--scales", default="1,10", help="Comma-separated dataset scales.")
+@click.option(
+    "--budgets", default="65536,262144,1048576", help="Comma-separated chunk budgets in bytes."
+)
+@click.option("--chunksize", default=100_000, help="The maximum number of rows per chunk.")
+def main(scales: str, budgets: str, chunksize: int):
+    """Checks that chunked ingestion keeps every chunk within its memory budget."""
+    from benchmarks.synthetic_ames import write_ames_archive
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in [int(value) for value in scales.split(",")]:
+            archive_path = os.path.join(tmp_dir, f"ames_x{scale}.zip")
+            n_rows = write_ames_archive(archive_path, scale)
+            print(f"\nScale x{scale}: {n_rows} rows")
+
+            for budget in [int(value) for value in budgets.split(",")]:
+                result = check_chunk_budget(archive_path, budget, chunksize)
+                assert result["rows"] == n_rows, f"Read {result['rows']} of {n_rows} rows."
+                print(
+                    f"  budget {budget / 1024:8.0f} KiB  {result['chunks']:6} chunks  "
+                    f"largest {result['largest'] / 1024:8.1f} KiB  "
+                    f"traced peak {result['peak_bytes'] / 1024**2:7.1f} MiB  "
+                    f"{result['seconds']:7.3f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+
+import click
+import pandas as pd
+from src.data_splitter import SimpleTrainTestSplitStrategy
+from src.execution_mode import enable_copy_on_write
+from src.feature_engineering import LogTransformation, OneHotEncoding, StandardScaling
+from src.handle_missing_values import FillMissingValuesStrategy
+from src.ingest_data import ZipDataIngestor
+from src.ingestion_schema import AMES_SCHEMA
+from src.outlier_detection import OutlierDetector, ZScoreOutlierDetection
+
+# The features transformed by the benchmarked chain, mirroring the training pipeline
+LOG_FEATURES = ["Gr Liv Area", "SalePrice"]
+SCALED_FEATURES = ["Lot Area", "Total Bsmt SF", "Garage Area"]
+
+
+def run_chain(df: pd.DataFrame) -> tuple:
+    """Runs the cleaning and transform strategies of the pipeline back to back."""
+    df = FillMissingValuesStrategy(method="mean").handle(df)
+    df = LogTransformation(LOG_FEATURES).apply_transformation(df)
+    df = StandardScaling(SCALED_FEATURES).apply_transformation(df)
+    df = OneHotEncoding(["Neighborhood"]).apply_transformation(df)
+    numeric = df.select_dtypes(include="number")
+    clean = OutlierDetector(ZScoreOutlierDetection(threshold=3)).handle_outliers(numeric)
+    return SimpleTrainTestSplitStrategy().split_data(clean, "SalePrice")
+
+
+def _chain_worker(archive_path: str, copy_on_write: bool, queue):
+    enable_copy_on_write(copy_on_write)
+    df = ZipDataIngestor(dtype=AMES_SCHEMA).ingest(archive_path)
+    input_bytes = int(df.memory_usage(deep=True).sum())
+
+    # numpy and pandas report their buffers to tracemalloc, so the peak covers every copy
+    tracemalloc.start()
+    start = time.perf_counter()
+    splits = run_chain(df)
+    seconds = time.perf_counter() - start
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    digest = [int(pd.util.hash_pandas_object(split).sum()) for split in splits]
+    queue.put(
+        {"seconds": seconds, "peak_bytes": peak_bytes, "input_bytes": input_bytes, "digest": digest}
+    )
+
+
+def measure(archive_path: str, copy_on_write: bool) -> dict:
+    """Runs the chain in a fresh spawned process, so neither run inherits the other's memory."""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_chain_worker, args=(archive_path, copy_on_write, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+@click.command()
+@click.option("--scales", default="1,10,50", help="Comma-separated dataset scales.")
+def main(scales: str):
+    """Compares the peak memory of the cleaning and transform chain with and without copy-on-write."""
+    from benchmarks.synthetic_ames import write_ames_archive
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in [int(value) for value in scales.split(",")]:
+            archive_path = os.path.join(tmp_dir, f"ames_x{scale}.zip")
+            n_rows = write_ames_archive(archive_path, scale)
+
+            copying = measure(archive_path, copy_on_write=False)
+            lazy = measure(archive_path, copy_on_write=True)
+            if copying["digest"] != lazy["digest"]:
+                raise RuntimeError("Copy-on-write changed the results of the chain.")
+
+            print(f"\nScale x{scale}: {n_rows} rows, {copying['input_bytes'] / 1e6:.1f} MB loaded")
+            for name, result in [("deep copies", copying), ("copy-on-write", lazy)]:
+                print(
+                    f"  {name:<14} {result['peak_bytes'] / 1e6:9.1f} MB peak  "
+                    f"{result['seconds']:8.3f}s"
+                )
+            saved = 1 - lazy["peak_bytes"] / copying["peak_bytes"]
+            print(f"  peak memory reduced by {saved:.1%}, results identical")
+
+
+if __name__ == "__main__":
+    main()
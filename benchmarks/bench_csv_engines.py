@@ -0,0 +1,67 @@
+import os
+import tempfile
+import time
+import zipfile
+
+import click
+from src.ingest_data import ZipDataIngestor
+from src.ingestion_schema import AMES_SCHEMA
+
+# Parser configurations compared by the benchmark
+ENGINE_CONFIGS = {
+    "c": {"engine": "c", "dtype_backend": "numpy"},
+    "pyarrow (numpy-backed)": {"engine": "pyarrow", "dtype_backend": "numpy"},
+    "pyarrow (arrow-backed)": {"engine": "pyarrow", "dtype_backend": "pyarrow"},
+}
+
+
+def write_scaled_archive(source_path: str, target_path: str, scale: int) -> int:
+    """
+    Writes a copy of the bundled archive whose CSV body is repeated `scale` times.
+
+    Returns:
+    int: The uncompressed size of the scaled CSV in bytes.
+    """
+    with zipfile.ZipFile(source_path) as zip_ref:
+        member = zip_ref.namelist()[0]
+        header, body = zip_ref.read(member).split(b"\n", 1)
+    body = body if body.endswith(b"\n") else body + b"\n"
+    payload = header + b"\n" + body * scale
+    with zipfile.ZipFile(target_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_ref:
+        zip_ref.writestr(member, payload)
+    return len(payload)
+
+
+def time_ingest(ingestor: ZipDataIngestor, file_path: str, repeats: int) -> tuple:
+    """Returns the best wall-clock time over `repeats` runs and the number of parsed rows."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        df = ingestor.ingest(file_path)
+        best = min(best, time.perf_counter() - start)
+    return best, len(df)
+
+
+@click.command()
+@click.option("--file-path", default="data/archive.zip", help="The archive to benchmark.")
+@click.option("--scales", default="1,10,50", help="Comma-separated copy counts of the data.")
+@click.option("--repeats", default=3, help="Runs per configuration; the best time is kept.")
+def main(file_path: str, scales: str, repeats: int):
+    """Compares CSV parse throughput of the C and Arrow engines on scaled copies of the data."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in [int(value) for value in scales.split(",")]:
+            scaled_path = os.path.join(tmp_dir, f"scaled_{scale}.zip")
+            csv_bytes = write_scaled_archive(file_path, scaled_path, scale)
+            print(f"\nScale x{scale}: {csv_bytes / 1e6:.1f} MB of CSV")
+
+            for name, config in ENGINE_CONFIGS.items():
+                ingestor = ZipDataIngestor(dtype=AMES_SCHEMA, **config)
+                seconds, rows = time_ingest(ingestor, scaled_path, repeats)
+                print(
+                    f"  {name:<24} {seconds:8.3f}s  {csv_bytes / 1e6 / seconds:8.1f} MB/s  "
+                    f"{rows / seconds:12,.0f} rows/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+
+import click
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from src.data_splitter import SimpleTrainTestSplitStrategy
+from src.execution_mode import PRECISIONS, float_dtype, set_precision
+from src.feature_engineering import (
+    FeatureEngineer,
+    LogTransformation,
+    StandardScaling,
+    TargetTransformedRegressor,
+)
+from src.handle_missing_values import MissingValueImputer
+from src.ingest_data import ZipDataIngestor
+from src.ingestion_schema import AMES_SCHEMA
+
+# The feature transforms of the benchmarked chain, mirroring the training pipeline
+LOG_FEATURES = ["Gr Liv Area", "SalePrice"]
+SCALED_FEATURES = ["Lot Area", "Total Bsmt SF", "Garage Area"]
+
+
+def run_chain(df: pd.DataFrame) -> tuple:
+    """
+    Runs feature engineering, training and scoring in the configured precision.
+
+    Returns:
+    tuple: The predicted and actual test prices, and the test R-squared on the log scale.
+    """
+    engineer = FeatureEngineer([LogTransformation(LOG_FEATURES), StandardScaling(SCALED_FEATURES)])
+    engineered = engineer.apply_feature_engineering(df.select_dtypes(include="number"))
+    X_train, X_test, y_train, y_test = SimpleTrainTestSplitStrategy().split_data(
+        engineered, "SalePrice"
+    )
+
+    # The numerical branch and the regressor of the model building step
+    dtype = float_dtype()
+    preprocessor = MissingValueImputer(method="mean", dtype=dtype)
+    if dtype == np.float32:
+        preprocessor = Pipeline(steps=[("imputer", preprocessor), ("scaler", StandardScaler())])
+    model = Pipeline(
+        steps=[
+            ("preprocessor", preprocessor),
+            ("model", TargetTransformedRegressor(LinearRegression(), engineer, "SalePrice")),
+        ]
+    ).fit(X_train, y_train)
+
+    log_predictions = model.named_steps["model"].regressor_.predict(model[:-1].transform(X_test))
+    r2 = r2_score(y_test, log_predictions)
+    actual = engineer.inverse_transform(y_test.to_frame())["SalePrice"].to_numpy(np.float64)
+    return model.predict(X_test), actual, r2
+
+
+def _chain_worker(archive_path: str, precision: str, repeats: int, queue):
+    set_precision(precision)
+    df = ZipDataIngestor(dtype=AMES_SCHEMA).ingest(archive_path)
+
+    # Timed runs are untraced, as tracemalloc slows down every allocation
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run_chain(df)
+        timings.append(time.perf_counter() - start)
+
+    # numpy and pandas report their buffers to tracemalloc, so the peak covers every array
+    tracemalloc.start()
+    predicted, actual, r2 = run_chain(df)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    queue.put(
+        {
+            "seconds": min(timings),
+            "peak_bytes": peak_bytes,
+            "dtype": predicted.dtype.name,
+            "predicted": predicted.astype(np.float64),
+            "rmse": mean_squared_error(actual, predicted, squared=False),
+            "r2": r2,
+        }
+    )
+
+
+def measure(archive_path: str, precision: str, repeats: int) -> dict:
+    """
+    Runs the chain in a fresh spawned process, so neither precision inherits the other's
+    memory. The best time of the untraced runs is kept, and the peak memory is traced on
+    one more run.
+    """
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(
+        target=_chain_worker, args=(archive_path, precision, repeats, queue)
+    )
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+@click.command()
+@click.option("--scales", default="10,50", help="Comma-separated dataset scales.")
+@click.option("--repeats", default=5, help="Timed runs per precision; the best time is kept.")
+def main(scales: str, repeats: int):
+    """Compares the speed, memory and accuracy of float64 and float32 training and scoring."""
+    from benchmarks.synthetic_ames import write_ames_archive
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in [int(value) for value in scales.split(",")]:
+            archive_path = os.path.join(tmp_dir, f"ames_x{scale}.zip")
+            n_rows = write_ames_archive(archive_path, scale)
+            results = {
+                precision: measure(archive_path, precision, repeats) for precision in PRECISIONS
+            }
+
+            print(f"\nScale x{scale}: {n_rows} rows")
+            for precision, result in results.items():
+                print(
+                    f"  {precision:<8} {result['seconds']:8.3f}s "
+                    f"{result['peak_bytes'] / 1e6:9.1f} MB peak  "
+                    f"test RMSE {result['rmse']:12,.2f}  R2 {result['r2']:.6f}  "
+                    f"({result['dtype']} predictions)"
+                )
+            wide, narrow = results["float64"], results["float32"]
+            relative = np.abs(narrow["predicted"] / wide["predicted"] - 1)
+            print(
+                f"  float32 speedup {wide['seconds'] / narrow['seconds']:.2f}x, "
+                f"peak memory {narrow['peak_bytes'] / wide['peak_bytes']:.0%} of float64"
+            )
+            print(
+                f"  accuracy delta: RMSE {narrow['rmse'] - wide['rmse']:+,.4f}, "
+                f"R2 {narrow['r2'] - wide['r2']:+.2e}, "
+                f"max relative prediction difference {relative.max():.2e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
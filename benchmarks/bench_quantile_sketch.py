@@ -0,0 +1,75 @@
+import time
+import tracemalloc
+
+import click
+import numpy as np
+import pandas as pd
+from src.quantile_sketch import ColumnQuantileSketch
+
+# The quantiles outlier handling needs: the IQR quartiles and the capping percentiles
+QUANTILES = [0.01, 0.25, 0.75, 0.99]
+
+
+def make_frame(n_rows: int, n_columns: int, seed: int) -> pd.DataFrame:
+    """Builds a frame of skewed float32 columns with missing values, like the Ames areas."""
+    rng = np.random.default_rng(seed)
+    values = rng.lognormal(6, 0.6, (n_rows, n_columns)).astype(np.float32)
+    values[rng.random((n_rows, n_columns)) < 0.05] = np.nan
+    return pd.DataFrame(values, columns=[f"area_{index}" for index in range(n_columns)])
+
+
+def exact_quantiles(df: pd.DataFrame) -> pd.DataFrame:
+    """The previous implementation: one quantile call per quartile and per percentile."""
+    return pd.DataFrame([df.quantile(q) for q in QUANTILES], index=QUANTILES)
+
+
+def sketch_quantiles(df: pd.DataFrame, chunk_rows: int, k: int) -> pd.DataFrame:
+    """Sketches the frame chunk by chunk and answers every quantile from the one pass."""
+    sketch = ColumnQuantileSketch(k, seed=0)
+    for start in range(0, len(df), chunk_rows):
+        sketch.update(df.iloc[start : start + chunk_rows])
+    return sketch.quantile(QUANTILES)
+
+
+def measure(function, *args) -> tuple:
+    """Returns the wall-clock time, the peak traced memory and the result of a call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    seconds = time.perf_counter() - start
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak_bytes, result
+
+
+def max_rank_error(df: pd.DataFrame, estimates: pd.DataFrame) -> float:
+    """Returns the largest distance between the requested and the actual rank of an estimate."""
+    errors = []
+    for column in df.columns:
+        values = np.sort(df[column].dropna().to_numpy(dtype=np.float64))
+        ranks = np.searchsorted(values, estimates[column].to_numpy()) / len(values)
+        errors.append(np.abs(ranks - np.array(QUANTILES)).max())
+    return max(errors)
+
+
+@click.command()
+@click.option("--rows", default="100000,1000000", help="Comma-separated row counts.")
+@click.option("--columns", default=38, help="The number of numeric columns.")
+@click.option("--chunk-rows", default=50_000, help="The rows per chunk of the sketch pass.")
+@click.option("--k", default=200, help="The KLL sketch size per column.")
+def main(rows: str, columns: int, chunk_rows: int, k: int):
+    """Compares exact outlier-handling quantiles with a single chunked KLL sketch pass."""
+    for n_rows in [int(value) for value in rows.split(",")]:
+        df = make_frame(n_rows, columns, seed=42)
+        exact_seconds, exact_peak, _ = measure(exact_quantiles, df)
+        sketch_seconds, sketch_peak, estimates = measure(sketch_quantiles, df, chunk_rows, k)
+        print(
+            f"{n_rows:>10,} rows x {columns} columns  "
+            f"exact {exact_seconds:7.3f}s {exact_peak / 1e6:8.1f} MB peak  "
+            f"sketch {sketch_seconds:7.3f}s {sketch_peak / 1e6:8.1f} MB peak  "
+            f"max rank error {max_rank_error(df, estimates):.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+import multiprocessing
+import time
+import tracemalloc
+
+import click
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
+from src.feature_engineering import OneHotEncoding, SparseColumnsTransformer
+from src.handle_missing_values import MissingValueImputer
+from src.model_building import SparseLinearRegression
+
+
+def make_frame(n_rows: int, n_categories: int, seed: int) -> pd.DataFrame:
+    """
+    Builds a frame of a few numeric columns and one high-cardinality categorical column,
+    with a log-scale target that depends on both.
+    """
+    rng = np.random.default_rng(seed)
+    # Zipf-like category frequencies, as for neighbourhoods or postcodes
+    weights = 1 / np.arange(1, n_categories + 1)
+    codes = rng.choice(n_categories, n_rows, p=weights / weights.sum())
+    area = rng.lognormal(7, 0.4, n_rows)
+    year = rng.integers(1900, 2010, n_rows)
+    lot = rng.lognormal(9, 0.6, n_rows)
+    lot[rng.random(n_rows) < 0.05] = np.nan
+    effects = rng.normal(0, 0.2, n_categories)
+    noise = rng.normal(0, 0.1, n_rows)
+    target = 0.6 * np.log(area) + 0.004 * (year - 1900) + effects[codes] + noise
+    return pd.DataFrame(
+        {
+            "Gr Liv Area": area,
+            "Year Built": year,
+            "Lot Area": lot,
+            "Location": pd.Categorical.from_codes(
+                codes, categories=[f"loc_{code}" for code in range(n_categories)]
+            ),
+            "SalePrice": target,
+        }
+    )
+
+
+def build_model(X: pd.DataFrame, sparse: bool) -> Pipeline:
+    """Builds the preprocessing and regressor of the model building step."""
+    sparse_cols = [
+        column for column, dtype in X.dtypes.items() if isinstance(dtype, pd.SparseDtype)
+    ]
+    numerical_cols = [column for column in X.columns if column not in sparse_cols]
+    preprocessor = ColumnTransformer(
+        transformers=[
+            ("num", MissingValueImputer(method="mean"), numerical_cols),
+            ("sparse", SparseColumnsTransformer(), sparse_cols),
+        ],
+        sparse_threshold=1.0 if sparse else 0.3,
+    )
+    regressor = SparseLinearRegression() if sparse else LinearRegression()
+    return Pipeline(steps=[("preprocessor", preprocessor), ("model", regressor)])
+
+
+def _worker(n_rows: int, n_categories: int, sparse: bool, queue):
+    df = make_frame(n_rows, n_categories, seed=42)
+
+    # numpy, pandas and scipy report their buffers to tracemalloc, so the peaks cover them
+    tracemalloc.start()
+    start = time.perf_counter()
+    encoded = OneHotEncoding(["Location"], sparse=sparse).apply_transformation(df)
+    encode_seconds = time.perf_counter() - start
+    _, encode_peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.reset_peak()
+    X, y = encoded.drop(columns=["SalePrice"]), encoded["SalePrice"]
+    start = time.perf_counter()
+    model = build_model(X, sparse).fit(X, y)
+    fit_seconds = time.perf_counter() - start
+    _, fit_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    queue.put(
+        {
+            "encode_seconds": encode_seconds,
+            "encode_peak": encode_peak,
+            "fit_seconds": fit_seconds,
+            "fit_peak": fit_peak,
+            "frame_bytes": int(encoded.memory_usage(deep=True).sum()),
+            "predictions": model.predict(X.head(1000)),
+        }
+    )
+
+
+def measure(n_rows: int, n_categories: int, sparse: bool) -> dict:
+    """Runs one configuration in a fresh spawned process, so runs do not share memory."""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_worker, args=(n_rows, n_categories, sparse, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="The number of rows.")
+@click.option("--categories", default="10,100,1000,10000", help="Comma-separated category counts.")
+@click.option(
+    "--dense-limit-mb",
+    default=1024,
+    help="Dense runs whose one-hot block would exceed this size are skipped.",
+)
+def main(rows: int, categories: str, dense_limit_mb: int):
+    """Compares dense and sparse one-hot encoding and model fitting as categories grow."""
+    for n_categories in [int(value) for value in categories.split(",")]:
+        print(f"\n{rows:,} rows, {n_categories:,} categories")
+        results = {"sparse": measure(rows, n_categories, sparse=True)}
+        if rows * n_categories * 8 <= dense_limit_mb * 1e6:
+            results["dense"] = measure(rows, n_categories, sparse=False)
+        else:
+            print(f"  {'dense':<7} skipped, the one-hot block alone exceeds {dense_limit_mb} MB")
+
+        for name in ["dense", "sparse"]:
+            if name not in results:
+                continue
+            result = results[name]
+            print(
+                f"  {name:<7} frame {result['frame_bytes'] / 1e6:9.1f} MB  "
+                f"encode {result['encode_seconds']:7.3f}s "
+                f"{result['encode_peak'] / 1e6:9.1f} MB peak  "
+                f"fit {result['fit_seconds']:7.3f}s {result['fit_peak'] / 1e6:9.1f} MB peak"
+            )
+        if "dense" in results:
+            difference = np.abs(results["dense"]["predictions"] - results["sparse"]["predictions"])
+            print(f"  max prediction difference {difference.max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import math
+import os
+import sqlite3
+import tempfile
+import time
+
+import click
+import numpy as np
+import pandas as pd
+from src.ingest_data import SQLDataIngestor, ZipDataIngestor
+from src.ingestion_schema import AMES_SCHEMA
+
+# The columns fetched by the usecols check, of integer, float and categorical dtypes
+SELECTED_COLUMNS = ["Order", "Lot Area", "Neighborhood", "Year Built", "SalePrice"]
+
+
+class BatchRecordingIngestor(SQLDataIngestor):
+    """An SQLDataIngestor that records the size of every fetched batch of one column."""
+
+    def __init__(self, *args, recorded_column: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recorded_column = recorded_column
+        self.batch_sizes = []
+
+    def _to_array(self, column: str, values: tuple) -> np.ndarray:
+        if column == self.recorded_column:
+            self.batch_sizes.append(len(values))
+        return super()._to_array(column, values)
+
+
+def write_sqlite_table(df: pd.DataFrame, database_path: str, table: str = "houses") -> str:
+    """
+    Writes the frame to a table of a new SQLite file, with the columns' SQL types.
+
+    Returns:
+    str: The database URL of the file.
+    """
+    with sqlite3.connect(database_path) as connection:
+        df.astype({column: str for column in df.select_dtypes("category").columns}).to_sql(
+            table, connection, index=False
+        )
+    return f"sqlite:///{database_path}"
+
+
+def check_sql_ingestion(url: str, expected: pd.DataFrame, fetch_size: int) -> float:
+    """
+    Ingests the table through SQLDataIngestor and checks the batching, the dtypes and
+    usecols, NULLs in integer columns and an empty result set. An AssertionError is raised
+    on the first mismatch.
+
+    Returns:
+    float: The seconds taken by the full-table ingestion.
+    """
+    schema = {column: AMES_SCHEMA[column] for column in SELECTED_COLUMNS}
+
+    # Batching: every fetch holds at most fetch_size rows
+    ingestor = BatchRecordingIngestor(
+        'SELECT * FROM "houses"',
+        fetch_size=fetch_size,
+        dtype=schema,
+        usecols=SELECTED_COLUMNS,
+        recorded_column=SELECTED_COLUMNS[0],
+    )
+    start = time.perf_counter()
+    df = ingestor.ingest(url)
+    seconds = time.perf_counter() - start
+    assert ingestor.batch_sizes and max(ingestor.batch_sizes) <= fetch_size, ingestor.batch_sizes
+    assert len(ingestor.batch_sizes) == math.ceil(len(expected) / fetch_size), (
+        f"{len(ingestor.batch_sizes)} batches for {len(expected)} rows of {fetch_size}."
+    )
+
+    # usecols and dtypes: only the selected columns, in the declared dtypes
+    assert list(df.columns) == SELECTED_COLUMNS, list(df.columns)
+    for column in SELECTED_COLUMNS:
+        assert df[column].dtype == schema[column], (
+            f"{column}: {df[column].dtype} instead of {schema[column]}"
+        )
+    pd.testing.assert_frame_equal(
+        df.astype({"Neighborhood": str}),
+        expected[SELECTED_COLUMNS].astype({"Neighborhood": str}).reset_index(drop=True),
+        check_categorical=False,
+    )
+
+    # A NULL in an integer column gives the nullable integer dtype of the same width
+    nullable = SQLDataIngestor(
+        'SELECT "Order", CASE WHEN "Order" % 2 = 0 THEN NULL ELSE "Year Built" END '
+        'AS "Year Built" FROM "houses"',
+        fetch_size=fetch_size,
+        dtype={"Order": schema["Order"], "Year Built": schema["Year Built"]},
+    ).ingest(url)
+    assert nullable["Year Built"].dtype == "Int16", nullable["Year Built"].dtype
+    assert nullable["Year Built"].isna().sum() == (expected["Order"] % 2 == 0).sum()
+
+    # An empty result set keeps the declared dtypes
+    empty = SQLDataIngestor(
+        'SELECT * FROM "houses" WHERE 0 = 1', dtype=schema, usecols=SELECTED_COLUMNS
+    ).ingest(url)
+    assert len(empty) == 0 and list(empty.columns) == SELECTED_COLUMNS, empty
+    for column in SELECTED_COLUMNS:
+        assert empty[column].dtype == schema[column], (
+            f"empty {column}: {empty[column].dtype} instead of {schema[column]}"
+        )
+    return seconds
+
+
+@click.command()
+@click.option("--file-path", default="data/archive.zip", help="The archive to load into SQLite.")
+@click.option("--fetch-sizes", default="1000,10000", help="Comma-separated fetch sizes.")
+def main(file_path: str, fetch_sizes: str):
+    """Checks SQLDataIngestor against a local SQLite file and times it against read_sql."""
+    expected = ZipDataIngestor(dtype=AMES_SCHEMA).ingest(file_path)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        url = write_sqlite_table(expected, os.path.join(tmp_dir, "ames.sqlite"))
+        print(f"{len(expected)} rows in SQLite")
+
+        selected = ", ".join(f'"{column}"' for column in SELECTED_COLUMNS)
+        start = time.perf_counter()
+        pd.read_sql(f'SELECT {selected} FROM "houses"', url)
+        print(f"  read_sql         (same columns) {time.perf_counter() - start:8.3f}s")
+        for fetch_size in [int(value) for value in fetch_sizes.split(",")]:
+            seconds = check_sql_ingestion(url, expected, fetch_size)
+            print(f"  fetch size {fetch_size:>7,} (usecols)      {seconds:8.3f}s  checks passed")
+
+
+if __name__ == "__main__":
+    main()
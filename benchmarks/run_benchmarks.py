@@ -0,0 +1,163 @@
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import click
+
+# Benchmarks run in a fresh process each, so peak RSS is measured per benchmark
+BENCHMARKS = [
+    "ingest_zip",
+    "ingest_zip_schema",
+    "drop_missing_values",
+    "fill_missing_mean",
+    "fill_missing_median",
+    "fill_missing_mode",
+    "log_transformation",
+    "standard_scaling",
+    "minmax_scaling",
+    "onehot_encoding",
+    "zscore_outliers",
+    "iqr_outliers",
+    "iqr_outliers_sketch",
+    "train_test_split",
+    "linear_regression",
+]
+
+
+def _peak_rss_mb() -> float:
+    """Returns the peak resident set size of the current process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _run_benchmark(name: str, archive_path: str) -> dict:
+    """Loads the data, times a single benchmark and returns its measurements."""
+    from src.data_splitter import SimpleTrainTestSplitStrategy
+    from src.feature_engineering import (
+        LogTransformation,
+        MinMaxScaling,
+        OneHotEncoding,
+        StandardScaling,
+    )
+    from src.handle_missing_values import DropMissingValuesStrategy, FillMissingValuesStrategy
+    from src.ingest_data import ZipDataIngestor
+    from src.ingestion_schema import AMES_SCHEMA
+    from src.model_building import LinearRegressionStrategy
+    from src.outlier_detection import IQROutlierDetection, ZScoreOutlierDetection
+
+    if name == "ingest_zip":
+        start = time.perf_counter()
+        df = ZipDataIngestor().ingest(archive_path)
+        return {"rows": len(df), "seconds": time.perf_counter() - start}
+    if name == "ingest_zip_schema":
+        start = time.perf_counter()
+        df = ZipDataIngestor(dtype=AMES_SCHEMA).ingest(archive_path)
+        return {"rows": len(df), "seconds": time.perf_counter() - start}
+
+    df = ZipDataIngestor(dtype=AMES_SCHEMA).ingest(archive_path)
+    # The peak so far covers imports and loading, so it is reported next to the overall peak
+    loaded_rss_mb = _peak_rss_mb()
+    numeric = df.select_dtypes(include="number")
+    areas = ["Gr Liv Area", "Lot Area", "SalePrice"]
+    operations = {
+        "drop_missing_values": lambda: DropMissingValuesStrategy(axis=0).handle(numeric),
+        "fill_missing_mean": lambda: FillMissingValuesStrategy(method="mean").handle(df),
+        "fill_missing_median": lambda: FillMissingValuesStrategy(method="median").handle(df),
+        "fill_missing_mode": lambda: FillMissingValuesStrategy(method="mode").handle(df),
+        "log_transformation": lambda: LogTransformation(areas).apply_transformation(df),
+        "standard_scaling": lambda: StandardScaling(areas).apply_transformation(df),
+        "minmax_scaling": lambda: MinMaxScaling(areas).apply_transformation(df),
+        "onehot_encoding": lambda: OneHotEncoding(["Neighborhood"]).apply_transformation(df),
+        "zscore_outliers": lambda: ZScoreOutlierDetection(threshold=3).detect_outliers(numeric),
+        "iqr_outliers": lambda: IQROutlierDetection().detect_outliers(numeric),
+        "iqr_outliers_sketch": lambda: IQROutlierDetection(backend="sketch").detect_outliers(
+            numeric
+        ),
+        "train_test_split": lambda: SimpleTrainTestSplitStrategy().split_data(numeric, "SalePrice"),
+        "linear_regression": lambda: LinearRegressionStrategy().build_and_train_model(
+            numeric.fillna(0).drop(columns=["SalePrice"]), numeric["SalePrice"]
+        ),
+    }
+
+    start = time.perf_counter()
+    operations[name]()
+    return {
+        "rows": len(df),
+        "seconds": time.perf_counter() - start,
+        "loaded_rss_mb": loaded_rss_mb,
+    }
+
+
+def _benchmark_worker(name: str, archive_path: str, queue):
+    result = _run_benchmark(name, archive_path)
+    result["peak_rss_mb"] = _peak_rss_mb()
+    queue.put(result)
+
+
+def run_in_fresh_process(name: str, archive_path: str) -> dict:
+    """Runs one benchmark in a spawned process and returns its measurements."""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_benchmark_worker, args=(name, archive_path, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@click.command()
+@click.option("--scales", default="10,100,1000", help="Comma-separated dataset scales.")
+@click.option("--benchmarks", default=",".join(BENCHMARKS), help="Comma-separated benchmarks.")
+@click.option("--output", default="benchmark_results.json", help="The JSON results file.")
+def main(scales: str, benchmarks: str, output: str):
+    """Benchmarks ingestion, every src/ strategy and training on synthetic Ames-like data."""
+    from benchmarks.synthetic_ames import write_ames_archive
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in [int(value) for value in scales.split(",")]:
+            archive_path = os.path.join(tmp_dir, f"ames_x{scale}.zip")
+            n_rows = write_ames_archive(archive_path, scale)
+            print(f"\nScale x{scale}: {n_rows} rows")
+
+            for name in benchmarks.split(","):
+                result = run_in_fresh_process(name, archive_path)
+                result.update(
+                    benchmark=name,
+                    scale=scale,
+                    rows_per_sec=result["rows"] / result["seconds"],
+                )
+                results.append(result)
+                print(
+                    f"  {name:<22} {result['seconds']:9.3f}s "
+                    f"{result['rows_per_sec']:14,.0f} rows/s {result['peak_rss_mb']:9.1f} MB peak"
+                )
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote results to {output}")
+
+
+if __name__ == "__main__":
+    main()
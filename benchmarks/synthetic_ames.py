@@ -0,0 +1,117 @@
+import zipfile
+
+import click
+import numpy as np
+import pandas as pd
+from src.ingest_data import ZipDataIngestor
+
+# Columns whose values are measured quantities and get multiplicative noise when resampled.
+# Years, months, ratings and counts are resampled as-is so they stay valid.
+CONTINUOUS_COLUMNS = [
+    "Lot Frontage",
+    "Lot Area",
+    "Mas Vnr Area",
+    "BsmtFin SF 1",
+    "BsmtFin SF 2",
+    "Bsmt Unf SF",
+    "Total Bsmt SF",
+    "1st Flr SF",
+    "2nd Flr SF",
+    "Low Qual Fin SF",
+    "Gr Liv Area",
+    "Garage Area",
+    "Wood Deck SF",
+    "Open Porch SF",
+    "Enclosed Porch",
+    "3Ssn Porch",
+    "Screen Porch",
+    "Pool Area",
+    "Misc Val",
+    "SalePrice",
+]
+
+
+def generate_ames_like(
+    source: pd.DataFrame, n_rows: int, seed: int = 42, start_order: int = 1, noise: float = 0.05
+) -> pd.DataFrame:
+    """
+    Generates rows statistically similar to the Ames data by resampling whole source rows.
+
+    Resampling whole rows keeps every column's marginal distribution, its missing-value rate
+    and the correlations between columns. Continuous columns get multiplicative log-normal
+    noise (zeros and missing values are kept), Order and PID are made unique, and every
+    column keeps the name and dtype pandas infers for the source CSV.
+
+    Parameters:
+    source (pd.DataFrame): The Ames data to resample, read with default dtypes.
+    n_rows (int): The number of rows to generate.
+    seed (int): The seed of the random number generator.
+    start_order (int): The first Order value, so consecutive blocks stay unique.
+    noise (float): The standard deviation of the log-normal noise.
+
+    Returns:
+    pd.DataFrame: The generated rows.
+    """
+    rng = np.random.default_rng(seed)
+    df = source.iloc[rng.integers(0, len(source), n_rows)].reset_index(drop=True)
+
+    for column in CONTINUOUS_COLUMNS:
+        values = df[column].to_numpy(dtype=np.float64) * rng.lognormal(0.0, noise, n_rows)
+        if pd.api.types.is_integer_dtype(df[column].dtype):
+            df[column] = np.round(values).astype(df[column].dtype)
+        else:
+            df[column] = np.round(values, 1).astype(df[column].dtype)
+
+    order = np.arange(start_order, start_order + n_rows, dtype=df["Order"].dtype)
+    df["Order"] = order
+    # Ames PIDs are nine or ten digits; offsetting keeps them unique and within int32
+    df["PID"] = (500_000_000 + order).astype(df["PID"].dtype)
+    return df
+
+
+def write_ames_archive(
+    target_path: str,
+    scale: int,
+    source_path: str = "data/archive.zip",
+    seed: int = 42,
+    block_rows: int = 100_000,
+) -> int:
+    """
+    Writes a ZIP archive holding `scale` times as many Ames-like rows as the source.
+
+    Rows are generated and compressed block by block, so memory stays bounded at any scale.
+
+    Parameters:
+    target_path (str): The path of the archive to write.
+    scale (int): The size of the output relative to the source.
+    source_path (str): The bundled Ames archive to resample.
+    seed (int): The seed of the random number generator.
+    block_rows (int): The number of rows generated per block.
+
+    Returns:
+    int: The number of rows written.
+    """
+    source = ZipDataIngestor().ingest(source_path)
+    n_rows = len(source) * scale
+
+    with zipfile.ZipFile(target_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_ref:
+        with zip_ref.open("AmesHousing.csv", "w", force_zip64=True) as csv_stream:
+            for block, start in enumerate(range(0, n_rows, block_rows)):
+                rows = min(block_rows, n_rows - start)
+                df = generate_ames_like(source, rows, seed=seed + block, start_order=start + 1)
+                csv_stream.write(df.to_csv(index=False, header=block == 0).encode())
+    return n_rows
+
+
+@click.command()
+@click.option("--scale", default=10, help="The size of the output relative to the bundled data.")
+@click.option("--output", default="data/synthetic_x10.zip", help="The archive to write.")
+@click.option("--seed", default=42, help="The seed of the random number generator.")
+def main(scale: int, output: str, seed: int):
+    """Writes a synthetic Ames-like archive at the requested scale."""
+    n_rows = write_ames_archive(output, scale, seed=seed)
+    print(f"Wrote {n_rows} rows to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,22 @@
+from src.ingestion_schema import consumed_columns
+from steps.commit_increment_step import commit_increment_step
 from steps.data_ingestion_step import data_ingestion_step
 from steps.data_splitter_step import data_splitter_step
-from steps.feature_engineering_step import feature_engineering_step
-from steps.handle_missing_values_step import handle_missing_values_step
+from steps.feature_engineering_step import feature_engineering_step, transform_input_columns
+from steps.incremental_feature_engineering_step import incremental_feature_engineering_step
+from steps.incremental_ingestion_step import incremental_ingestion_step
 from steps.model_building_step import model_building_step
 from steps.model_evaluator_step import model_evaluator_step
 from steps.outlier_detection_step import outlier_detection_step
 from zenml import Model, pipeline, step
 
+# The feature engineering applied before outlier detection, as one ordered transform spec
+FEATURE_TRANSFORMS = [{"strategy": "log", "features": ["Gr Liv Area", "SalePrice"]}]
+
+# The transforms that learn from the target, fitted on the training split by the model step,
+# e.g. [{"strategy": "target_encoding", "features": ["Neighborhood"]}]
+MODEL_TRANSFORMS = []
+
 
 @pipeline(
     model=Model(
@@ -14,30 +24,139 @@ from zenml import Model, pipeline, step
         name="prices_predictor"
     ),
 )
-def ml_pipeline():
-    """Define an end-to-end machine learning pipeline."""
+def ml_pipeline(precision: str = "float64"):
+    """
+    Define an end-to-end machine learning pipeline.
+
+    `precision` is the floating-point precision, "float64" or "float32", of the feature
+    matrices and model parameters from feature engineering to the exported model.
+    """
+
+    # Work out the columns consumed downstream, so ingestion only parses those
+    ingest_columns = consumed_columns(
+        target_column="SalePrice",
+        features=transform_input_columns(FEATURE_TRANSFORMS + MODEL_TRANSFORMS),
+    )
 
     # Data Inestion Step
     raw_data = data_ingestion_step(
-        file_path="data/archive.zip"
+        file_path="data/archive.zip", cache_dir=".ingestion_cache", columns=ingest_columns
     )
 
-    # Handling Missing Values Step
-    filled_data = handle_missing_values_step(raw_data)
+    # Missing values are imputed inside the model pipeline, with fill values learned
+    # from the training split only, so no statistics leak from the test split.
 
     # Feature Engineering Step
-    engineered_data = feature_engineering_step(
-        filled_data, strategy="log", features=["Gr Liv Area", "SalePrice"]
+    engineered_data, feature_engineer = feature_engineering_step(
+        raw_data, transforms=FEATURE_TRANSFORMS, precision=precision
     )
 
     # Outlier Detection Step
-    clean_data = outlier_detection_step(engineered_data, column_name="SalePrice")
+    clean_data = outlier_detection_step(
+        engineered_data,
+        column_name="SalePrice",
+        keep_columns=transform_input_columns(MODEL_TRANSFORMS),
+    )
 
     # Data Splitting Step
     X_train, X_test, y_train, y_test = data_splitter_step(clean_data, target_column="SalePrice")
 
-    # Model Building Step
-    model = model_building_step(X_train=X_train, y_train=y_train)
+    # Model Building Step, exporting the feature transforms together with the model
+    model = model_building_step(
+        X_train=X_train,
+        y_train=y_train,
+        feature_engineer=feature_engineer,
+        target_column="SalePrice",
+        precision=precision,
+        raw_data=raw_data,
+        model_transforms=MODEL_TRANSFORMS,
+    )
+
+    # Model Evaluation Step
+    evaluation_metrics, mse = model_evaluator_step(
+        trained_model=model, X_test=X_test, y_test=y_test
+    )
+
+    return model
+
+
+@pipeline(
+    model=Model(
+        # The name uniquely identifies this model
+        name="prices_predictor"
+    ),
+)
+def incremental_ml_pipeline(
+    precision: str = "float64", refit: bool = False, refit_every: int = None
+):
+    """
+    Define a pipeline that ingests and transforms only the sales past the stored watermark.
+
+    The new rows are transformed with the stored, already fitted feature transforms and
+    combined with the stored engineered rows, and the model is trained on all of them. The
+    transforms are refitted on all the accumulated rows only when `refit` is set, every
+    `refit_every` increments, or when FEATURE_TRANSFORMS or the precision change.
+
+    The watermark only advances once the model is built, so a failed run loses no rows.
+
+    `precision` is the floating-point precision, as for ml_pipeline.
+    """
+
+    # Work out the columns consumed downstream, so ingestion only parses those
+    ingest_columns = consumed_columns(
+        target_column="SalePrice",
+        features=transform_input_columns(FEATURE_TRANSFORMS + MODEL_TRANSFORMS),
+    )
+
+    # Incremental Ingestion Step
+    new_data, processed_parts, engineered_parts = incremental_ingestion_step(
+        file_path="data/archive.zip", cache_dir=".ingestion_cache", columns=ingest_columns
+    )
+
+    # Feature Engineering Step, on the new rows only unless the transforms are refitted.
+    # Missing values are imputed inside the model pipeline with fill values learned from
+    # the training split.
+    engineered_data, feature_engineer, raw_data, refitted = incremental_feature_engineering_step(
+        new_data,
+        processed_parts,
+        engineered_parts,
+        transforms=FEATURE_TRANSFORMS,
+        precision=precision,
+        refit=refit,
+        refit_every=refit_every,
+    )
+
+    # Outlier Detection Step
+    clean_data = outlier_detection_step(
+        engineered_data,
+        column_name="SalePrice",
+        keep_columns=transform_input_columns(MODEL_TRANSFORMS),
+    )
+
+    # Data Splitting Step
+    X_train, X_test, y_train, y_test = data_splitter_step(clean_data, target_column="SalePrice")
+
+    # Model Building Step, exporting the feature transforms together with the model
+    model = model_building_step(
+        X_train=X_train,
+        y_train=y_train,
+        feature_engineer=feature_engineer,
+        target_column="SalePrice",
+        precision=precision,
+        raw_data=raw_data,
+        model_transforms=MODEL_TRANSFORMS,
+    )
+
+    # Commit the new rows and advance the watermark, once the model is built
+    commit_increment_step(
+        new_data,
+        engineered_data,
+        feature_engineer,
+        refitted,
+        model,
+        transforms=FEATURE_TRANSFORMS,
+        precision=precision,
+    )
 
     # Model Evaluation Step
     evaluation_metrics, mse = model_evaluator_step(
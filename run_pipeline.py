@@ -1,15 +1,46 @@
 import click
-from pipelines.training_pipeline import ml_pipeline
+from pipelines.training_pipeline import incremental_ml_pipeline, ml_pipeline
+from src.execution_mode import PRECISIONS, enable_copy_on_write
 from zenml.integrations.mlflow.mlflow_utils import get_tracking_uri
 
 
 @click.command()
-def main():
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Only clean and transform sales past the stored watermark.",
+)
+@click.option(
+    "--refit",
+    is_flag=True,
+    default=False,
+    help="With --incremental, refit the feature transforms on all the accumulated sales.",
+)
+@click.option(
+    "--copy-on-write",
+    is_flag=True,
+    default=False,
+    help="Run every step with pandas copy-on-write instead of defensive deep copies.",
+)
+@click.option(
+    "--precision",
+    type=click.Choice(PRECISIONS),
+    default="float64",
+    help="The floating-point precision of feature matrices and model parameters.",
+)
+def main(incremental: bool, refit: bool, copy_on_write: bool, precision: str):
     """
     Run the ML pipeline and start the MLflow UI for experiment tracking.
     """
+    if copy_on_write:
+        enable_copy_on_write()
+
     # Run the pipeline
-    run = ml_pipeline()
+    if incremental:
+        run = incremental_ml_pipeline(precision=precision, refit=refit)
+    else:
+        run = ml_pipeline(precision=precision)
 
     # You can uncomment and customize the following lines if you want to retrieve and inspect the trained model:
     # trained_model = run["model_building_step"]  # Replace with actual step name if different
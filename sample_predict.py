@@ -1,6 +1,5 @@
 import mlflow
 import pandas as pd
-import numpy as np
 
 # Sample input data for prediction
 sample_data_dict = {
@@ -19,15 +18,8 @@ input_df_original = pd.DataFrame([sample_data_dict])
 def predict_locally_from_run():
     """Loads the latest model from the 'ml_pipeline' experiment run and predicts."""
     try:
-        # Create a copy for modification
-        input_df = input_df_original.copy()
+        input_df = input_df_original
 
-        # Apply the same log transformation to 'Gr Liv Area' as done during training
-        if 'Gr Liv Area' in input_df.columns:
-            print(f"Original 'Gr Liv Area': {input_df['Gr Liv Area'].iloc[0]}")
-            input_df['Gr Liv Area'] = np.log1p(input_df['Gr Liv Area'])
-            print(f"Log-transformed 'Gr Liv Area': {input_df['Gr Liv Area'].iloc[0]}")
-        
         # Use the tracking URI provided by ZenML's MLflow integration output
         # Ensure this path is correct for your environment
         mlflow.set_tracking_uri(r"file:C:\Users\babhi\AppData\Roaming\zenml\local_stores\b8276e3d-26f6-4f13-afb4-43b15f763144\mlruns")
@@ -60,16 +52,19 @@ def predict_locally_from_run():
         loaded_model = mlflow.pyfunc.load_model(model_uri)
         print("Model loaded successfully.")
 
-        print("\nInput DataFrame for prediction (after Gr Liv Area transformation):")
+        # Cast each column to the dtype recorded in the model's input signature, since
+        # the signature declares area columns as float64 but the sample data has ints
+        input_schema = loaded_model.metadata.get_input_schema()
+        if input_schema is not None:
+            dtypes = dict(zip(input_schema.input_names(), input_schema.numpy_types()))
+            input_df = input_df.astype({col: dtype for col, dtype in dtypes.items() if col in input_df})
+
+        print("\nInput DataFrame for prediction:")
         print(input_df)
-        
-        prediction = loaded_model.predict(input_df)
-        
-        # The feature_engineering_step used np.log1p for SalePrice, so inverse is np.expm1
-        actual_prediction = np.expm1(prediction)
 
-        print(f"\nRaw Prediction (log1p scale): {prediction[0]}")
-        print(f"Predicted Sale Price (after inverse transformation): {actual_prediction[0]}")
+        # The model applies the feature transforms and the inverse target transform itself
+        prediction = loaded_model.predict(input_df)
+        print(f"\nPredicted Sale Price: {prediction[0]}")
 
     except Exception as e:
         print(f"An error occurred: {e}")
@@ -0,0 +1,83 @@
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+# Setup logging configuration
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Copy-on-Write Execution Mode
+# ----------------------------
+# Every strategy returns a new frame and leaves its input untouched. By default that means a
+# deep copy of the whole frame before the first column is changed, so a pipeline briefly holds
+# several full copies of the data. With pandas copy-on-write enabled, a copy shares its memory
+# with the original and a column block is only copied when it is written to, so strategies
+# that change a few columns no longer duplicate the rest. Results are identical in both modes.
+
+# Read by pandas at import time, so processes started by the pipeline inherit the mode
+COPY_ON_WRITE_ENV = "PANDAS_COPY_ON_WRITE"
+
+
+def enable_copy_on_write(enabled: bool = True):
+    """
+    Switches pandas copy-on-write on or off for this process and the processes it starts.
+
+    Parameters:
+    enabled (bool): Whether copy-on-write should be enabled.
+    """
+    pd.set_option("mode.copy_on_write", enabled)
+    os.environ[COPY_ON_WRITE_ENV] = "1" if enabled else "0"
+    logging.info(f"pandas copy-on-write {'enabled' if enabled else 'disabled'}.")
+
+
+def copy_on_write_enabled() -> bool:
+    """Returns whether pandas copy-on-write is enabled."""
+    return bool(pd.get_option("mode.copy_on_write"))
+
+
+def working_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of the DataFrame that a strategy can modify without changing its input.
+
+    Under copy-on-write this is a shallow copy and pandas copies only the blocks that are
+    later modified; otherwise it is a deep copy.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame to copy.
+
+    Returns:
+    pd.DataFrame: The copy.
+    """
+    return df.copy(deep=not copy_on_write_enabled())
+
+
+# Floating-Point Precision
+# ------------------------
+# The precision of the feature matrices and model parameters. Float32 halves the memory
+# and memory traffic of every numeric array, at a relative precision of about 1e-7 instead
+# of 1e-16, which is far below the noise in house prices. The precision is read when a
+# strategy, imputer or model is fitted and kept with it, so an exported model computes in
+# the precision it was trained in, whatever the serving process is set to.
+
+# Kept in the environment, so processes started by the pipeline inherit the precision
+PRECISION_ENV = "PRICES_PREDICTOR_PRECISION"
+PRECISIONS = ("float64", "float32")
+
+
+def set_precision(precision: str = "float64"):
+    """
+    Sets the floating-point precision for this process and the processes it starts.
+
+    Parameters:
+    precision (str): Either "float64" or "float32".
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unsupported precision: {precision}. Choose from {PRECISIONS}.")
+    os.environ[PRECISION_ENV] = precision
+    logging.info(f"Floating-point precision set to {precision}.")
+
+
+def float_dtype() -> np.dtype:
+    """Returns the floating-point dtype of the configured precision, float64 by default."""
+    return np.dtype(os.environ.get(PRECISION_ENV, "float64"))
@@ -1,9 +1,14 @@
+import hashlib
 import logging
 from abc import ABC, abstractmethod
 
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler, OneHotEncoder, StandardScaler
+import scipy.sparse as sp
+from sklearn.base import BaseEstimator, RegressorMixin, TransformerMixin, clone
+from sklearn.preprocessing import OneHotEncoder
+from src.execution_mode import float_dtype, working_copy
+from src.feature_expressions import AMES_DERIVED_FEATURES, ExpressionGraph
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -11,12 +16,29 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 # Abstract Base Class for Feature Engineering Strategy
 # ----------------------------------------------------
 # This class defines a common interface for different feature engineering strategies.
-# Subclasses must implement the apply_transformation method.
+# Subclasses learn what they need in fit, apply it in transform and undo it in
+# inverse_transform, so a fitted strategy can be reapplied to new data at inference time.
 class FeatureEngineeringStrategy(ABC):
+    # Strategies that transform each feature column on its own numeric values can be fused
+    # into a single pass over a NumPy buffer by FeatureEngineer. Others run on the DataFrame.
+    fusable = False
+
+    def fit(self, df: pd.DataFrame):
+        """
+        Learns the parameters of the transformation. Stateless strategies learn nothing.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to learn from.
+
+        Returns:
+        FeatureEngineeringStrategy: The fitted strategy.
+        """
+        return self
+
     @abstractmethod
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Abstract method to apply feature engineering transformation to the DataFrame.
+        Abstract method to apply the fitted transformation to the DataFrame.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
@@ -26,75 +48,179 @@ class FeatureEngineeringStrategy(ABC):
         """
         pass
 
+    @abstractmethod
+    def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Abstract method to undo the fitted transformation.
 
-# Concrete Strategy for Log Transformation
-# ----------------------------------------
-# This strategy applies a logarithmic transformation to skewed features to normalize the distribution.
-class LogTransformation(FeatureEngineeringStrategy):
-    def __init__(self, features):
+        Parameters:
+        df (pd.DataFrame): The dataframe containing transformed features.
+
+        Returns:
+        pd.DataFrame: A dataframe with the features on their original scale.
+        """
+        pass
+
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Initializes the LogTransformation with the specific features to transform.
+        Fits the transformation to the DataFrame and transforms that same DataFrame.
+
+        Strategies whose fitted transform would leak information about the rows they were
+        fitted on, such as target encoding, override this to transform those rows differently.
 
         Parameters:
-        features (list): The list of features to apply the log transformation to.
+        df (pd.DataFrame): The dataframe to learn from and transform.
+
+        Returns:
+        pd.DataFrame: A dataframe with the applied transformations.
         """
-        self.features = features
+        return self.fit(df).transform(df)
 
     def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Applies a log transformation to the specified features in the DataFrame.
+        Fits the transformation to the DataFrame and applies it.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
 
         Returns:
-        pd.DataFrame: The dataframe with log-transformed features.
+        pd.DataFrame: A dataframe with the applied transformations.
         """
-        logging.info(f"Applying log transformation to features: {self.features}")
-        df_transformed = df.copy()
-        for feature in self.features:
-            df_transformed[feature] = np.log1p(
-                df[feature]
-            )  # log1p handles log(0) by calculating log(1+x)
-        logging.info("Log transformation completed.")
+        logging.info(f"Applying {type(self).__name__} to features: {self.features}")
+        df_transformed = self.fit_transform(df)
+        logging.info(f"{type(self).__name__} completed.")
         return df_transformed
 
 
-# Concrete Strategy for Standard Scaling
-# --------------------------------------
-# This strategy applies standard scaling (z-score normalization) to features, centering them around zero with unit variance.
-class StandardScaling(FeatureEngineeringStrategy):
+# Base Class for Column-wise Numeric Strategies
+# ---------------------------------------------
+# These strategies work on a float array with one column per feature, in the precision
+# configured when they are fitted. The DataFrame methods are built on the array methods, and
+# FeatureEngineer calls the array methods directly on its fused buffer. Fitted parameters are
+# stored per feature, in the precision of the values they were fitted on, so any subset of
+# the features, such as the inputs without the target at serving time, can be transformed on
+# its own.
+class ColumnwiseTransformation(FeatureEngineeringStrategy):
+    fusable = True
+
     def __init__(self, features):
         """
-        Initializes the StandardScaling with the specific features to scale.
+        Initializes the strategy with the specific features to transform.
 
         Parameters:
-        features (list): The list of features to apply the standard scaling to.
+        features (list): The list of features to transform.
         """
         self.features = features
-        self.scaler = StandardScaler()
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def fit_values(self, values: np.ndarray, features: list):
+        """Learns the per-feature parameters from the values. Stateless strategies learn nothing."""
+        return self
+
+    @abstractmethod
+    def transform_values(self, values: np.ndarray, features: list) -> np.ndarray:
         """
-        Applies standard scaling to the specified features in the DataFrame.
+        Applies the transformation to the values of some of the strategy's features.
 
         Parameters:
-        df (pd.DataFrame): The dataframe containing features to transform.
+        values (np.ndarray): A float array with one column per feature. It may be modified
+            in place.
+        features (list): The features held by the columns of values.
 
         Returns:
-        pd.DataFrame: The dataframe with scaled features.
+        np.ndarray: The transformed values.
         """
-        logging.info(f"Applying standard scaling to features: {self.features}")
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
-        logging.info("Standard scaling completed.")
+        pass
+
+    @abstractmethod
+    def inverse_values(self, values: np.ndarray, features: list) -> np.ndarray:
+        """Undoes the transformation on the values of some of the strategy's features."""
+        pass
+
+    def _present(self, df: pd.DataFrame) -> list:
+        """Returns the strategy's features that are present in the DataFrame."""
+        return [feature for feature in self.features if feature in df.columns]
+
+    def fit(self, df: pd.DataFrame):
+        """Learns the per-feature parameters from the DataFrame, in the configured precision."""
+        self.dtype_ = float_dtype()
+        self.fit_values(df[self.features].to_numpy(dtype=self.dtype_), self.features)
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Transforms the features present in the DataFrame, as float columns."""
+        features = self._present(df)
+        df_transformed = working_copy(df)
+        df_transformed[features] = self.transform_values(
+            df[features].to_numpy(dtype=_fitted_dtype(self), copy=True), features
+        )
         return df_transformed
 
+    def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Restores the features present in the DataFrame to their original scale."""
+        features = self._present(df)
+        df_restored = working_copy(df)
+        df_restored[features] = self.inverse_values(
+            df[features].to_numpy(dtype=_fitted_dtype(self), copy=True), features
+        )
+        return df_restored
+
+
+# Concrete Strategy for Log Transformation
+# ----------------------------------------
+# This strategy applies a logarithmic transformation to skewed features to normalize the distribution.
+class LogTransformation(ColumnwiseTransformation):
+    def transform_values(self, values: np.ndarray, features: list) -> np.ndarray:
+        """Applies log1p to the values in place; log1p handles log(0) by calculating log(1+x)."""
+        return np.log1p(values, out=values)
+
+    def inverse_values(self, values: np.ndarray, features: list) -> np.ndarray:
+        """Applies expm1 to the values in place."""
+        return np.expm1(values, out=values)
+
+
+# Concrete Strategy for Standard Scaling
+# --------------------------------------
+# This strategy applies standard scaling (z-score normalization) to features, centering them around zero with unit variance.
+class StandardScaling(ColumnwiseTransformation):
+    def __init__(self, features):
+        """
+        Initializes the StandardScaling with the specific features to scale.
+
+        Parameters:
+        features (list): The list of features to apply the standard scaling to.
+        """
+        super().__init__(features)
+        self.mean_ = None
+        self.scale_ = None
+
+    def fit_values(self, values: np.ndarray, features: list):
+        """Learns the mean and standard deviation of each feature, ignoring missing values."""
+        # Accumulated in float64 and stored in the precision of the values
+        mean = np.nanmean(values, axis=0, dtype=np.float64)
+        scale = np.nanstd(values, axis=0, dtype=np.float64)
+        # Constant features are centred but not scaled
+        self.mean_ = pd.Series(mean.astype(values.dtype), index=features)
+        scale = np.where(scale > 0, scale, 1.0)
+        self.scale_ = pd.Series(scale.astype(values.dtype), index=features)
+        return self
+
+    def transform_values(self, values: np.ndarray, features: list) -> np.ndarray:
+        """Standardises the values in place."""
+        values -= self.mean_[features].to_numpy()
+        values /= self.scale_[features].to_numpy()
+        return values
+
+    def inverse_values(self, values: np.ndarray, features: list) -> np.ndarray:
+        """Restores standardised values in place."""
+        values *= self.scale_[features].to_numpy()
+        values += self.mean_[features].to_numpy()
+        return values
+
 
 # Concrete Strategy for Min-Max Scaling
 # -------------------------------------
 # This strategy applies Min-Max scaling to features, scaling them to a specified range, typically [0, 1].
-class MinMaxScaling(FeatureEngineeringStrategy):
+class MinMaxScaling(ColumnwiseTransformation):
     def __init__(self, features, feature_range=(0, 1)):
         """
         Initializes the MinMaxScaling with the specific features to scale and the target range.
@@ -103,45 +229,65 @@ class MinMaxScaling(FeatureEngineeringStrategy):
         features (list): The list of features to apply the Min-Max scaling to.
         feature_range (tuple): The target range for scaling, default is (0, 1).
         """
-        self.features = features
-        self.scaler = MinMaxScaler(feature_range=feature_range)
+        super().__init__(features)
+        self.feature_range = feature_range
+        self.scale_ = None
+        self.min_ = None
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Applies Min-Max scaling to the specified features in the DataFrame.
+    def fit_values(self, values: np.ndarray, features: list):
+        """Learns the minimum and maximum of each feature, ignoring missing values."""
+        low, high = self.feature_range
+        data_min = np.nanmin(values, axis=0).astype(np.float64)
+        data_range = np.nanmax(values, axis=0) - data_min
+        # Constant features are shifted to the bottom of the range but not scaled
+        scale = (high - low) / np.where(data_range > 0, data_range, 1.0)
+        self.scale_ = pd.Series(scale.astype(values.dtype), index=features)
+        self.min_ = pd.Series((low - data_min * scale).astype(values.dtype), index=features)
+        return self
 
-        Parameters:
-        df (pd.DataFrame): The dataframe containing features to transform.
+    def transform_values(self, values: np.ndarray, features: list) -> np.ndarray:
+        """Scales the values to the feature range in place."""
+        values *= self.scale_[features].to_numpy()
+        values += self.min_[features].to_numpy()
+        return values
 
-        Returns:
-        pd.DataFrame: The dataframe with Min-Max scaled features.
-        """
-        logging.info(
-            f"Applying Min-Max scaling to features: {self.features} with range {self.scaler.feature_range}"
-        )
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
-        logging.info("Min-Max scaling completed.")
-        return df_transformed
+    def inverse_values(self, values: np.ndarray, features: list) -> np.ndarray:
+        """Restores scaled values in place."""
+        values -= self.min_[features].to_numpy()
+        values /= self.scale_[features].to_numpy()
+        return values
 
 
 # Concrete Strategy for One-Hot Encoding
 # --------------------------------------
 # This strategy applies one-hot encoding to categorical features, converting them into binary vectors.
 class OneHotEncoding(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    def __init__(self, features, sparse: bool = False):
         """
         Initializes the OneHotEncoding with the specific features to encode.
 
         Parameters:
         features (list): The list of categorical features to apply the one-hot encoding to.
+        sparse (bool): Whether to keep the encoded columns sparse. Each row stores only its
+            non-zero entries instead of one value per category, which matters for features
+            with many categories.
         """
         self.features = features
-        self.encoder = OneHotEncoder(sparse=False, drop="first")
+        self.sparse = sparse
+        self.encoder = OneHotEncoder(sparse_output=sparse, drop="first", handle_unknown="ignore")
 
-    def apply_transformation(self, df: pd.DataFrame) -> pd.DataFrame:
+    def fit(self, df: pd.DataFrame):
+        """Learns the categories of each feature, encoding them in the configured precision."""
+        self.encoder.set_params(dtype=float_dtype())
+        self.encoder.fit(df[self.features])
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Applies one-hot encoding to the specified categorical features in the DataFrame.
+        Replaces the categorical features with their one-hot encoded columns.
+
+        Sparse encodings become SparseDtype columns built straight from the CSR matrix, and
+        pandas concatenates them without densifying.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
@@ -149,44 +295,778 @@ class OneHotEncoding(FeatureEngineeringStrategy):
         Returns:
         pd.DataFrame: The dataframe with one-hot encoded features.
         """
-        logging.info(f"Applying one-hot encoding to features: {self.features}")
-        df_transformed = df.copy()
-        encoded_df = pd.DataFrame(
-            self.encoder.fit_transform(df[self.features]),
-            columns=self.encoder.get_feature_names_out(self.features),
+        encoded = self.encoder.transform(df[self.features])
+        columns = self.encoder.get_feature_names_out(self.features)
+        if self.sparse:
+            encoded_df = pd.DataFrame.sparse.from_spmatrix(encoded, columns=columns)
+        else:
+            encoded_df = pd.DataFrame(encoded, columns=columns)
+        # drop already returns a new frame, so the input needs no defensive copy
+        df_transformed = df.drop(columns=self.features).reset_index(drop=True)
+        return pd.concat([df_transformed, encoded_df], axis=1)
+
+    def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces the one-hot encoded columns with the categorical features they encode.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing one-hot encoded columns.
+
+        Returns:
+        pd.DataFrame: The dataframe with the categorical features restored.
+        """
+        encoded_columns = list(self.encoder.get_feature_names_out(self.features))
+        if not set(encoded_columns).issubset(df.columns):
+            return df
+        encoded = df[encoded_columns]
+        if all(isinstance(dtype, pd.SparseDtype) for dtype in encoded.dtypes):
+            encoded = encoded.sparse.to_coo().tocsr()
+        else:
+            encoded = encoded.to_numpy()
+        decoded_df = pd.DataFrame(
+            self.encoder.inverse_transform(encoded),
+            columns=self.features,
+            index=df.index,
+        )
+        return pd.concat([df.drop(columns=encoded_columns), decoded_df], axis=1)
+
+
+# Concrete Strategy for Feature Hashing
+# -------------------------------------
+# This strategy encodes categorical features with the hashing trick: each value is hashed
+# into one of a fixed number of columns per feature, with a hashed sign so that collisions
+# tend to cancel out. There is no vocabulary to learn or store, the output width never
+# grows with the data and values unseen in training still get a column.
+class FeatureHashingEncoding(FeatureEngineeringStrategy):
+    def __init__(
+        self,
+        features,
+        n_features: int = 64,
+        alternate_sign: bool = True,
+        salt: str = "",
+        sparse: bool = False,
+    ):
+        """
+        Initializes the FeatureHashingEncoding with the specific features to encode.
+
+        Parameters:
+        features (list): The list of categorical features to hash.
+        n_features (int): The number of hashed columns per feature.
+        alternate_sign (bool): Whether each value gets a hashed sign of +1 or -1 instead of 1.
+        salt (str): Mixed into the hash, so a different salt gives different collisions.
+        sparse (bool): Whether to keep the hashed columns sparse.
+        """
+        self.features = features
+        self.n_features = n_features
+        self.alternate_sign = alternate_sign
+        self.salt = salt
+        self.sparse = sparse
+
+    def get_feature_names_out(self) -> list:
+        """Returns the names of the hashed columns, n_features per feature."""
+        return [
+            f"{feature}_hash_{bucket}"
+            for feature in self.features
+            for bucket in range(self.n_features)
+        ]
+
+    def fit(self, df: pd.DataFrame):
+        """Learns nothing but the configured precision of the hashed columns."""
+        self.dtype_ = float_dtype()
+        return self
+
+    def _hash_key(self, feature: str) -> str:
+        """Derives the 16-character hash key of a feature, so each feature hashes differently."""
+        return hashlib.md5(f"{self.salt}{feature}".encode("utf8")).hexdigest()[:16]
+
+    def _hash_column(self, column: pd.Series, feature: str) -> tuple:
+        """
+        Hashes a column to a bucket and a sign per row.
+
+        The column is factorized first, so only its distinct values are hashed. They are
+        hashed as strings, with integral floats written as integers, so a value hashes the
+        same whether it arrives as text, an integer or a float.
+
+        Returns:
+        tuple: The row positions of the non-missing values, their buckets and their signs.
+        """
+        codes, uniques = pd.factorize(column)
+        uniques = np.asarray(uniques)
+        if uniques.dtype.kind == "f" and np.all(np.mod(uniques, 1) == 0):
+            uniques = uniques.astype(np.int64)
+        hashes = pd.util.hash_array(
+            uniques.astype(str).astype(object), hash_key=self._hash_key(feature), categorize=False
         )
-        df_transformed = df_transformed.drop(columns=self.features).reset_index(drop=True)
-        df_transformed = pd.concat([df_transformed, encoded_df], axis=1)
-        logging.info("One-hot encoding completed.")
+
+        buckets = (hashes % np.uint64(self.n_features)).astype(np.int64)
+        if self.alternate_sign:
+            signs = np.where(hashes >> np.uint64(63), -1.0, 1.0)
+        else:
+            signs = np.ones(len(hashes))
+        # Missing values are factorized to -1 and leave their row empty
+        rows = np.flatnonzero(codes >= 0)
+        codes = codes[rows]
+        return rows, buckets[codes], signs[codes]
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces the categorical features with their hashed columns.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+
+        Returns:
+        pd.DataFrame: The dataframe with hashed features.
+        """
+        n_rows = len(df)
+        width = len(self.features) * self.n_features
+        rows, columns, signs = [np.empty(0, np.int64)], [np.empty(0, np.int64)], [np.empty(0)]
+        for position, feature in enumerate(self.features):
+            feature_rows, buckets, feature_signs = self._hash_column(df[feature], feature)
+            rows.append(feature_rows)
+            columns.append(buckets + position * self.n_features)
+            signs.append(feature_signs)
+        rows, columns, signs = (np.concatenate(parts) for parts in (rows, columns, signs))
+        signs = signs.astype(_fitted_dtype(self))
+
+        if self.sparse:
+            hashed = sp.csr_matrix((signs, (rows, columns)), shape=(n_rows, width))
+            hashed_df = pd.DataFrame.sparse.from_spmatrix(
+                hashed, columns=self.get_feature_names_out()
+            )
+        else:
+            hashed = np.zeros((n_rows, width), dtype=signs.dtype)
+            hashed[rows, columns] = signs
+            hashed_df = pd.DataFrame(hashed, columns=self.get_feature_names_out())
+        # drop already returns a new frame, so the input needs no defensive copy
+        df_transformed = df.drop(columns=self.features).reset_index(drop=True)
+        return pd.concat([df_transformed, hashed_df], axis=1)
+
+    def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Hashing cannot be undone, so a ValueError is raised for frames with hashed columns.
+        Frames without them, such as predictions of the target, are returned unchanged.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to restore.
+
+        Returns:
+        pd.DataFrame: The unchanged dataframe.
+        """
+        if set(self.get_feature_names_out()).isdisjoint(df.columns):
+            return df
+        raise ValueError("Hashed features cannot be mapped back to their categories.")
+
+
+# Concrete Strategy for Target Encoding
+# -------------------------------------
+# This strategy replaces each categorical feature with the smoothed mean of the target over
+# the rows sharing its category: (sum + smoothing * prior) / (count + smoothing), where the
+# prior is the overall mean, so rare categories are pulled towards it. The fitted encodings
+# are kept as one lookup array per feature, with the prior in the last slot for categories
+# unseen in training or missing.
+#
+# Encoding the training rows with statistics that include their own targets would leak the
+# target into the features. fit_transform therefore cross-fits: the rows are split into K
+# folds and each fold is encoded with statistics from the other folds only. The per-fold
+# sums and counts of every category come from a single bincount, and the statistics of the
+# other folds are the totals minus the fold's own.
+class TargetEncoding(FeatureEngineeringStrategy):
+    def __init__(
+        self,
+        features,
+        target_column: str,
+        n_splits: int = 5,
+        smoothing: float = 10.0,
+        seed: int = 42,
+    ):
+        """
+        Initializes the TargetEncoding with the specific features to encode.
+
+        Parameters:
+        features (list): The list of categorical features to encode.
+        target_column (str): The name of the target column to average.
+        n_splits (int): The number of cross-fitting folds.
+        smoothing (float): The weight of the prior, in rows.
+        seed (int): The seed of the random fold assignment.
+        """
+        self.features = features
+        self.target_column = target_column
+        self.n_splits = n_splits
+        self.smoothing = smoothing
+        self.seed = seed
+
+    def _statistics(self, df: pd.DataFrame) -> tuple:
+        """
+        Learns the categories of each feature and prepares the target.
+
+        Returns:
+        tuple: The target values, whether each is present, and each feature's category codes.
+        """
+        self.dtype_ = float_dtype()
+        target = df[self.target_column].to_numpy(dtype=np.float64)
+        present = ~np.isnan(target)
+        self.categories_, codes = {}, {}
+        for feature in self.features:
+            feature_codes, categories = pd.factorize(df[feature])
+            self.categories_[feature] = pd.Index(categories)
+            codes[feature] = feature_codes
+        return target, present, codes
+
+    def _lookup(self, sums: np.ndarray, counts: np.ndarray, prior) -> np.ndarray:
+        """
+        Returns the smoothed category means, followed by the prior for unseen categories.
+        Given one row of sums and counts per fold and one prior per fold, returns a lookup
+        row per fold.
+        """
+        prior = np.asarray(prior, dtype=np.float64)[..., np.newaxis]
+        encodings = (sums + self.smoothing * prior) / (counts + self.smoothing)
+        return np.concatenate((encodings, prior), axis=-1).astype(self.dtype_)
+
+    def fit(self, df: pd.DataFrame):
+        """Learns the smoothed target mean of every category from all rows."""
+        target, present, codes = self._statistics(df)
+        prior = target[present].mean()
+        self.lookups_ = {}
+        for feature in self.features:
+            known = present & (codes[feature] >= 0)
+            n_categories = len(self.categories_[feature])
+            sums = np.bincount(codes[feature][known], target[known], minlength=n_categories)
+            counts = np.bincount(codes[feature][known], minlength=n_categories)
+            self.lookups_[feature] = self._lookup(sums, counts, prior)
+        return self
+
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fits the encodings on all rows and encodes each row out of fold.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to learn from and transform.
+
+        Returns:
+        pd.DataFrame: The dataframe with the features replaced by their cross-fitted encodings.
+        """
+        target, present, codes = self._statistics(df)
+        rng = np.random.default_rng(self.seed)
+        folds = rng.permutation(len(df)) % self.n_splits
+
+        # The target sum and row count of each fold, and the prior of the rows outside it
+        fold_sums = np.bincount(folds[present], target[present], minlength=self.n_splits)
+        fold_counts = np.bincount(folds[present], minlength=self.n_splits)
+        prior = fold_sums.sum() / fold_counts.sum()
+        fold_priors = (fold_sums.sum() - fold_sums) / (fold_counts.sum() - fold_counts)
+
+        self.lookups_ = {}
+        df_transformed = working_copy(df)
+        for feature in self.features:
+            feature_codes = codes[feature]
+            n_categories = len(self.categories_[feature])
+            known = present & (feature_codes >= 0)
+            # One bincount over (fold, category) pairs gives every fold's statistics at once
+            pairs = folds[known] * n_categories + feature_codes[known]
+            size = self.n_splits * n_categories
+            sums = np.bincount(pairs, target[known], minlength=size)
+            counts = np.bincount(pairs, minlength=size)
+            sums = sums.reshape(self.n_splits, n_categories)
+            counts = counts.reshape(self.n_splits, n_categories)
+            total_sums, total_counts = sums.sum(axis=0), counts.sum(axis=0)
+
+            self.lookups_[feature] = self._lookup(total_sums, total_counts, prior)
+            fold_lookups = self._lookup(total_sums - sums, total_counts - counts, fold_priors)
+            # Missing values have code -1 and pick up their fold's prior from the last slot
+            df_transformed[feature] = fold_lookups[folds, feature_codes]
+        return df_transformed
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replaces each feature with the fitted encoding of its category.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+
+        Returns:
+        pd.DataFrame: The dataframe with the features replaced by their encodings.
+        """
+        df_transformed = working_copy(df)
+        for feature in self.features:
+            # Unseen and missing categories are not found and pick up the prior at index -1
+            codes = self.categories_[feature].get_indexer(df[feature])
+            df_transformed[feature] = self.lookups_[feature][codes]
         return df_transformed
 
+    def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Maps each encoded value back to the category with the nearest fitted encoding.
+
+        This is exact for values produced by transform. Cross-fitted training values are
+        mapped to the category whose encoding they are closest to.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing encoded features.
+
+        Returns:
+        pd.DataFrame: The dataframe with the categorical features restored.
+        """
+        features = [feature for feature in self.features if feature in df.columns]
+        if not features:
+            return df
+        df_restored = working_copy(df)
+        for feature in features:
+            encodings = self.lookups_[feature][:-1]
+            order = np.argsort(encodings)
+            sorted_encodings = encodings[order]
+            values = df[feature].to_numpy(dtype=np.float64)
+            # The nearest of the two sorted encodings around each value
+            right = np.clip(np.searchsorted(sorted_encodings, values), 1, len(order) - 1)
+            left = right - 1
+            nearest = np.where(
+                np.abs(values - sorted_encodings[left]) <= np.abs(sorted_encodings[right] - values),
+                left,
+                right,
+            )
+            df_restored[feature] = self.categories_[feature][order[nearest]]
+        return df_restored
+
+
+# Concrete Strategy for Derived Features
+# --------------------------------------
+# This strategy adds features computed from other columns by declarative expressions, such
+# as "`Yr Sold` - `Year Built`". The expressions are compiled into one ExpressionGraph, so a
+# subexpression shared by several features is computed once per transform, as vectorized
+# column arithmetic, and its intermediate column is dropped as soon as it is no longer needed.
+class DerivedFeatures(FeatureEngineeringStrategy):
+    def __init__(self, features=None, expressions: dict = None):
+        """
+        Initializes the DerivedFeatures with the features to add.
+
+        Parameters:
+        features (list): The names of the derived features to add. Defaults to all of them.
+        expressions (dict): The expression of each derived feature by name. Defaults to
+            AMES_DERIVED_FEATURES.
+        """
+        expressions = AMES_DERIVED_FEATURES if expressions is None else expressions
+        features = list(expressions) if features is None else list(features)
+        unknown = [feature for feature in features if feature not in expressions]
+        if unknown:
+            raise ValueError(f"No expression is defined for the derived features: {unknown}")
+        self.features = features
+        self.expressions = {feature: expressions[feature] for feature in features}
+
+        self._graph = ExpressionGraph()
+        self._roots = {feature: self._graph.add(self.expressions[feature]) for feature in features}
+        n_operations = self._graph.operations(list(self._roots.values()))
+        logging.info(
+            f"Compiled {len(features)} derived features into {n_operations} distinct operations."
+        )
+
+    def input_columns(self) -> list:
+        """Returns the names of the columns the expressions read, sorted."""
+        return sorted(self._graph.columns(list(self._roots.values())))
+
+    def fit(self, df: pd.DataFrame):
+        """Checks that every input column is present and records the configured precision."""
+        missing = [column for column in self.input_columns() if column not in df.columns]
+        if missing:
+            raise ValueError(f"Derived features need the missing columns: {missing}")
+        self.dtype_ = float_dtype()
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adds the derived features, replacing any existing columns of the same names.
+        Features whose inputs are not all present, as in a frame of the target only, are
+        skipped.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing the input columns.
+
+        Returns:
+        pd.DataFrame: The dataframe with the derived features added.
+        """
+        roots = {
+            feature: node
+            for feature, node in self._roots.items()
+            if self._graph.columns([node]).issubset(df.columns)
+        }
+        if not roots:
+            return df
+        dtype = _fitted_dtype(self)
+
+        def read_column(column):
+            return df[column].to_numpy(dtype=dtype, na_value=np.nan)
+
+        values = self._graph.evaluate(read_column, list(roots.values()), len(df), dtype)
+        # Roots may share an array, so each feature gets its own copy
+        derived = pd.DataFrame(
+            {feature: values[node].copy() for feature, node in roots.items()}, index=df.index
+        )
+        # drop already returns a new frame, so the input needs no defensive copy
+        df_transformed = df.drop(columns=[feature for feature in roots if feature in df.columns])
+        return pd.concat([df_transformed, derived], axis=1)
+
+    def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Removes the derived features. Their inputs are left in the frame by transform, so
+        nothing else needs restoring.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing derived features.
+
+        Returns:
+        pd.DataFrame: The dataframe without the derived features.
+        """
+        derived = [feature for feature in self.features if feature in df.columns]
+        if not derived:
+            return df
+        return df.drop(columns=derived)
+
+
+# Concrete Strategy for Interaction Features
+# ------------------------------------------
+# This strategy adds degree-2 polynomial features: products of pairs of numeric features
+# and, optionally, their squares. A full expansion of m features has m(m+1)/2 columns, so
+# only as many as fit in a memory budget are kept, chosen by a cheap screen on a subsample
+# of the rows: each candidate product is scored by its absolute correlation with the part
+# of the target that a linear model on the features alone leaves unexplained.
+#
+# The output columns are written into a single preallocated array, a block of rows at a
+# time, so the temporaries of the products never exceed one block.
+class InteractionFeatures(FeatureEngineeringStrategy):
+    def __init__(
+        self,
+        features,
+        target_column: str,
+        memory_budget_mb: float = 64.0,
+        max_interactions: int = None,
+        include_squares: bool = True,
+        screening_rows: int = 5000,
+        block_rows: int = 4096,
+        seed: int = 42,
+    ):
+        """
+        Initializes the InteractionFeatures with the features to combine.
+
+        Parameters:
+        features (list): The numeric features to combine. Defaults to every numeric column
+            but the target.
+        target_column (str): The name of the target column to screen the candidates against.
+        memory_budget_mb (float): The memory the interaction columns of the fitted rows may
+            take, in megabytes.
+        max_interactions (int): An optional further limit on the number of interactions.
+        include_squares (bool): Whether the square of each feature is a candidate too.
+        screening_rows (int): The number of sampled rows the candidates are scored on.
+        block_rows (int): The number of rows computed at a time.
+        seed (int): The seed of the row sample.
+        """
+        self.features = features
+        self.target_column = target_column
+        self.memory_budget_mb = memory_budget_mb
+        self.max_interactions = max_interactions
+        self.include_squares = include_squares
+        self.screening_rows = screening_rows
+        self.block_rows = block_rows
+        self.seed = seed
+
+    @staticmethod
+    def _name(left: str, right: str) -> str:
+        """Returns the column name of the product of two features."""
+        return f"{left}^2" if left == right else f"{left} x {right}"
+
+    def _screen(self, df: pd.DataFrame, features: list) -> tuple:
+        """
+        Scores every candidate pair on a sample of the rows.
+
+        Returns:
+        tuple: The left and right feature positions of the candidates and their scores.
+        """
+        target = df[self.target_column].to_numpy(dtype=np.float64)
+        rows = np.flatnonzero(~np.isnan(target))
+        if len(rows) == 0:
+            raise ValueError(
+                f"Interactions cannot be screened without values of '{self.target_column}'."
+            )
+        if len(rows) > self.screening_rows:
+            rng = np.random.default_rng(self.seed)
+            rows = np.sort(rng.choice(rows, self.screening_rows, replace=False))
+        target = target[rows]
+
+        # Standardized features, with missing values at the mean
+        values = df[features].to_numpy(dtype=np.float64, na_value=np.nan)[rows]
+        means = np.nanmean(values, axis=0)
+        values = np.where(np.isnan(values), means, values) - means
+        scales = values.std(axis=0)
+        values = np.divide(values, scales, out=np.zeros_like(values), where=scales > 0)
+
+        # The part of the target the features explain linearly is removed first
+        design = np.column_stack((np.ones(len(rows)), values))
+        residual = target - design @ np.linalg.lstsq(design, target, rcond=None)[0]
+        residual_norm = np.linalg.norm(residual)
+
+        left, right = np.triu_indices(len(features), k=0 if self.include_squares else 1)
+        scores = np.empty(len(left))
+        # Candidates are scored a block at a time, so the sampled products stay small
+        step = max(1, self.block_rows * 64 // len(rows))
+        for start in range(0, len(left), step):
+            stop = start + step
+            products = values[:, left[start:stop]] * values[:, right[start:stop]]
+            products -= products.mean(axis=0)
+            norms = np.linalg.norm(products, axis=0) * residual_norm
+            scores[start:stop] = np.divide(
+                np.abs(residual @ products), norms, out=np.zeros(len(norms)), where=norms > 0
+            )
+        return left, right, scores
+
+    def fit(self, df: pd.DataFrame):
+        """Selects the best-scoring interactions that fit in the memory budget."""
+        self.dtype_ = float_dtype()
+        features = self.features
+        if features is None:
+            features = [
+                column
+                for column in df.select_dtypes(include="number").columns
+                if column != self.target_column
+            ]
+
+        # The budget caps the number of interaction columns of the fitted rows
+        column_bytes = max(len(df), 1) * self.dtype_.itemsize
+        budget = int(self.memory_budget_mb * 1e6 // column_bytes)
+        if self.max_interactions is not None:
+            budget = min(budget, self.max_interactions)
+
+        left, right, scores = self._screen(df, features)
+        # Stable sort, so ties keep the order of the features
+        best = np.argsort(-scores, kind="stable")[:budget]
+        self.interactions_ = [(features[left[i]], features[right[i]]) for i in best]
+        logging.info(
+            f"Selected {len(self.interactions_)} of {len(scores)} candidate interactions "
+            f"within {self.memory_budget_mb} MB."
+        )
+        return self
+
+    def get_feature_names_out(self) -> list:
+        """Returns the names of the selected interaction columns."""
+        return [self._name(left, right) for left, right in self.interactions_]
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adds the selected interactions, replacing any existing columns of the same names.
+        Interactions whose features are not both present, as in a frame of the target only,
+        are skipped.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing the features.
+
+        Returns:
+        pd.DataFrame: The dataframe with the interaction columns added.
+        """
+        interactions = [
+            (left, right)
+            for left, right in self.interactions_
+            if left in df.columns and right in df.columns
+        ]
+        if not interactions:
+            return df
+
+        # Each feature is read once, into the columns of one buffer
+        features = list(dict.fromkeys(feature for pair in interactions for feature in pair))
+        values = df[features].to_numpy(dtype=_fitted_dtype(self), na_value=np.nan)
+        left = np.array([features.index(pair[0]) for pair in interactions])
+        right = np.array([features.index(pair[1]) for pair in interactions])
+
+        products = np.empty((len(df), len(interactions)), dtype=values.dtype)
+        for start in range(0, len(df), self.block_rows):
+            block = values[start : start + self.block_rows]
+            np.multiply(block[:, left], block[:, right], out=products[start : start + len(block)])
+        # The feature buffer is released before the frame is assembled
+        values = block = None
+
+        names = [self._name(*pair) for pair in interactions]
+        products_df = pd.DataFrame(products, columns=names, index=df.index)
+        replaced = [name for name in names if name in df.columns]
+        # drop already returns a new frame, so it is only called when columns are replaced
+        df_transformed = df.drop(columns=replaced) if replaced else df
+        return pd.concat([df_transformed, products_df], axis=1)
+
+    def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Removes the interaction columns. Their features are left in the frame by transform,
+        so nothing else needs restoring.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing interaction columns.
+
+        Returns:
+        pd.DataFrame: The dataframe without the interaction columns.
+        """
+        names = [name for name in self.get_feature_names_out() if name in df.columns]
+        if not names:
+            return df
+        return df.drop(columns=names)
+
+
+def _fitted_dtype(fitted) -> np.dtype:
+    """
+    Returns the precision a strategy or engineer was fitted in. Objects that were never
+    fitted use the configured precision.
+    """
+    dtype = getattr(fitted, "dtype_", None)
+    return float_dtype() if dtype is None else dtype
+
+
+def _positions(columns: list, features: list):
+    """
+    Locates features in a buffer's columns. Contiguous features are addressed with a slice,
+    so a strategy gets a view of the buffer instead of a copy.
+    """
+    positions = [columns.index(feature) for feature in features]
+    if positions == list(range(positions[0], positions[0] + len(positions))):
+        return slice(positions[0], positions[0] + len(positions))
+    return positions
+
 
 # Context Class for Feature Engineering
 # -------------------------------------
-# This class uses a FeatureEngineeringStrategy to apply transformations to a dataset.
+# This class applies an ordered list of FeatureEngineeringStrategy objects to a dataset.
+# The list is compiled into a plan: each run of consecutive fusable strategies becomes one
+# stage that copies the columns it touches into a single float buffer, applies every
+# strategy to that buffer in order and writes the columns back once. Other strategies, such
+# as one-hot encoding, change the shape of the frame and run on the DataFrame between stages.
+# Buffers use the precision configured when the plan is fitted. Once fitted, the same plan
+# transforms new data and inverts transformed data in that precision.
 class FeatureEngineer:
-    def __init__(self, strategy: FeatureEngineeringStrategy):
+    def __init__(self, strategy):
         """
-        Initializes the FeatureEngineer with a specific feature engineering strategy.
+        Initializes the FeatureEngineer with one or more feature engineering strategies.
 
         Parameters:
-        strategy (FeatureEngineeringStrategy): The strategy to be used for feature engineering.
+        strategy (FeatureEngineeringStrategy or list): The strategy, or the ordered list of
+            strategies, to be used for feature engineering.
         """
-        self._strategy = strategy
+        self._strategies = strategy if isinstance(strategy, list) else [strategy]
+        self._plan = self._compile_plan(self._strategies)
 
-    def set_strategy(self, strategy: FeatureEngineeringStrategy):
+    def set_strategy(self, strategy):
         """
-        Sets a new strategy for the FeatureEngineer.
+        Sets new strategies for the FeatureEngineer.
 
         Parameters:
-        strategy (FeatureEngineeringStrategy): The new strategy to be used for feature engineering.
+        strategy (FeatureEngineeringStrategy or list): The new strategy, or ordered list of
+            strategies, to be used for feature engineering.
         """
         logging.info("Switching feature engineering strategy.")
-        self._strategy = strategy
+        self._strategies = strategy if isinstance(strategy, list) else [strategy]
+        self._plan = self._compile_plan(self._strategies)
+
+    @staticmethod
+    def _compile_plan(strategies: list) -> list:
+        """
+        Groups consecutive fusable strategies into buffer stages.
+
+        Returns:
+        list: The stages in order, each a ("buffer", columns, strategies) tuple or a
+        ("frame", strategy) tuple.
+        """
+        plan = []
+        for strategy in strategies:
+            if not strategy.fusable:
+                plan.append(("frame", strategy))
+                continue
+            if not plan or plan[-1][0] != "buffer":
+                plan.append(("buffer", [], []))
+            _, columns, stage_strategies = plan[-1]
+            columns.extend(feature for feature in strategy.features if feature not in columns)
+            stage_strategies.append(strategy)
+        return plan
+
+    def _run(self, df: pd.DataFrame, fit: bool) -> pd.DataFrame:
+        """Runs the plan forwards, fitting each strategy on the values it receives if asked."""
+        if fit:
+            self.dtype_ = float_dtype()
+        df_transformed = working_copy(df)
+        for stage in self._plan:
+            if stage[0] == "frame":
+                strategy = stage[1]
+                if fit:
+                    df_transformed = strategy.fit_transform(df_transformed)
+                else:
+                    df_transformed = strategy.transform(df_transformed)
+                continue
+
+            _, columns, stage_strategies = stage
+            # At inference time some features, such as the target, are not present
+            columns = [column for column in columns if column in df_transformed.columns]
+            if not columns:
+                continue
+            buffer = df_transformed[columns].to_numpy(dtype=_fitted_dtype(self), copy=True)
+            for strategy in stage_strategies:
+                features = [feature for feature in strategy.features if feature in columns]
+                if not features:
+                    continue
+                positions = _positions(columns, features)
+                if fit:
+                    strategy.fit_values(buffer[:, positions], features)
+                buffer[:, positions] = strategy.transform_values(buffer[:, positions], features)
+            df_transformed[columns] = buffer
+        return df_transformed
+
+    def fit(self, df: pd.DataFrame):
+        """
+        Fits every strategy in order, each on the output of the strategies before it.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to learn from.
+
+        Returns:
+        FeatureEngineer: The fitted engineer.
+        """
+        self._run(df, fit=True)
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the fitted plan to new data.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features to transform.
+
+        Returns:
+        pd.DataFrame: The dataframe with applied feature engineering transformations.
+        """
+        return self._run(df, fit=False)
+
+    def inverse_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Undoes the fitted plan, running every strategy's inverse in reverse order.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing transformed features.
+
+        Returns:
+        pd.DataFrame: The dataframe with the features on their original scale.
+        """
+        df_restored = working_copy(df)
+        for stage in reversed(self._plan):
+            if stage[0] == "frame":
+                df_restored = stage[1].inverse_transform(df_restored)
+                continue
+
+            _, columns, stage_strategies = stage
+            columns = [column for column in columns if column in df_restored.columns]
+            if not columns:
+                continue
+            buffer = df_restored[columns].to_numpy(dtype=_fitted_dtype(self), copy=True)
+            for strategy in reversed(stage_strategies):
+                features = [feature for feature in strategy.features if feature in columns]
+                if not features:
+                    continue
+                positions = _positions(columns, features)
+                buffer[:, positions] = strategy.inverse_values(buffer[:, positions], features)
+            df_restored[columns] = buffer
+        return df_restored
 
     def apply_feature_engineering(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Executes the feature engineering transformation using the current strategy.
+        Fits the compiled plan of feature engineering transformations and applies it.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing features to transform.
@@ -194,8 +1074,130 @@ class FeatureEngineer:
         Returns:
         pd.DataFrame: The dataframe with applied feature engineering transformations.
         """
-        logging.info("Applying feature engineering strategy.")
-        return self._strategy.apply_transformation(df)
+        logging.info(
+            "Applying feature engineering strategies: "
+            f"{[type(strategy).__name__ for strategy in self._strategies]}"
+        )
+        df_transformed = self._run(df, fit=True)
+        logging.info("Feature engineering completed.")
+        return df_transformed
+
+
+# Scikit-learn Adapters for the Exported Model
+# --------------------------------------------
+# These wrap a fitted FeatureEngineer so the feature transforms and the inverse target
+# transform are pickled inside the model pipeline. A single predict call then maps raw
+# inputs to predictions on the original target scale.
+class FeatureTransformer(BaseEstimator, TransformerMixin):
+    def __init__(self, engineer: FeatureEngineer = None, prefit: bool = False):
+        """
+        Initializes the FeatureTransformer.
+
+        Parameters:
+        engineer (FeatureEngineer): The feature engineer to apply.
+        prefit (bool): Whether the engineer is already fitted, in which case fit leaves it as is.
+        """
+        self.engineer = engineer
+        self.prefit = prefit
+
+    def fit(self, X: pd.DataFrame, y=None):
+        """Fits the engineer to the features, unless it was fitted beforehand."""
+        if not self.prefit:
+            self.engineer.fit(X)
+        return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Applies the fitted feature transforms."""
+        return self.engineer.transform(X)
+
+    def inverse_transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Undoes the fitted feature transforms."""
+        return self.engineer.inverse_transform(X)
+
+
+class SupervisedFeatureTransformer(BaseEstimator, TransformerMixin):
+    def __init__(self, engineer: FeatureEngineer = None, target_column: str = None):
+        """
+        Initializes the SupervisedFeatureTransformer.
+
+        Strategies that learn from the target, such as target encoding, are fitted by this
+        transformer inside the model pipeline, so they only ever see the training split.
+
+        Parameters:
+        engineer (FeatureEngineer): The feature engineer to fit on the training split.
+        target_column (str): The name the strategies read the training target from.
+        """
+        self.engineer = engineer
+        self.target_column = target_column
+
+    def fit(self, X: pd.DataFrame, y: pd.Series):
+        """Fits the engineer to the training features and target."""
+        self.fit_transform(X, y)
+        return self
+
+    def fit_transform(self, X: pd.DataFrame, y: pd.Series) -> pd.DataFrame:
+        """
+        Fits the engineer to the training features and target and transforms the training
+        features, with the out-of-fold encodings of strategies that cross-fit.
+        """
+        df = X.assign(**{self.target_column: np.asarray(y)})
+        df_transformed = self.engineer.apply_feature_engineering(df)
+        return df_transformed.drop(columns=[self.target_column])
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Applies the fitted feature transforms."""
+        return self.engineer.transform(X)
+
+
+class SparseColumnsTransformer(BaseEstimator, TransformerMixin):
+    def fit(self, X: pd.DataFrame, y=None):
+        """Learns nothing; the columns are passed on as they are."""
+        return self
+
+    def transform(self, X: pd.DataFrame):
+        """
+        Converts SparseDtype columns, such as sparse one-hot encodings, to a CSR matrix.
+
+        Scikit-learn converts sparse DataFrame columns to a dense array, so the model
+        preprocessor routes them through this transformer to keep them sparse.
+        """
+        if X.shape[1] == 0:
+            return sp.csr_matrix((len(X), 0))
+        return X.sparse.to_coo().tocsr()
+
+
+class TargetTransformedRegressor(BaseEstimator, RegressorMixin):
+    def __init__(self, regressor=None, engineer: FeatureEngineer = None, target_column: str = None):
+        """
+        Initializes the TargetTransformedRegressor.
+
+        Parameters:
+        regressor: The regressor trained on the transformed target.
+        engineer (FeatureEngineer): The fitted feature engineer that transformed the target.
+        target_column (str): The name of the target column in the engineer's plan.
+        """
+        self.regressor = regressor
+        self.engineer = engineer
+        self.target_column = target_column
+
+    def fit(self, X, y):
+        """
+        Fits a clone of the regressor to a target that the engineer has already transformed.
+
+        Parameters:
+        X: The training features.
+        y (pd.Series): The transformed training target.
+
+        Returns:
+        TargetTransformedRegressor: The fitted regressor.
+        """
+        self.regressor_ = clone(self.regressor).fit(X, y)
+        return self
+
+    def predict(self, X) -> np.ndarray:
+        """Predicts the target and maps the predictions back to the original target scale."""
+        predictions = pd.DataFrame({self.target_column: self.regressor_.predict(X)})
+        return self.engineer.inverse_transform(predictions)[self.target_column].to_numpy()
 
 
 # Example usage
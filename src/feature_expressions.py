@@ -0,0 +1,211 @@
+import ast
+import re
+
+import numpy as np
+
+# Feature Expression Graph
+# ------------------------
+# Compiles declarative feature expressions, such as "`Yr Sold` - `Year Built`", into one
+# shared graph of column arithmetic. Column names containing spaces or symbols are written
+# in backticks, as in DataFrame.eval; plain identifiers are column names too.
+#
+# Nodes are hash-consed: a node is looked up by its operation and inputs before it is
+# created, so a subexpression that appears in several expressions, or twice in one, becomes
+# a single node. Additions and multiplications are commutative, so their inputs are sorted
+# and `a` + `b` and `b` + `a` share a node, and operations on constants only are folded.
+#
+# Evaluation walks the graph once in creation order, which is a topological order. Every
+# node is computed once, as a whole-column NumPy operation, and kept only until its last
+# consumer has run; a temporary that is used for the last time is overwritten in place by
+# its consumer, so a chain of operations needs a single buffer.
+
+BINARY_OPERATORS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+    ast.Pow: np.power,
+}
+COMMUTATIVE = {np.add, np.multiply}
+FUNCTIONS = {
+    "abs": np.abs,
+    "exp": np.exp,
+    "log": np.log,
+    "log1p": np.log1p,
+    "sqrt": np.sqrt,
+    "minimum": np.minimum,
+    "maximum": np.maximum,
+}
+
+# Backticked column names are swapped for identifiers before the expression is parsed
+_QUOTED_NAME = re.compile(r"`([^`]+)`")
+
+
+class ExpressionGraph:
+    def __init__(self):
+        """Initializes an empty ExpressionGraph."""
+        # Each node is a tuple: ("column", name), ("constant", value) or (ufunc, *input ids)
+        self.nodes = []
+        self._ids = {}
+
+    def _node(self, key: tuple) -> int:
+        """Returns the id of the node with this key, creating it if it does not exist yet."""
+        if key not in self._ids:
+            self._ids[key] = len(self.nodes)
+            self.nodes.append(key)
+        return self._ids[key]
+
+    def _operation(self, function, inputs: list) -> int:
+        """Adds a ufunc node, folding it into a constant if all its inputs are constants."""
+        if all(self.nodes[node][0] == "constant" for node in inputs):
+            value = function(*(self.nodes[node][1] for node in inputs))
+            return self._node(("constant", float(value)))
+        if function in COMMUTATIVE:
+            inputs = sorted(inputs)
+        return self._node((function, *inputs))
+
+    def add(self, expression: str) -> int:
+        """
+        Compiles an expression into the graph.
+
+        Parameters:
+        expression (str): The expression, e.g. "`Total Bsmt SF` + `1st Flr SF`".
+
+        Returns:
+        int: The id of the node that computes the expression.
+        """
+        quoted = {}
+
+        def quote(match):
+            identifier = f"__column_{len(quoted)}__"
+            quoted[identifier] = match.group(1)
+            return identifier
+
+        try:
+            tree = ast.parse(_QUOTED_NAME.sub(quote, expression), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid feature expression {expression!r}: {e.msg}") from e
+        return self._compile(tree.body, quoted, expression)
+
+    def _compile(self, node: ast.AST, quoted: dict, expression: str) -> int:
+        """Compiles a parsed expression node by node, bottom up."""
+        if isinstance(node, ast.Name):
+            return self._node(("column", quoted.get(node.id, node.id)))
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return self._node(("constant", float(node.value)))
+        if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+            inputs = [self._compile(side, quoted, expression) for side in (node.left, node.right)]
+            return self._operation(BINARY_OPERATORS[type(node.op)], inputs)
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = self._compile(node.operand, quoted, expression)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            return self._operation(np.negative, [operand])
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in FUNCTIONS
+            and len(node.args) == FUNCTIONS[node.func.id].nin
+            and not node.keywords
+        ):
+            inputs = [self._compile(argument, quoted, expression) for argument in node.args]
+            return self._operation(FUNCTIONS[node.func.id], inputs)
+        raise ValueError(
+            f"Unsupported syntax in feature expression {expression!r}: {ast.dump(node)}. "
+            f"Use columns, numbers, + - * / ** and the functions {sorted(FUNCTIONS)}."
+        )
+
+    def columns(self, roots: list) -> set:
+        """Returns the names of the columns the given nodes read."""
+        needed = self._needed(roots)
+        return {self.nodes[node][1] for node in needed if self.nodes[node][0] == "column"}
+
+    def operations(self, roots: list) -> int:
+        """Returns the number of distinct operations computed to evaluate the given nodes."""
+        return sum(callable(self.nodes[node][0]) for node in self._needed(roots))
+
+    def _needed(self, roots: list) -> set:
+        """Returns the ids of the given nodes and of every node they depend on."""
+        needed, stack = set(), list(roots)
+        while stack:
+            node = stack.pop()
+            if node not in needed:
+                needed.add(node)
+                if callable(self.nodes[node][0]):
+                    stack.extend(self.nodes[node][1:])
+        return needed
+
+    def evaluate(self, read_column, roots: list, n_rows: int, dtype=np.float64) -> dict:
+        """
+        Evaluates the given nodes, computing each node they depend on exactly once.
+
+        Parameters:
+        read_column (callable): Returns the values of a column by name, as an array of dtype.
+        roots (list): The ids of the nodes to evaluate.
+        n_rows (int): The number of rows, to broadcast constant expressions.
+        dtype: The floating-point dtype to compute in.
+
+        Returns:
+        dict: The computed array of each root node. Arrays may be shared between roots and
+        may be views of the columns they read, so they must not be modified.
+        """
+        needed = sorted(self._needed(roots))
+        # How many consumers still have to read each node; roots are also read by the caller
+        remaining = dict.fromkeys(needed, 0)
+        for node in needed:
+            if callable(self.nodes[node][0]):
+                for input_node in self.nodes[node][1:]:
+                    remaining[input_node] += 1
+        for node in roots:
+            remaining[node] += 1
+
+        values, owned = {}, set()
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            for node in needed:
+                kind, *inputs = self.nodes[node]
+                if kind == "column":
+                    values[node] = read_column(inputs[0])
+                    continue
+                if kind == "constant":
+                    values[node] = np.dtype(dtype).type(inputs[0])
+                    continue
+
+                # Reuse the buffer of a temporary input that is read for the last time here
+                out = next(
+                    (
+                        values[input_node]
+                        for input_node in inputs
+                        if input_node in owned
+                        and remaining[input_node] == inputs.count(input_node)
+                    ),
+                    None,
+                )
+                values[node] = kind(*(values[input_node] for input_node in inputs), out=out)
+                owned.add(node)
+                for input_node in inputs:
+                    remaining[input_node] -= 1
+                    if remaining[input_node] == 0:
+                        del values[input_node]
+                        owned.discard(input_node)
+
+        # Expressions of constants only are broadcast to a column
+        return {
+            node: np.full(n_rows, values[node], dtype=dtype)
+            if np.ndim(values[node]) == 0
+            else values[node]
+            for node in roots
+        }
+
+
+# Derived features of the Ames housing data, as name -> expression
+AMES_DERIVED_FEATURES = {
+    "Total SF": "`Total Bsmt SF` + `1st Flr SF` + `2nd Flr SF`",
+    "House Age": "`Yr Sold` - `Year Built`",
+    "Years Since Remodel": "`Yr Sold` - `Year Remod/Add`",
+    "Total Baths": (
+        "`Full Bath` + 0.5 * `Half Bath` + `Bsmt Full Bath` + 0.5 * `Bsmt Half Bath`"
+    ),
+    "Total Porch SF": (
+        "`Open Porch SF` + `Enclosed Porch` + `3Ssn Porch` + `Screen Porch` + `Wood Deck SF`"
+    ),
+}
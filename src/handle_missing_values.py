@@ -1,12 +1,152 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import Iterable
 
+import numpy as np
 import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.neighbors import NearestNeighbors
+from src.execution_mode import working_copy
+from src.quantile_sketch import KLLSketch
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
+def _code_modes(codes: list) -> list:
+    """
+    Finds the most frequent code of each of several non-negative code arrays by counting.
+
+    Code 0 stands for a missing value and is not counted, so valid codes start at 1. Counting
+    with bincount needs no hashing or sorting. Ties go to the smallest code.
+
+    Returns:
+    list: The most frequent valid code of each array, minus one, or None when an array has
+    no valid values.
+    """
+    modes = []
+    for column_codes in codes:
+        counts = np.bincount(column_codes)[1:]
+        modes.append(int(counts.argmax()) if counts.size and counts.max() > 0 else None)
+    return modes
+
+
+def _sorted_modes(values: np.ndarray) -> list:
+    """
+    Finds the most frequent value of each row of a 2-D array with one in-place sort of the
+    block.
+
+    After sorting each row, runs of equal values are found in a single pass over the
+    flattened block and the longest run per row gives its mode. The first longest run holds
+    the smallest value, matching Series.mode().iloc[0]. NaNs sort last and are not counted.
+
+    Parameters:
+    values (np.ndarray): A C-contiguous block with one row per column. It is sorted in place.
+
+    Returns:
+    list: The mode of each row as a Python scalar, or None when a row has no valid values.
+    """
+    n_columns, n_rows = values.shape
+    values.sort(axis=1)
+    flat = values.ravel()
+
+    new_run = np.ones(flat.shape, dtype=bool)
+    new_run[1:] = flat[1:] != flat[:-1]
+    # Every row starts a new run, even when it begins with the value the last row ended on
+    new_run[::n_rows] = True
+    run_starts = np.flatnonzero(new_run)
+    run_lengths = np.diff(np.append(run_starts, flat.size))
+    if flat.dtype.kind == "f":
+        run_lengths[np.isnan(flat[run_starts])] = 0
+
+    run_columns = run_starts // n_rows
+    longest = np.maximum.reduceat(run_lengths, np.searchsorted(run_columns, np.arange(n_columns)))
+    # Runs are in value order within each row, so the first longest run per row wins ties
+    candidates = np.flatnonzero(run_lengths == longest[run_columns])
+    best_runs = candidates[np.searchsorted(run_columns[candidates], np.arange(n_columns))]
+    return [
+        flat[run_starts[run]].item() if length > 0 else None
+        for run, length in zip(best_runs, longest)
+    ]
+
+
+def column_modes(df: pd.DataFrame) -> dict:
+    """
+    Computes the mode of every column with counting and sorting passes instead of a hash
+    table per column.
+
+    Categorical and text columns, and integer columns with a small value range, are counted
+    with a bincount over their codes. The other NumPy numeric columns are stacked into one
+    block per dtype, which is sorted once. Any other column falls back to Series.mode().
+    Ties go to the smallest value (or the first category), as with Series.mode().iloc[0],
+    and columns that are entirely missing have no mode.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame to compute the modes of.
+
+    Returns:
+    dict: The mode of each column as a Python scalar, keyed by column name.
+    """
+    n_rows = len(df)
+    if n_rows == 0:
+        return {}
+
+    # Each coded column contributes its codes, with 0 for missing values, and a lookup from
+    # the codes, minus one, to the values
+    coded, codes, lookups = [], [], []
+    sorted_blocks, other = {}, []
+    for column, dtype in df.dtypes.items():
+        series = df[column]
+        if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            # Sorted categories keep the smallest-value tie-break of Series.mode()
+            series = series.astype("category")
+            dtype = series.dtype
+
+        if isinstance(dtype, pd.CategoricalDtype):
+            coded.append(column)
+            # Pandas picks a code dtype with room for one more category, so adding one is safe
+            codes.append(series.cat.codes.to_numpy() + 1)
+            lookups.append(dtype.categories)
+        elif isinstance(dtype, np.dtype) and dtype.kind in "iu":
+            values = series.to_numpy()
+            low, high = int(values.min()), int(values.max())
+            if high - low < n_rows:
+                coded.append(column)
+                info = np.iinfo(dtype)
+                # The codes are computed in the column's own dtype when they fit in it
+                if low > info.min and high - low < info.max:
+                    codes.append(values - dtype.type(low - 1))
+                else:
+                    codes.append(values.astype(np.intp) - (low - 1))
+                lookups.append(np.arange(low, high + 1).astype(dtype))
+            else:
+                sorted_blocks.setdefault(dtype, []).append(column)
+        elif isinstance(dtype, np.dtype) and dtype.kind in "bf":
+            sorted_blocks.setdefault(dtype, []).append(column)
+        else:
+            other.append(column)
+
+    modes = {}
+    for column, code, lookup in zip(coded, _code_modes(codes), lookups):
+        if code is not None:
+            modes[column] = lookup[code]
+    for columns in sorted_blocks.values():
+        block_modes = _sorted_modes(np.stack([df[column].to_numpy() for column in columns]))
+        modes.update(
+            {column: mode for column, mode in zip(columns, block_modes) if mode is not None}
+        )
+    for column in other:
+        series_modes = df[column].mode()
+        if not series_modes.empty:
+            modes[column] = series_modes.iloc[0]
+
+    return {
+        column: modes[column].item() if hasattr(modes[column], "item") else modes[column]
+        for column in df.columns
+        if column in modes
+    }
+
+
 # Abstract Base Class for Missing Value Handling Strategy
 class MissingValueHandlingStrategy(ABC):
     @abstractmethod
@@ -22,6 +162,30 @@ class MissingValueHandlingStrategy(ABC):
         """
         pass
 
+    def fit(self, df: pd.DataFrame):
+        """
+        Learns whatever the strategy needs from the DataFrame. Stateless strategies learn nothing.
+
+        Parameters:
+        df (pd.DataFrame): The DataFrame to learn from.
+
+        Returns:
+        MissingValueHandlingStrategy: The fitted strategy.
+        """
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Handles missing values using what was learned in fit.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing values handled.
+        """
+        return self.handle(df)
+
 
 # Concrete Strategy for Dropping Missing Values
 class DropMissingValuesStrategy(MissingValueHandlingStrategy):
@@ -64,10 +228,79 @@ class FillMissingValuesStrategy(MissingValueHandlingStrategy):
         """
         self.method = method
         self.fill_value = fill_value
+        self.fill_values_ = None
+
+    def fit(self, df: pd.DataFrame):
+        """
+        Learns one fill value per column from the DataFrame.
+
+        The learned values are kept in fill_values_, a plain dict of column name to Python
+        scalar, so they can be stored with the model and applied later without the data.
+
+        Parameters:
+        df (pd.DataFrame): The DataFrame to learn the fill values from, e.g. the training split.
+
+        Returns:
+        FillMissingValuesStrategy: The fitted strategy.
+        """
+        logging.info(f"Learning fill values using method: {self.method}")
+
+        if self.method == "mean":
+            fill_values = df.select_dtypes(include="number").mean()
+        elif self.method == "median":
+            fill_values = df.select_dtypes(include="number").median()
+        elif self.method == "mode":
+            fill_values = pd.Series(column_modes(df), dtype=object)
+        elif self.method == "constant":
+            fill_values = pd.Series(self.fill_value, index=df.columns, dtype=object)
+        else:
+            logging.warning(f"Unknown method '{self.method}'. No missing values handled.")
+            fill_values = pd.Series(dtype=object)
+
+        self.fill_values_ = {
+            column: value.item() if hasattr(value, "item") else value
+            for column, value in fill_values.dropna().items()
+        }
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills missing values with the values learned in fit, in a single fillna call.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing values filled.
+        """
+        if self.fill_values_ is None:
+            raise ValueError("FillMissingValuesStrategy must be fitted before transform.")
+
+        # NumPy integer and boolean columns cannot hold missing values and are not filled
+        fill_values = {
+            column: value
+            for column, value in self.fill_values_.items()
+            if column in df.columns
+            and not (isinstance(df[column].dtype, np.dtype) and df[column].dtype.kind in "biu")
+        }
+        # A categorical column can only be filled with one of its categories, and a chunk or
+        # split may not contain the value the fill was learned from
+        new_categories = {
+            column: df[column].cat.add_categories([value])
+            for column, value in fill_values.items()
+            if isinstance(df[column].dtype, pd.CategoricalDtype)
+            and value not in df[column].cat.categories
+        }
+        if new_categories:
+            df = df.assign(**new_categories)
+        df_cleaned = df.fillna(fill_values)
+        logging.info("Missing values filled.")
+        return df_cleaned
 
     def handle(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Fills missing values using the specified method or constant value.
+        Fills missing values using the specified method or constant value,
+        learning the fill values from the same DataFrame.
 
         Parameters:
         df (pd.DataFrame): The input DataFrame containing missing values.
@@ -76,28 +309,363 @@ class FillMissingValuesStrategy(MissingValueHandlingStrategy):
         pd.DataFrame: The DataFrame with missing values filled.
         """
         logging.info(f"Filling missing values using method: {self.method}")
+        return self.fit(df).transform(df)
+
+
+# Concrete Strategy for Nearest-Neighbour Imputation
+# --------------------------------------------------
+# Missing numeric values are filled with the average of the k most similar rows, where
+# similarity is the distance over the standardised numeric columns that have no missing
+# values. Each incomplete column gets a KD-tree (or ball tree) over the rows where it is
+# present, and the rows to fill are queried in batches, in parallel across cores, so the
+# cost is O(n log n) instead of the O(n^2) of comparing every pair of rows.
+class KNNFillMissingValuesStrategy(MissingValueHandlingStrategy):
+    def __init__(self, n_neighbors=5, algorithm="kd_tree", batch_size=10_000, n_jobs=-1):
+        """
+        Initializes the KNNFillMissingValuesStrategy.
 
-        df_cleaned = df.copy()
-        if self.method == "mean":
-            numeric_columns = df_cleaned.select_dtypes(include="number").columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(
-                df[numeric_columns].mean()
+        Parameters:
+        n_neighbors (int): The number of neighbours averaged for each missing value.
+        algorithm (str): The spatial index to use, 'kd_tree' or 'ball_tree'.
+        batch_size (int): The number of rows queried against the index at a time.
+        n_jobs (int): The number of cores used for the queries; -1 uses all of them.
+        """
+        self.n_neighbors = n_neighbors
+        self.algorithm = algorithm
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.indexes_ = None
+
+    def _features(self, df: pd.DataFrame) -> np.ndarray:
+        """Returns the standardised feature columns, with any missing value at its mean."""
+        features = df[self.feature_columns_].to_numpy(dtype=np.float64, na_value=np.nan)
+        features = np.where(np.isnan(features), self.feature_means_, features)
+        return (features - self.feature_means_) / self.feature_scales_
+
+    def fit(self, df: pd.DataFrame):
+        """
+        Builds one spatial index per numeric column with missing values.
+
+        Parameters:
+        df (pd.DataFrame): The DataFrame to learn from, e.g. the training split.
+
+        Returns:
+        KNNFillMissingValuesStrategy: The fitted strategy.
+        """
+        numeric = df.select_dtypes(include="number")
+        missing = numeric.isna().to_numpy()
+        self.feature_columns_ = [
+            column
+            for column, has_missing in zip(numeric.columns, missing.any(axis=0))
+            if not has_missing
+        ]
+        if not self.feature_columns_:
+            raise ValueError(
+                "KNN imputation needs at least one numeric column without missing values."
             )
+        logging.info(
+            f"Building {self.algorithm} indexes over {len(self.feature_columns_)} complete columns."
+        )
+
+        features = numeric[self.feature_columns_].to_numpy(dtype=np.float64)
+        self.feature_means_ = features.mean(axis=0)
+        scales = features.std(axis=0)
+        # Constant columns carry no distance information but must not divide by zero
+        self.feature_scales_ = np.where(scales > 0, scales, 1.0)
+        features = (features - self.feature_means_) / self.feature_scales_
+
+        # Columns missing only at transform time have no index and fall back to their mean
+        self.column_means_ = numeric.mean().dropna().to_dict()
+        self.indexes_ = {}
+        for position, column in enumerate(numeric.columns):
+            donors = ~missing[:, position]
+            if column in self.feature_columns_ or not donors.any():
+                continue
+            index = NearestNeighbors(
+                n_neighbors=min(self.n_neighbors, int(donors.sum())),
+                algorithm=self.algorithm,
+                n_jobs=self.n_jobs,
+            ).fit(features[donors])
+            self.indexes_[column] = (index, numeric[column].to_numpy(dtype=np.float64)[donors])
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills each missing numeric value with the average of its nearest neighbours.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing numeric values filled.
+        """
+        if self.indexes_ is None:
+            raise ValueError("KNNFillMissingValuesStrategy must be fitted before transform.")
+
+        df_cleaned = working_copy(df)
+        features = None
+        for column, (index, donor_values) in self.indexes_.items():
+            if column not in df_cleaned.columns:
+                continue
+            rows = np.flatnonzero(df_cleaned[column].isna().to_numpy())
+            if not len(rows):
+                continue
+            if features is None:
+                features = self._features(df_cleaned)
+
+            imputed = np.empty(len(rows))
+            for start in range(0, len(rows), self.batch_size):
+                batch = rows[start : start + self.batch_size]
+                neighbours = index.kneighbors(features[batch], return_distance=False)
+                imputed[start : start + len(batch)] = donor_values[neighbours].mean(axis=1)
+
+            values = df_cleaned[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            values[rows] = imputed
+            df_cleaned[column] = values.astype(df_cleaned[column].dtype, copy=False)
+            logging.info(f"Filled {len(rows)} missing values in '{column}' from neighbours.")
+
+        fallback = {
+            column: value
+            for column, value in self.column_means_.items()
+            if column in df_cleaned.columns and column not in self.indexes_
+        }
+        return df_cleaned.fillna(fallback)
+
+    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills missing numeric values from the nearest neighbours within the same DataFrame.
+
+        Parameters:
+        df (pd.DataFrame): The input DataFrame containing missing values.
+
+        Returns:
+        pd.DataFrame: The DataFrame with missing numeric values filled.
+        """
+        logging.info(f"Filling missing values from the {self.n_neighbors} nearest neighbours")
+        return self.fit(df).transform(df)
+
+
+# Concrete Strategy for Filling Missing Values from a Stream of Chunks
+# --------------------------------------------------------------------
+# The fill values are learned one chunk at a time in bounded memory: running sums and counts
+# for the mean, one KLL quantile sketch per column for the median and one Misra-Gries
+# heavy-hitter summary per column for the mode. The fitted fill_values_ are the same plain
+# dict FillMissingValuesStrategy produces, so transform and the handler apply them unchanged.
+class StreamingFillMissingValuesStrategy(FillMissingValuesStrategy):
+    def __init__(
+        self, method="mean", fill_value=None, sketch_size=200, mode_capacity=64, seed=None
+    ):
+        """
+        Initializes the StreamingFillMissingValuesStrategy.
+
+        Parameters:
+        method (str): The method to fill missing values ('mean', 'median', 'mode', or 'constant').
+        fill_value (any): The constant value to fill missing values when method='constant'.
+        sketch_size (int): The KLL sketch size per column; the median is approximate beyond it.
+        mode_capacity (int): The number of candidate values tracked per column for the mode.
+        seed (int): The seed of the quantile sketches, for reproducible medians.
+        """
+        super().__init__(method, fill_value)
+        self.sketch_size = sketch_size
+        self.mode_capacity = mode_capacity
+        self.seed = seed
+        self._reset()
+
+    def _reset(self):
+        """Clears the accumulated statistics."""
+        self.fill_values_ = None
+        self.n_rows_seen_ = 0
+        self._sums = {}
+        self._counts = {}
+        self._sketches = {}
+        self._heavy_hitters = {}
+        self._columns = []
+
+    def partial_fit(self, chunk: pd.DataFrame):
+        """
+        Updates the statistics with one chunk and refreshes fill_values_.
+
+        Parameters:
+        chunk (pd.DataFrame): The next chunk of the data.
+
+        Returns:
+        StreamingFillMissingValuesStrategy: The updated strategy.
+        """
+        self.n_rows_seen_ += len(chunk)
+        self._columns.extend(column for column in chunk.columns if column not in self._columns)
+        numeric = chunk.select_dtypes(include="number")
+
+        if self.method == "mean":
+            # Sums are accumulated in float64 so narrow dtypes cannot overflow or lose precision
+            values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+            totals = np.nansum(values, axis=0)
+            counts = np.count_nonzero(~np.isnan(values), axis=0)
+            for column, total, count in zip(numeric.columns, totals, counts):
+                self._sums[column] = self._sums.get(column, 0.0) + float(total)
+                self._counts[column] = self._counts.get(column, 0) + int(count)
         elif self.method == "median":
-            numeric_columns = df_cleaned.select_dtypes(include="number").columns
-            df_cleaned[numeric_columns] = df_cleaned[numeric_columns].fillna(
-                df[numeric_columns].median()
-            )
+            for column in numeric.columns:
+                if column not in self._sketches:
+                    self._sketches[column] = KLLSketch(self.sketch_size, self.seed)
+                self._sketches[column].update(numeric[column].to_numpy(dtype=np.float64))
+        elif self.method == "mode":
+            for column in chunk.columns:
+                self._heavy_hitters[column] = self._update_heavy_hitters(
+                    self._heavy_hitters.get(column), chunk[column].value_counts()
+                )
+
+        self.fill_values_ = self._fill_values()
+        return self
+
+    def _update_heavy_hitters(self, counters: pd.Series, chunk_counts: pd.Series) -> pd.Series:
+        """
+        Merges a chunk's value counts into a column's Misra-Gries summary.
+
+        When more than mode_capacity candidates remain, only the mode_capacity largest are kept
+        and the (capacity + 1)-th largest count is subtracted from each of them. Any value that
+        occurs in more than 1 / (capacity + 1) of the rows is guaranteed to be kept.
+        """
+        chunk_counts = chunk_counts[chunk_counts > 0]
+        # Categorical chunks may have different categories, so values are compared as objects
+        chunk_counts.index = chunk_counts.index.astype(object)
+        counters = chunk_counts if counters is None else counters.add(chunk_counts, fill_value=0)
+
+        if len(counters) > self.mode_capacity:
+            largest = counters.nlargest(self.mode_capacity + 1)
+            counters = largest.iloc[:-1] - largest.iloc[-1]
+        return counters
+
+    def _fill_values(self) -> dict:
+        """Derives the fill values from the accumulated statistics."""
+        if self.method == "mean":
+            fill_values = {
+                column: self._sums[column] / count
+                for column, count in self._counts.items()
+                if count
+            }
+        elif self.method == "median":
+            fill_values = {
+                column: float(sketch.quantile(0.5))
+                for column, sketch in self._sketches.items()
+                if sketch.n
+            }
         elif self.method == "mode":
-            for column in df_cleaned.columns:
-                df_cleaned[column].fillna(df[column].mode().iloc[0], inplace=True)
+            fill_values = {
+                column: counters.idxmax()
+                for column, counters in self._heavy_hitters.items()
+                if len(counters)
+            }
         elif self.method == "constant":
-            df_cleaned = df_cleaned.fillna(self.fill_value)
+            fill_values = {column: self.fill_value for column in self._columns}
         else:
             logging.warning(f"Unknown method '{self.method}'. No missing values handled.")
+            fill_values = {}
 
-        logging.info("Missing values filled.")
-        return df_cleaned
+        return {
+            column: value.item() if hasattr(value, "item") else value
+            for column, value in fill_values.items()
+            if not pd.isna(value)
+        }
+
+    def fit_chunks(self, chunks: Iterable[pd.DataFrame]):
+        """
+        Learns the fill values from a sequence of chunks, holding only one chunk at a time.
+
+        Parameters:
+        chunks (Iterable[pd.DataFrame]): The chunks, e.g. from ChunkedZipDataIngestor.ingest.
+
+        Returns:
+        StreamingFillMissingValuesStrategy: The fitted strategy.
+        """
+        logging.info(f"Learning fill values from chunks using method: {self.method}")
+        self._reset()
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        logging.info(f"Fill values learned from {self.n_rows_seen_} rows.")
+        return self
+
+    def fit(self, df: pd.DataFrame):
+        """
+        Learns the fill values from a single DataFrame, treated as one chunk.
+
+        Parameters:
+        df (pd.DataFrame): The DataFrame to learn the fill values from.
+
+        Returns:
+        StreamingFillMissingValuesStrategy: The fitted strategy.
+        """
+        return self.fit_chunks([df])
+
+    def handle(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills missing values in a chunk. Once fitted, the learned fill values are applied
+        as they are, so the handler can impute every chunk of a stream consistently;
+        an unfitted strategy learns from the chunk itself first.
+
+        Parameters:
+        df (pd.DataFrame): The chunk containing missing values.
+
+        Returns:
+        pd.DataFrame: The chunk with missing values filled.
+        """
+        if self.fill_values_ is None:
+            return super().handle(df)
+        return self.transform(df)
+
+
+# Scikit-learn Adapter for Fitted Imputation
+# ------------------------------------------
+# This transformer learns fill values on the training split only and is pickled inside the
+# model pipeline, so serving fills a request's missing values without rescanning any data.
+class MissingValueImputer(BaseEstimator, TransformerMixin):
+    def __init__(self, method="mean", fill_value=None, dtype=None):
+        """
+        Initializes the MissingValueImputer.
+
+        Parameters:
+        method (str): The method to fill missing values ('mean', 'median', 'mode', or 'constant').
+        fill_value (any): The constant value to fill missing values when method='constant'.
+        dtype: The dtype to cast the imputed features to, e.g. the configured float precision.
+            By default the features keep their dtypes.
+        """
+        self.method = method
+        self.fill_value = fill_value
+        self.dtype = dtype
+
+    def fit(self, X: pd.DataFrame, y=None):
+        """
+        Learns the fill values from the training features.
+
+        Parameters:
+        X (pd.DataFrame): The training features.
+        y: Ignored.
+
+        Returns:
+        MissingValueImputer: The fitted imputer.
+        """
+        self.strategy_ = FillMissingValuesStrategy(self.method, self.fill_value).fit(X)
+        self.fill_values_ = self.strategy_.fill_values_
+        self.columns_ = list(X.columns)
+        return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills missing values with the learned fill values.
+
+        Parameters:
+        X (pd.DataFrame): The features to impute.
+
+        Returns:
+        pd.DataFrame: The imputed features.
+        """
+        X_imputed = self.strategy_.transform(X)
+        if self.dtype is not None:
+            X_imputed = X_imputed.astype(self.dtype)
+        return X_imputed
+
+    def get_feature_names_out(self, input_features=None):
+        """Returns the output column names, which are the input column names."""
+        return self.columns_ if input_features is None else input_features
 
 
 # Context Class for Handling Missing Values
@@ -1,8 +1,171 @@
+import glob
+import hashlib
+import json
+import logging
 import os
+import pickle
+import uuid
 import zipfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterator
 
+import numpy as np
 import pandas as pd
+from sqlalchemy import create_engine, text
+
+
+CSV_ENGINES = ("c", "pyarrow")
+DTYPE_BACKENDS = ("numpy", "pyarrow")
+
+# The strings pandas' C parser treats as missing by default, mirrored for the Arrow engine
+DEFAULT_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+def _check_parse_options(engine: str, dtype_backend: str):
+    """Validates the CSV engine and dtype backend names."""
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unsupported CSV engine '{engine}'. Choose from {CSV_ENGINES}.")
+    if dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(
+            f"Unsupported dtype backend '{dtype_backend}'. Choose from {DTYPE_BACKENDS}."
+        )
+
+
+def _arrow_column_types(dtype: dict, columns: list = None) -> dict:
+    """
+    Maps declared dtypes to Arrow types, with categories as dictionary-encoded strings.
+
+    Parameters:
+    dtype (dict): The optional column-to-dtype mapping.
+    columns (list): The optional subset of columns to map.
+
+    Returns:
+    dict: The Arrow type of each mapped column.
+    """
+    import pyarrow as pa
+
+    column_types = {}
+    for column, column_dtype in (dtype or {}).items():
+        if columns is not None and column not in columns:
+            continue
+        if column_dtype == "category":
+            column_types[column] = pa.dictionary(pa.int32(), pa.string())
+        else:
+            column_types[column] = pa.from_numpy_dtype(np.dtype(column_dtype))
+    return column_types
+
+
+def _sort_dictionaries(table):
+    """
+    Sorts the dictionary of every dictionary-encoded column of an Arrow table.
+
+    Arrow keeps dictionary values in order of appearance, while pandas' C parser sorts
+    categories, so both engines produce the same categories in the same order.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    for position, field in enumerate(table.schema):
+        if not pa.types.is_dictionary(field.type):
+            continue
+        column = table.column(position).unify_dictionaries()
+        if column.num_chunks == 0:
+            continue
+        dictionary = column.chunk(0).dictionary
+        order = pc.array_sort_indices(dictionary).to_numpy()
+        # The new position of each old dictionary value
+        ranks = np.empty(len(order), dtype=np.int32)
+        ranks[order] = np.arange(len(order), dtype=np.int32)
+        sorted_dictionary = dictionary.take(pa.array(order))
+        chunks = [
+            pa.DictionaryArray.from_arrays(
+                pc.take(pa.array(ranks), chunk.indices), sorted_dictionary
+            )
+            for chunk in column.chunks
+        ]
+        table = table.set_column(position, field, pa.chunked_array(chunks, type=field.type))
+    return table
+
+
+def _read_csv(
+    source,
+    dtype: dict = None,
+    usecols: list = None,
+    engine: str = "c",
+    dtype_backend: str = "numpy",
+    row_mask: np.ndarray = None,
+) -> pd.DataFrame:
+    """
+    Parses a CSV file path or binary stream with the selected engine.
+
+    The "c" engine is pandas' single-threaded parser. The "pyarrow" engine calls Arrow's
+    multi-threaded CSV reader directly, so declared dtypes are applied while parsing
+    (categories are read as dictionary-encoded columns) instead of through a pandas astype
+    afterwards. With the Arrow engine, the columns come back in usecols order.
+
+    Both engines return the declared dtypes for either backend, and categories sorted as
+    the C parser sorts them.
+
+    With a row mask, the C parser skips the unselected lines without converting their
+    fields. The Arrow engine parses every line and filters the table before conversion.
+
+    Parameters:
+    source: The CSV file path or binary stream.
+    dtype (dict): The optional column-to-dtype mapping applied while parsing.
+    usecols (list): The optional subset of columns to parse.
+    engine (str): The parser to use, "c" or "pyarrow".
+    dtype_backend (str): "numpy" for NumPy-backed columns or "pyarrow" for Arrow-backed ones.
+    row_mask (np.ndarray): The optional boolean mask of the data rows to keep.
+
+    Returns:
+    pd.DataFrame: The parsed DataFrame.
+    """
+    if engine == "c":
+        # Line 0 is the header, so data row i is on line i + 1
+        skiprows = None if row_mask is None else np.flatnonzero(~row_mask) + 1
+        if dtype_backend == "numpy" or dtype is None:
+            options = {"dtype_backend": "pyarrow"} if dtype_backend == "pyarrow" else {}
+            return pd.read_csv(source, dtype=dtype, usecols=usecols, skiprows=skiprows, **options)
+
+        # pandas' Arrow backend drops declared dtypes, so the NumPy-backed frame is
+        # converted to the declared Arrow types instead
+        import pyarrow as pa
+
+        df = pd.read_csv(source, dtype=dtype, usecols=usecols, skiprows=skiprows)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        column_types = _arrow_column_types(dtype, table.column_names)
+        schema = pa.schema(
+            [
+                pa.field(field.name, column_types.get(field.name, field.type))
+                for field in table.schema
+            ]
+        )
+        return table.cast(schema).to_pandas(types_mapper=pd.ArrowDtype)
+
+    from pyarrow import csv as pa_csv
+
+    column_types = _arrow_column_types(dtype, usecols)
+    table = pa_csv.read_csv(
+        source,
+        read_options=pa_csv.ReadOptions(use_threads=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=usecols,
+            null_values=DEFAULT_NA_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    if row_mask is not None:
+        table = table.filter(row_mask)
+    table = _sort_dictionaries(table)
+    if dtype_backend == "pyarrow":
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return table.to_pandas()
 
 
 # Define an abstract class for Data Ingestor
@@ -12,46 +175,889 @@ class DataIngestor(ABC):
         """Abstract method to ingest data from a given file."""
         pass
 
+    def ingest_subset(
+        self, file_path: str, columns: list = None, row_mask: np.ndarray = None
+    ) -> pd.DataFrame:
+        """
+        Ingests only some columns and rows of the given file. By default the whole file is
+        ingested and the subset selected afterwards; ingestors that can skip columns or rows
+        while parsing override this.
+
+        Parameters:
+        file_path (str): The file to ingest.
+        columns (list): The optional subset of columns to return.
+        row_mask (np.ndarray): The optional boolean mask of the rows to return.
+
+        Returns:
+        pd.DataFrame: The selected columns and rows.
+        """
+        df = self.ingest(file_path)
+        if columns is not None:
+            df = df[columns]
+        if row_mask is not None:
+            df = df[row_mask].reset_index(drop=True)
+        return df
+
 
 # Implement a concrete class for ZIP Ingestion
 class ZipDataIngestor(DataIngestor):
+    def __init__(
+        self,
+        member: str = None,
+        dtype: dict = None,
+        usecols: list = None,
+        engine: str = "c",
+        dtype_backend: str = "numpy",
+    ):
+        """
+        Initializes the ZipDataIngestor.
+
+        Parameters:
+        member (str): The name of the CSV member to read when the archive holds several CSVs.
+        dtype (dict): The optional column-to-dtype mapping applied while parsing.
+        usecols (list): The optional subset of columns to parse; all others are skipped.
+        engine (str): The CSV parser, "c" or the multi-threaded "pyarrow".
+        dtype_backend (str): "numpy" for NumPy-backed columns or "pyarrow" for Arrow-backed ones.
+        """
+        _check_parse_options(engine, dtype_backend)
+        self.member = member
+        self.dtype = dtype
+        self.usecols = usecols
+        self.engine = engine
+        self.dtype_backend = dtype_backend
+
+    def _resolve_member(self, zip_ref: zipfile.ZipFile) -> str:
+        """Returns the name of the CSV member to read from the archive."""
+        csv_files = [name for name in zip_ref.namelist() if name.endswith(".csv")]
+
+        if self.member is not None:
+            if self.member not in csv_files:
+                raise FileNotFoundError(
+                    f"CSV member '{self.member}' not found in the archive. Available: {csv_files}"
+                )
+            return self.member
+
+        if len(csv_files) == 0:
+            raise FileNotFoundError("No CSV file found in the zip archive.")
+        if len(csv_files) > 1:
+            raise ValueError(
+                f"Multiple CSV files found: {csv_files}. "
+                "Please specify which one to use via `member`."
+            )
+        return csv_files[0]
+
     def ingest(self, file_path: str) -> pd.DataFrame:
-        """Extracts a .zip file and returns the content as a pandas DataFrame."""
+        """Reads the CSV inside a .zip file straight from the decompression stream."""
+        return self.ingest_subset(file_path)
+
+    def ingest_subset(
+        self, file_path: str, columns: list = None, row_mask: np.ndarray = None
+    ) -> pd.DataFrame:
+        """Reads only the given columns and masked rows of the CSV inside a .zip file."""
         # Ensure the file is a .zip
         if not file_path.endswith(".zip"):
             raise ValueError("The provided file is not a .zip file.")
 
-        # Extract the zip file
+        # Parse the CSV member directly from the archive, without extracting it to disk
+        usecols = self.usecols if columns is None else columns
+        with zipfile.ZipFile(file_path, "r") as zip_ref:
+            member = self._resolve_member(zip_ref)
+            with zip_ref.open(member) as csv_stream:
+                df = _read_csv(
+                    csv_stream, self.dtype, usecols, self.engine, self.dtype_backend, row_mask
+                )
+
+        # Return the DataFrame
+        return df
+
+
+# Implement a concrete class for plain CSV Ingestion
+class CsvDataIngestor(DataIngestor):
+    def __init__(
+        self,
+        dtype: dict = None,
+        usecols: list = None,
+        engine: str = "c",
+        dtype_backend: str = "numpy",
+    ):
+        """
+        Initializes the CsvDataIngestor.
+
+        Parameters:
+        dtype (dict): The optional column-to-dtype mapping applied while parsing.
+        usecols (list): The optional subset of columns to parse; all others are skipped.
+        engine (str): The CSV parser, "c" or the multi-threaded "pyarrow".
+        dtype_backend (str): "numpy" for NumPy-backed columns or "pyarrow" for Arrow-backed ones.
+        """
+        _check_parse_options(engine, dtype_backend)
+        self.dtype = dtype
+        self.usecols = usecols
+        self.engine = engine
+        self.dtype_backend = dtype_backend
+
+    def ingest(self, file_path: str) -> pd.DataFrame:
+        """Reads a .csv file into a pandas DataFrame."""
+        return self.ingest_subset(file_path)
+
+    def ingest_subset(
+        self, file_path: str, columns: list = None, row_mask: np.ndarray = None
+    ) -> pd.DataFrame:
+        """Reads only the given columns and masked rows of a .csv file."""
+        if not file_path.endswith(".csv"):
+            raise ValueError("The provided file is not a .csv file.")
+        usecols = self.usecols if columns is None else columns
+        return _read_csv(file_path, self.dtype, usecols, self.engine, self.dtype_backend, row_mask)
+
+
+# Implement a concrete class for chunked, bounded-memory ZIP Ingestion
+class ChunkedZipDataIngestor(ZipDataIngestor):
+    def __init__(
+        self,
+        member: str = None,
+        dtype: dict = None,
+        usecols: list = None,
+        chunksize: int = 100_000,
+        max_chunk_bytes: int = None,
+        probe_rows: int = 1_000,
+    ):
+        """
+        Initializes the ChunkedZipDataIngestor. Chunks are always read with the C parser,
+        since the Arrow engine parses whole tables at once.
+
+        Only one chunk is alive inside the ingestor at a time. When max_chunk_bytes is set,
+        the row count of each read is adapted to the observed bytes per row, and any chunk
+        that still exceeds the budget is split before it is yielded, so every yielded chunk
+        satisfies chunk.memory_usage(deep=True).sum() <= max_chunk_bytes (down to a single row).
+
+        Parameters:
+        member (str): The name of the CSV member to read when the archive holds several CSVs.
+        dtype (dict): The optional column-to-dtype mapping applied while parsing.
+        usecols (list): The optional subset of columns to parse; all others are skipped.
+        chunksize (int): The maximum number of rows per chunk.
+        max_chunk_bytes (int): The optional in-memory size budget of a single chunk.
+        probe_rows (int): The number of rows read first to estimate bytes per row when
+            max_chunk_bytes is set.
+        """
+        super().__init__(member=member, dtype=dtype, usecols=usecols)
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive number of rows.")
+        self.chunksize = chunksize
+        self.max_chunk_bytes = max_chunk_bytes
+        self.probe_rows = probe_rows
+
+    def _split_to_budget(self, chunk: pd.DataFrame) -> Iterator[pd.DataFrame]:
+        """Yields slices of the chunk whose deep memory usage fits within max_chunk_bytes."""
+        row_bytes = chunk.memory_usage(deep=True).to_numpy().sum()
+        if len(chunk) <= 1 or row_bytes <= self.max_chunk_bytes:
+            yield chunk
+            return
+        middle = len(chunk) // 2
+        yield from self._split_to_budget(chunk.iloc[:middle])
+        yield from self._split_to_budget(chunk.iloc[middle:])
+
+    def ingest(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """Yields the CSV inside a .zip file as DataFrame chunks, streamed from the archive."""
+        if not file_path.endswith(".zip"):
+            raise ValueError("The provided file is not a .zip file.")
+
+        rows = self.chunksize
+        if self.max_chunk_bytes is not None:
+            rows = min(self.chunksize, self.probe_rows)
+
         with zipfile.ZipFile(file_path, "r") as zip_ref:
-            zip_ref.extractall("extracted_data")
+            member = self._resolve_member(zip_ref)
+            with zip_ref.open(member) as csv_stream:
+                with pd.read_csv(
+                    csv_stream, dtype=self.dtype, usecols=self.usecols, chunksize=rows
+                ) as reader:
+                    while True:
+                        try:
+                            chunk = reader.get_chunk(rows)
+                        except StopIteration:
+                            return
 
-        # Find the extracted CSV file (assuming there is one CSV file inside the zip)
-        extracted_files = os.listdir("extracted_data")
-        csv_files = [f for f in extracted_files if f.endswith(".csv")]
+                        if self.max_chunk_bytes is None:
+                            yield chunk
+                            continue
 
-        if len(csv_files) == 0:
-            raise FileNotFoundError("No CSV file found in the extracted data.")
-        if len(csv_files) > 1:
-            raise ValueError("Multiple CSV files found. Please specify which one to use.")
+                        # Adapt the next read to the observed width of the rows
+                        chunk_bytes = chunk.memory_usage(deep=True).to_numpy().sum()
+                        bytes_per_row = max(chunk_bytes / max(len(chunk), 1), 1.0)
+                        budget_rows = max(1, int(self.max_chunk_bytes // bytes_per_row))
+                        rows = min(self.chunksize, budget_rows)
+                        yield from self._split_to_budget(chunk)
+                        del chunk
 
-        # Read the CSV into a DataFrame
-        csv_file_path = os.path.join("extracted_data", csv_files[0])
-        df = pd.read_csv(csv_file_path)
 
-        # Return the DataFrame
+def _ingest_shard(shard_path: str, **options) -> pd.DataFrame:
+    """Ingests a single shard; defined at module level so worker processes can unpickle it."""
+    file_extension = os.path.splitext(shard_path)[1]
+    ingestor = DataIngestorFactory.get_data_ingestor(file_extension, **options)
+    return ingestor.ingest(shard_path)
+
+
+# Implement a concrete class for parallel multi-shard Ingestion
+class ShardedDataIngestor(DataIngestor):
+    SHARD_EXTENSIONS = (".zip", ".csv")
+
+    def __init__(
+        self,
+        member: str = None,
+        dtype: dict = None,
+        usecols: list = None,
+        engine: str = "c",
+        dtype_backend: str = "numpy",
+        max_workers: int = None,
+    ):
+        """
+        Initializes the ShardedDataIngestor.
+
+        Parameters:
+        member (str): The name of the CSV member to read from each ZIP shard.
+        dtype (dict): The optional column-to-dtype mapping applied while parsing.
+        usecols (list): The optional subset of columns to parse; all others are skipped.
+        engine (str): The CSV parser used for each shard, "c" or "pyarrow".
+        dtype_backend (str): "numpy" for NumPy-backed columns or "pyarrow" for Arrow-backed ones.
+        max_workers (int): The number of worker processes. Defaults to the number of CPUs.
+        """
+        _check_parse_options(engine, dtype_backend)
+        self.member = member
+        self.dtype = dtype
+        self.usecols = usecols
+        self.engine = engine
+        self.dtype_backend = dtype_backend
+        self.max_workers = max_workers
+
+    @staticmethod
+    def is_sharded_path(file_path: str) -> bool:
+        """Returns True if the path names a directory or a glob pattern of shards."""
+        return os.path.isdir(file_path) or glob.has_magic(file_path)
+
+    def _resolve_shards(self, file_path: str) -> list:
+        """Returns the sorted shard paths for a directory or a glob pattern."""
+        if os.path.isdir(file_path):
+            candidates = [os.path.join(file_path, name) for name in os.listdir(file_path)]
+        else:
+            candidates = glob.glob(file_path)
+
+        shards = sorted(path for path in candidates if path.endswith(self.SHARD_EXTENSIONS))
+        if not shards:
+            raise FileNotFoundError(f"No ZIP or CSV shards found for: {file_path}")
+        return shards
+
+    @staticmethod
+    def _check_schema(shards: list, frames: list):
+        """Ensures every shard has the same columns and dtypes as the first one."""
+
+        def dtype_kind(dtype):
+            # Categories legitimately differ between shards and are unified afterwards
+            return "category" if isinstance(dtype, pd.CategoricalDtype) else str(dtype)
+
+        reference = frames[0].dtypes.map(dtype_kind)
+        for shard_path, frame in zip(shards[1:], frames[1:]):
+            if not frame.columns.equals(reference.index):
+                raise ValueError(
+                    f"Shard '{shard_path}' has columns {frame.columns.tolist()}, "
+                    f"expected {reference.index.tolist()}."
+                )
+            dtypes = frame.dtypes.map(dtype_kind)
+            mismatched = reference.index[dtypes != reference].tolist()
+            if mismatched:
+                raise ValueError(f"Shard '{shard_path}' has mismatched dtypes for: {mismatched}")
+
+    @staticmethod
+    def _unify_categories(frames: list) -> list:
+        """Gives categorical columns the union of categories across shards, so concat keeps them."""
+        categorical_columns = [
+            column
+            for column, dtype in frames[0].dtypes.items()
+            if isinstance(dtype, pd.CategoricalDtype)
+        ]
+        for column in categorical_columns:
+            categories = pd.api.types.union_categoricals(
+                [frame[column] for frame in frames]
+            ).categories
+            for frame in frames:
+                frame[column] = frame[column].cat.set_categories(categories)
+        return frames
+
+    def ingest(self, file_path: str) -> pd.DataFrame:
+        """Parses every shard in a process pool and combines them in sorted shard order."""
+        shards = self._resolve_shards(file_path)
+        logging.info(f"Ingesting {len(shards)} shards from {file_path}.")
+
+        ingest_shard = partial(
+            _ingest_shard,
+            member=self.member,
+            dtype=self.dtype,
+            usecols=self.usecols,
+            engine=self.engine,
+            dtype_backend=self.dtype_backend,
+        )
+        if len(shards) == 1:
+            frames = [ingest_shard(shards[0])]
+        else:
+            # map() returns results in submission order, so the row order is deterministic
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                frames = list(executor.map(ingest_shard, shards))
+
+        self._check_schema(shards, frames)
+        frames = self._unify_categories(frames)
+        return pd.concat(frames, ignore_index=True)
+
+
+# Implement a concrete class for SQL Ingestion with server-side cursors
+class SQLDataIngestor(DataIngestor):
+    def __init__(
+        self, query: str, fetch_size: int = 10_000, dtype: dict = None, usecols: list = None
+    ):
+        """
+        Initializes the SQLDataIngestor.
+
+        Results are streamed through a server-side cursor where the driver supports one
+        (psycopg2 uses a named cursor), fetch_size rows at a time. Each fetched batch is
+        transposed once into per-column arrays of the declared dtype, so no per-row
+        dicts or Series are built.
+
+        Parameters:
+        query (str): The SQL query whose result set is ingested.
+        fetch_size (int): The number of rows fetched from the cursor per round trip.
+        dtype (dict): The optional column-to-dtype mapping used to build each column.
+        usecols (list): The optional subset of columns to fetch. The query is wrapped in a
+            SELECT of these columns, so the others are never sent by the database.
+        """
+        if fetch_size < 1:
+            raise ValueError("fetch_size must be a positive number of rows.")
+        self.query = query
+        self.fetch_size = fetch_size
+        self.dtype = dtype or {}
+        self.usecols = usecols
+
+    def _to_array(self, column: str, values: tuple) -> np.ndarray:
+        """Converts one batch of a column into an array of its declared dtype."""
+        dtype = self.dtype.get(column)
+        if dtype is None or dtype == "category":
+            return np.array(values, dtype=object)
+        if np.dtype(dtype).kind in "iu" and None in values:
+            # NULLs do not fit an integer array; the column becomes a nullable one
+            return np.array(values, dtype=object)
+        return np.array(values, dtype=dtype)
+
+    def _to_series(self, column: str, chunks: list) -> pd.Series:
+        """Concatenates the batches of a column into a single typed Series."""
+        dtype = self.dtype.get(column)
+        if chunks:
+            values = np.concatenate(chunks)
+        else:
+            # An empty result set still gets the declared dtypes
+            values = np.array([], dtype=object if dtype in (None, "category") else dtype)
+        if dtype == "category":
+            return pd.Series(pd.Categorical(values), name=column)
+        if dtype is None:
+            return pd.Series(values, name=column).infer_objects()
+        if values.dtype == object:
+            # Integer columns with NULLs use the nullable integer dtype of the same width
+            integer = np.dtype(dtype)
+            nullable = f"{'UInt' if integer.kind == 'u' else 'Int'}{integer.itemsize * 8}"
+            return pd.Series(pd.array(values, dtype=nullable), name=column)
+        return pd.Series(values, name=column)
+
+    def ingest(self, file_path: str) -> pd.DataFrame:
+        """Streams the query result from the database URL in file_path into a DataFrame."""
+        engine = create_engine(file_path)
+        query = self.query
+        if self.usecols is not None:
+            quote = engine.dialect.identifier_preparer.quote
+            selected = ", ".join(quote(column) for column in self.usecols)
+            query = f"SELECT {selected} FROM ({self.query}) AS source"
+        try:
+            with engine.connect() as connection:
+                result = connection.execution_options(
+                    stream_results=True, max_row_buffer=self.fetch_size
+                ).execute(text(query))
+                columns = list(result.keys())
+                column_chunks = {column: [] for column in columns}
+
+                for batch in result.partitions(self.fetch_size):
+                    # Transpose the batch of row tuples into one tuple per column
+                    for column, values in zip(columns, zip(*batch)):
+                        column_chunks[column].append(self._to_array(column, values))
+        finally:
+            engine.dispose()
+
+        logging.info(f"Fetched {len(columns)} columns in batches of {self.fetch_size} rows.")
+        return pd.concat(
+            [self._to_series(column, column_chunks[column]) for column in columns], axis=1
+        )
+
+
+# Implement a caching decorator around any file-based DataIngestor
+class CachedDataIngestor(DataIngestor):
+    def __init__(
+        self,
+        ingestor: DataIngestor,
+        cache_dir: str = ".ingestion_cache",
+        max_cache_bytes: int = 2 * 1024**3,
+    ):
+        """
+        Initializes the CachedDataIngestor.
+
+        Parsed frames are stored as Parquet files keyed by the SHA-256 of the source file
+        and the parse options of the wrapped ingestor, so an unchanged archive is only parsed once.
+
+        Parameters:
+        ingestor (DataIngestor): The ingestor used on a cache miss.
+        cache_dir (str): The directory holding the cached Parquet files.
+        max_cache_bytes (int): The total size the cache may grow to before the least
+            recently used entries are evicted.
+        """
+        self.ingestor = ingestor
+        self.cache_dir = cache_dir
+        self.max_cache_bytes = max_cache_bytes
+
+    @staticmethod
+    def _file_digest(file_path: str, block_size: int = 1024 * 1024) -> str:
+        """Returns the SHA-256 hex digest of the file contents."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _options_digest(self) -> str:
+        """Returns a digest of the wrapped ingestor's type and parse options."""
+        options = {"ingestor": type(self.ingestor).__name__, "options": vars(self.ingestor)}
+        encoded = json.dumps(options, sort_keys=True, default=repr).encode()
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def _source_tag(self, file_path: str) -> str:
+        """Returns a short tag identifying the source file path, used for invalidation."""
+        return hashlib.sha256(os.path.abspath(file_path).encode()).hexdigest()[:16]
+
+    def _entries(self) -> list:
+        """Returns the cached Parquet files, least recently used first."""
+        entries = [
+            os.path.join(self.cache_dir, name)
+            for name in os.listdir(self.cache_dir)
+            if name.endswith(".parquet")
+        ]
+        return sorted(entries, key=os.path.getmtime)
+
+    def _invalidate(self, source_tag: str, options_digest: str, keep: str):
+        """Removes entries for the same source and options that were built from older contents."""
+        prefix = f"{source_tag}-{options_digest}-"
+        for entry in self._entries():
+            if os.path.basename(entry).startswith(prefix) and entry != keep:
+                logging.info(f"Invalidating stale ingestion cache entry: {entry}")
+                os.remove(entry)
+
+    def _evict(self):
+        """Evicts least recently used entries until the cache fits within max_cache_bytes."""
+        entries = self._entries()
+        total = sum(os.path.getsize(entry) for entry in entries)
+        while entries and total > self.max_cache_bytes:
+            entry = entries.pop(0)
+            total -= os.path.getsize(entry)
+            logging.info(f"Evicting ingestion cache entry: {entry}")
+            os.remove(entry)
+
+    def _entry(self, file_path: str) -> str:
+        """Returns the cache entry for the file's current contents, removing stale entries."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        source_tag = self._source_tag(file_path)
+        options_digest = self._options_digest()
+        content_digest = self._file_digest(file_path)
+        entry = os.path.join(
+            self.cache_dir, f"{source_tag}-{options_digest}-{content_digest}.parquet"
+        )
+        self._invalidate(source_tag, options_digest, keep=entry)
+        return entry
+
+    def ingest_subset(
+        self, file_path: str, columns: list = None, row_mask: np.ndarray = None
+    ) -> pd.DataFrame:
+        """
+        Reads only the given columns of the cached frame, or of the file on a cache miss.
+        Subsets are not cached themselves.
+        """
+        entry = self._entry(file_path)
+        if not os.path.exists(entry):
+            return self.ingestor.ingest_subset(file_path, columns=columns, row_mask=row_mask)
+
+        logging.info(f"Loading ingested data from cache: {entry}")
+        df = pd.read_parquet(entry, columns=columns)
+        os.utime(entry)
+        if row_mask is not None:
+            df = df[row_mask].reset_index(drop=True)
+        return df
+
+    def ingest(self, file_path: str) -> pd.DataFrame:
+        """Returns the cached frame for the file if present, otherwise ingests and caches it."""
+        entry = self._entry(file_path)
+
+        if os.path.exists(entry):
+            logging.info(f"Loading ingested data from cache: {entry}")
+            df = pd.read_parquet(entry)
+            # Refresh the modification time so eviction treats the entry as recently used
+            os.utime(entry)
+            return df
+
+        logging.info(f"Ingestion cache miss for {file_path}. Parsing the source file.")
+        df = self.ingestor.ingest(file_path)
+
+        # Write to a temporary file first so concurrent runs never read a partial entry
+        tmp_entry = f"{entry}.{uuid.uuid4().hex}.tmp"
+        df.to_parquet(tmp_entry, index=False)
+        os.replace(tmp_entry, entry)
+        self._evict()
         return df
 
 
+# Implement an incremental decorator that only emits rows past a stored watermark
+class IncrementalDataIngestor(DataIngestor):
+    WATERMARKS = ("period", "pid")
+
+    # The columns each watermark kind is computed from
+    WATERMARK_COLUMNS = {"period": ["Yr Sold", "Mo Sold"], "pid": ["PID"]}
+
+    def __init__(
+        self,
+        ingestor: DataIngestor,
+        state_dir: str = ".incremental_state",
+        watermark: str = "period",
+    ):
+        """
+        Initializes the IncrementalDataIngestor.
+
+        With watermark="period", the watermark is the latest (Yr Sold, Mo Sold) already
+        processed, and only later sales are emitted; late rows for an already processed month
+        are not picked up. With watermark="pid", the set of processed PIDs is stored instead,
+        and every unseen PID is emitted.
+
+        The watermark only advances in commit(), once the new rows have been processed, so a
+        failed run re-emits the same rows next time. Besides the rows as ingested, commit()
+        can store them engineered, with the fitted feature engineer, so later runs only
+        transform their own new rows.
+
+        Parameters:
+        ingestor (DataIngestor): The ingestor that reads the source.
+        state_dir (str): The directory holding the watermark and the processed parts.
+        watermark (str): The watermark kind, "period" or "pid".
+        """
+        if watermark not in self.WATERMARKS:
+            raise ValueError(f"Unsupported watermark '{watermark}'. Choose from {self.WATERMARKS}.")
+        self.ingestor = ingestor
+        self.state_dir = state_dir
+        self.watermark = watermark
+
+    @property
+    def _state_path(self) -> str:
+        return os.path.join(self.state_dir, "state.json")
+
+    @property
+    def _pids_path(self) -> str:
+        return os.path.join(self.state_dir, "seen_pids.npy")
+
+    @staticmethod
+    def _periods(df: pd.DataFrame) -> np.ndarray:
+        """Returns each sale's month as a single sortable integer."""
+        years = df["Yr Sold"].to_numpy(dtype=np.int64)
+        months = df["Mo Sold"].to_numpy(dtype=np.int64)
+        return years * 12 + months - 1
+
+    def _load_state(self) -> dict:
+        state = {"watermark": None, "parts": [], "engineered_parts": [], "engineer": None}
+        if os.path.exists(self._state_path):
+            with open(self._state_path) as f:
+                state.update(json.load(f))
+        return state
+
+    def _save_state(self, state: dict):
+        # Write to a temporary file first so a crash never leaves a partial state file
+        tmp_path = f"{self._state_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self._state_path)
+
+    def _seen_pids(self) -> np.ndarray:
+        if not os.path.exists(self._pids_path):
+            return np.array([], dtype=np.int64)
+        return np.load(self._pids_path)
+
+    def _new_rows(self, keys: pd.DataFrame) -> np.ndarray:
+        """Returns the mask of the rows past the watermark, given the watermark columns."""
+        if self.watermark == "period":
+            watermark = self._load_state()["watermark"]
+            if watermark is None:
+                return np.ones(len(keys), dtype=bool)
+            return self._periods(keys) > watermark
+        return ~np.isin(keys["PID"].to_numpy(dtype=np.int64), self._seen_pids())
+
+    def processed_parts(self, engineered: bool = False) -> list:
+        """
+        Returns the paths of the previously processed parts, oldest first.
+
+        Parameters:
+        engineered (bool): Whether to return the engineered parts rather than the rows as
+            ingested.
+
+        Returns:
+        list: The part paths.
+        """
+        state = self._load_state()
+        return list(state["engineered_parts" if engineered else "parts"])
+
+    def ingest(self, file_path: str) -> pd.DataFrame:
+        """
+        Returns only the rows past the stored watermark.
+
+        Only the watermark columns are read for every row. The full rows are then read for
+        the new rows alone, so ingestors that skip rows while parsing, like the ZIP and CSV
+        ingestors with the C parser, never convert the processed rows.
+        """
+        columns = self.WATERMARK_COLUMNS[self.watermark]
+        keys = self.ingestor.ingest_subset(file_path, columns=columns)
+        new_rows = self._new_rows(keys)
+        delta = self.ingestor.ingest_subset(file_path, row_mask=new_rows)
+        logging.info(f"Incremental ingestion found {len(delta)} new rows out of {len(keys)}.")
+        return delta
+
+    def load_engineer(self, spec: dict, refit_every: int = None):
+        """
+        Returns the stored feature engineer if it can transform the new rows as it is.
+
+        Parameters:
+        spec (dict): The JSON-serializable settings the engineer must have been fitted with,
+            such as the transform spec and the precision.
+        refit_every (int): The optional number of committed increments after which the stored
+            engineer is no longer reused, so the transforms are refitted on a schedule.
+
+        Returns:
+        The fitted engineer, or None when none is stored, it was fitted with other settings or
+        a refit is due.
+        """
+        state = self._load_state()
+        stored = state["engineer"]
+        if stored is None or stored["spec"] != json.loads(json.dumps(spec)):
+            return None
+        if refit_every is not None and len(state["parts"]) - stored["parts"] >= refit_every:
+            logging.info(f"{refit_every} increments were committed since the last fit; refitting.")
+            return None
+        with open(stored["path"], "rb") as f:
+            return pickle.load(f)
+
+    @staticmethod
+    def combine_parts(part_paths: list, delta: pd.DataFrame) -> pd.DataFrame:
+        """
+        Combines the stored parts with the new rows into the accumulated data.
+
+        Categorical columns are recategorized over all rows, since concatenating parts with
+        different categories would otherwise turn them into object columns.
+
+        Parameters:
+        part_paths (list): The paths of the previously committed parts, as ingested or
+            engineered.
+        delta (pd.DataFrame): The new rows.
+
+        Returns:
+        pd.DataFrame: Every committed row followed by the new rows.
+        """
+        parts = [
+            pd.read_pickle(part_path) if part_path.endswith(".pkl") else pd.read_parquet(part_path)
+            for part_path in part_paths
+        ]
+        combined = pd.concat(parts + [delta], ignore_index=True)
+        for column, dtype in delta.dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                combined[column] = combined[column].astype("category")
+        return combined
+
+    def commit(
+        self,
+        delta: pd.DataFrame,
+        engineered: pd.DataFrame = None,
+        engineer=None,
+        spec: dict = None,
+        refitted: bool = False,
+    ) -> str:
+        """
+        Stores the new rows as a part and advances the watermark.
+
+        The engineered rows are stored too when given, as a pickle, since engineered frames
+        may hold sparse columns that Parquet cannot store. After a refit they replace every
+        stored engineered part, and the refitted engineer is stored with its settings.
+
+        Parameters:
+        delta (pd.DataFrame): The new rows, as ingested.
+        engineered (pd.DataFrame): The optional engineered rows: the new rows only, or every
+            accumulated row after a refit.
+        engineer: The fitted feature engineer, stored after a refit.
+        spec (dict): The settings the engineer was fitted with, as passed to load_engineer.
+        refitted (bool): Whether the engineer was refitted in this run.
+
+        Returns:
+        str: The path of the written part, or None when there were no new rows.
+        """
+        if delta.empty and not refitted:
+            logging.info("No new rows to commit; the watermark is unchanged.")
+            return None
+
+        os.makedirs(os.path.join(self.state_dir, "parts"), exist_ok=True)
+        state = self._load_state()
+        # Written before the state, so the files it names always exist
+        part_path = None
+        if not delta.empty:
+            part_path = os.path.join(self.state_dir, "parts", f"part-{uuid.uuid4().hex}.parquet")
+            delta.to_parquet(part_path, index=False)
+            state["parts"].append(part_path)
+
+        replaced = []
+        if engineered is not None:
+            engineered_path = os.path.join(
+                self.state_dir, "parts", f"engineered-{uuid.uuid4().hex}.pkl"
+            )
+            engineered.to_pickle(engineered_path)
+            if refitted:
+                replaced = state["engineered_parts"]
+                state["engineered_parts"] = []
+            state["engineered_parts"].append(engineered_path)
+
+        if refitted:
+            engineer_path = os.path.join(self.state_dir, f"engineer-{uuid.uuid4().hex}.pkl")
+            with open(engineer_path, "wb") as f:
+                pickle.dump(engineer, f)
+            if state["engineer"] is not None:
+                replaced.append(state["engineer"]["path"])
+            state["engineer"] = {
+                "path": engineer_path,
+                "spec": json.loads(json.dumps(spec)),
+                "parts": len(state["parts"]),
+            }
+
+        if not delta.empty:
+            if self.watermark == "period":
+                latest = int(self._periods(delta).max())
+                if state["watermark"] is not None:
+                    latest = max(state["watermark"], latest)
+                state["watermark"] = latest
+            else:
+                pids = np.union1d(self._seen_pids(), delta["PID"].to_numpy(dtype=np.int64))
+                np.save(self._pids_path, pids)
+
+        self._save_state(state)
+        # The replaced files are only removed once the state no longer names them
+        for path in replaced:
+            os.remove(path)
+        if part_path is None:
+            logging.info("No new rows; stored the refitted transforms and engineered rows.")
+        else:
+            logging.info(f"Committed {len(delta)} new rows to {part_path}.")
+        return part_path
+
+
 # Implement a Factory to create DataIngestors
 class DataIngestorFactory:
     @staticmethod
-    def get_data_ingestor(file_extension: str) -> DataIngestor:
-        """Returns the appropriate DataIngestor based on file extension."""
+    def get_data_ingestor(
+        file_extension: str,
+        member: str = None,
+        dtype: dict = None,
+        usecols: list = None,
+        engine: str = "c",
+        dtype_backend: str = "numpy",
+        cache_dir: str = None,
+        chunksize: int = None,
+        max_chunk_bytes: int = None,
+    ) -> DataIngestor:
+        """
+        Returns the appropriate DataIngestor based on file extension.
+
+        Passing chunksize selects the chunked ingestor, whose ingest method yields
+        DataFrame chunks instead of returning a single DataFrame.
+        """
+        if file_extension == ".zip" and chunksize is not None:
+            if cache_dir is not None:
+                raise ValueError("The ingestion cache does not support chunked ingestion.")
+            if engine != "c":
+                raise ValueError("Chunked ingestion only supports the 'c' CSV engine.")
+            return ChunkedZipDataIngestor(
+                member=member,
+                dtype=dtype,
+                usecols=usecols,
+                chunksize=chunksize,
+                max_chunk_bytes=max_chunk_bytes,
+            )
         if file_extension == ".zip":
-            return ZipDataIngestor()
+            ingestor = ZipDataIngestor(
+                member=member,
+                dtype=dtype,
+                usecols=usecols,
+                engine=engine,
+                dtype_backend=dtype_backend,
+            )
+        elif file_extension == ".csv":
+            ingestor = CsvDataIngestor(
+                dtype=dtype, usecols=usecols, engine=engine, dtype_backend=dtype_backend
+            )
         else:
             raise ValueError(f"No ingestor available for file extension: {file_extension}")
 
+        # Wrap the ingestor with the columnar cache when a cache directory is configured
+        if cache_dir is not None:
+            ingestor = CachedDataIngestor(ingestor, cache_dir=cache_dir)
+        return ingestor
+
+    @staticmethod
+    def get_data_ingestor_for_path(
+        file_path: str,
+        member: str = None,
+        dtype: dict = None,
+        usecols: list = None,
+        engine: str = "c",
+        dtype_backend: str = "numpy",
+        cache_dir: str = None,
+        max_workers: int = None,
+        query: str = None,
+        fetch_size: int = 10_000,
+    ) -> DataIngestor:
+        """
+        Returns the appropriate DataIngestor for a path.
+
+        Database URLs (e.g. "postgresql://..." or "sqlite:///...") are ingested by running
+        query; directories and glob patterns are ingested as shards in parallel; single files
+        are dispatched on their file extension.
+        """
+        if "://" in file_path:
+            if query is None:
+                raise ValueError("A query is required to ingest from a database URL.")
+            if cache_dir is not None:
+                raise ValueError("The ingestion cache does not support database ingestion.")
+            return SQLDataIngestor(query=query, fetch_size=fetch_size, dtype=dtype, usecols=usecols)
+
+        if ShardedDataIngestor.is_sharded_path(file_path):
+            if cache_dir is not None:
+                raise ValueError("The ingestion cache does not support sharded ingestion.")
+            return ShardedDataIngestor(
+                member=member,
+                dtype=dtype,
+                usecols=usecols,
+                engine=engine,
+                dtype_backend=dtype_backend,
+                max_workers=max_workers,
+            )
+
+        file_extension = os.path.splitext(file_path)[1]
+        return DataIngestorFactory.get_data_ingestor(
+            file_extension,
+            member=member,
+            dtype=dtype,
+            usecols=usecols,
+            engine=engine,
+            dtype_backend=dtype_backend,
+            cache_dir=cache_dir,
+        )
+
 
 # Example usage:
 if __name__ == "__main__":
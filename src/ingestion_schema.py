@@ -0,0 +1,159 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Declared Ingestion Schema for the Ames Housing Dataset
+# ------------------------------------------------------
+# Each column is parsed straight into the narrowest dtype that holds every value safely:
+# int16 for years, ratings and counts, float32 for areas and for integer columns that can
+# be missing, int32 for identifiers and prices, and category for text columns.
+AMES_SCHEMA = {
+    "Order": "int32",
+    "PID": "int32",
+    "MS SubClass": "int16",
+    "MS Zoning": "category",
+    "Lot Frontage": "float32",
+    "Lot Area": "float32",
+    "Street": "category",
+    "Alley": "category",
+    "Lot Shape": "category",
+    "Land Contour": "category",
+    "Utilities": "category",
+    "Lot Config": "category",
+    "Land Slope": "category",
+    "Neighborhood": "category",
+    "Condition 1": "category",
+    "Condition 2": "category",
+    "Bldg Type": "category",
+    "House Style": "category",
+    "Overall Qual": "int16",
+    "Overall Cond": "int16",
+    "Year Built": "int16",
+    "Year Remod/Add": "int16",
+    "Roof Style": "category",
+    "Roof Matl": "category",
+    "Exterior 1st": "category",
+    "Exterior 2nd": "category",
+    "Mas Vnr Type": "category",
+    "Mas Vnr Area": "float32",
+    "Exter Qual": "category",
+    "Exter Cond": "category",
+    "Foundation": "category",
+    "Bsmt Qual": "category",
+    "Bsmt Cond": "category",
+    "Bsmt Exposure": "category",
+    "BsmtFin Type 1": "category",
+    "BsmtFin SF 1": "float32",
+    "BsmtFin Type 2": "category",
+    "BsmtFin SF 2": "float32",
+    "Bsmt Unf SF": "float32",
+    "Total Bsmt SF": "float32",
+    "Heating": "category",
+    "Heating QC": "category",
+    "Central Air": "category",
+    "Electrical": "category",
+    "1st Flr SF": "float32",
+    "2nd Flr SF": "float32",
+    "Low Qual Fin SF": "float32",
+    "Gr Liv Area": "float32",
+    "Bsmt Full Bath": "float32",
+    "Bsmt Half Bath": "float32",
+    "Full Bath": "int16",
+    "Half Bath": "int16",
+    "Bedroom AbvGr": "int16",
+    "Kitchen AbvGr": "int16",
+    "Kitchen Qual": "category",
+    "TotRms AbvGrd": "int16",
+    "Functional": "category",
+    "Fireplaces": "int16",
+    "Fireplace Qu": "category",
+    "Garage Type": "category",
+    "Garage Yr Blt": "float32",
+    "Garage Finish": "category",
+    "Garage Cars": "float32",
+    "Garage Area": "float32",
+    "Garage Qual": "category",
+    "Garage Cond": "category",
+    "Paved Drive": "category",
+    "Wood Deck SF": "float32",
+    "Open Porch SF": "float32",
+    "Enclosed Porch": "float32",
+    "3Ssn Porch": "float32",
+    "Screen Porch": "float32",
+    "Pool Area": "float32",
+    "Pool QC": "category",
+    "Fence": "category",
+    "Misc Feature": "category",
+    "Misc Val": "float32",
+    "Mo Sold": "int16",
+    "Yr Sold": "int16",
+    "Sale Type": "category",
+    "Sale Condition": "category",
+    "SalePrice": "int32",
+}
+
+
+def consumed_columns(target_column: str, features: list = None, schema: dict = None) -> list:
+    """
+    Works out which columns the training pipeline consumes, so ingestion can skip the rest.
+
+    The outlier detection step keeps only numeric columns, so every text column is dropped
+    before splitting and model building. The consumed set is therefore the numeric columns
+    of the schema plus the target and any explicitly engineered features.
+
+    Parameters:
+    target_column (str): The name of the target column.
+    features (list): Additional columns consumed by feature engineering.
+    schema (dict): The column-to-dtype mapping to derive the set from. Defaults to AMES_SCHEMA.
+
+    Returns:
+    list: The consumed column names, in schema order.
+    """
+    schema = AMES_SCHEMA if schema is None else schema
+    required = {target_column, *(features or [])}
+    return [
+        column
+        for column, dtype in schema.items()
+        if column in required or pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dtype))
+    ]
+
+
+def memory_report(df: pd.DataFrame) -> dict:
+    """
+    Reports the memory used by a DataFrame and the memory the same data would use
+    with the dtypes pandas infers by default (int64, float64 and object).
+
+    The default-dtype figure is computed from the narrow frame without converting it:
+    numeric columns count 8 bytes per value, and categorical columns count one object
+    pointer per row plus the size of the Python object each row would reference.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame to report on.
+
+    Returns:
+    dict: The narrow memory in bytes, the default-dtype memory in bytes and the fraction saved.
+    """
+    memory_bytes = int(df.memory_usage(deep=True, index=False).sum())
+
+    inferred_bytes = 0
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Missing values are read as float NaN objects by the default parser;
+            # their code of -1 picks the trailing NaN entry
+            object_sizes = np.array(
+                [sys.getsizeof(value) for value in series.cat.categories] + [sys.getsizeof(np.nan)]
+            )
+            inferred_bytes += 8 * len(series) + int(object_sizes[series.cat.codes.to_numpy()].sum())
+        elif pd.api.types.is_numeric_dtype(series.dtype):
+            inferred_bytes += 8 * len(series)
+        else:
+            inferred_bytes += int(series.memory_usage(deep=True, index=False))
+
+    saved_fraction = 1 - memory_bytes / inferred_bytes if inferred_bytes else 0.0
+    return {
+        "memory_bytes": memory_bytes,
+        "inferred_memory_bytes": inferred_bytes,
+        "saved_fraction": round(saved_fraction, 4),
+    }
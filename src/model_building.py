@@ -2,11 +2,16 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
+import numpy as np
 import pandas as pd
-from sklearn.base import RegressorMixin
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, lsqr
+from sklearn.base import BaseEstimator, RegressorMixin
 from sklearn.linear_model import LinearRegression
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
+from sklearn.utils.validation import check_array, check_is_fitted
+from src.execution_mode import float_dtype
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -59,12 +64,113 @@ class LinearRegressionStrategy(ModelBuildingStrategy):
         )
 
         logging.info("Training Linear Regression model.")
-        pipeline.fit(X_train, y_train)  # Fit the pipeline to the training data
+        # Fit the pipeline to the training data, in the configured precision
+        pipeline.fit(X_train.astype(float_dtype()), y_train)
 
         logging.info("Model training completed.")
         return pipeline
 
 
+# Sparse Least-Squares Linear Regression
+# --------------------------------------
+# Ordinary least squares solved with LSQR, which only needs products with X and X.T, so a
+# CSR matrix of one-hot columns is never densified. The columns are centred and scaled to
+# unit norm implicitly, inside the matrix products: centring a sparse matrix would fill it
+# in, and without the scaling LSQR converges slowly when raw areas sit next to 0/1 columns.
+# With the tight default tolerance it matches LinearRegression on well-conditioned data. On
+# nearly collinear columns LSQR stops at its condition limit instead of fitting directions
+# the data barely spans with huge coefficients, as a dense least-squares solve does.
+# LSQR iterates in float64 whatever the dtype of X; the coefficients take the dtype of X.
+class SparseLinearRegression(BaseEstimator, RegressorMixin):
+    def __init__(self, fit_intercept: bool = True, tol: float = 1e-10, max_iter: int = None):
+        """
+        Initializes the SparseLinearRegression.
+
+        Parameters:
+        fit_intercept (bool): Whether to fit an intercept.
+        tol (float): The relative tolerance at which LSQR stops.
+        max_iter (int): The maximum number of LSQR iterations. Defaults to LSQR's own limit.
+        """
+        self.fit_intercept = fit_intercept
+        self.tol = tol
+        self.max_iter = max_iter
+
+    def fit(self, X, y):
+        """
+        Fits the coefficients by least squares.
+
+        Parameters:
+        X (sparse matrix or array-like): The training features.
+        y (array-like): The training target.
+
+        Returns:
+        SparseLinearRegression: The fitted model.
+        """
+        X = check_array(X, accept_sparse="csr", dtype=[np.float64, np.float32])
+        y = np.asarray(y, dtype=np.float64)
+        n_rows, n_columns = X.shape
+
+        if sp.issparse(X):
+            sums = np.bincount(X.indices, weights=X.data, minlength=n_columns)
+        else:
+            sums = X.sum(axis=0, dtype=np.float64)
+        if self.fit_intercept:
+            means = sums / n_rows
+            y_mean = y.mean()
+        else:
+            means = np.zeros(n_columns)
+            y_mean = 0.0
+
+        # The squared norms of the centred columns, summed from the deviations themselves
+        # since the shortcut sum(x**2) - n * mean**2 cancels badly. The implicit zeros of a
+        # sparse column each deviate from its mean by -mean.
+        if sp.issparse(X):
+            deviations = np.square(X.data - means[X.indices])
+            stored = np.bincount(X.indices, minlength=n_columns)
+            centred = np.bincount(X.indices, weights=deviations, minlength=n_columns)
+            centred += (n_rows - stored) * np.square(means)
+        else:
+            centred = np.square(X - means).sum(axis=0, dtype=np.float64)
+
+        # Scale each centred column to unit norm. Constant columns carry nothing once centred,
+        # so they are masked out with a zero scale and get a zero coefficient.
+        norms = np.sqrt(centred)
+        constant = norms <= 1e-8 * np.sqrt(n_rows) * np.abs(means)
+        scales = np.divide(1.0, norms, out=np.zeros(n_columns), where=~constant)
+        shifts = means * scales
+
+        operator = LinearOperator(
+            (n_rows, n_columns),
+            matvec=lambda b: X @ (b * scales) - shifts @ b,
+            rmatvec=lambda r: (X.T @ r) * scales - shifts * r.sum(),
+            dtype=np.float64,
+        )
+        solution, _, self.n_iter_, *_ = lsqr(
+            operator, y - y_mean, atol=self.tol, btol=self.tol, iter_lim=self.max_iter
+        )
+
+        # LSQR iterates in float64; the coefficients are kept in the precision of X
+        coef = solution * scales
+        self.coef_ = coef.astype(X.dtype)
+        self.intercept_ = X.dtype.type(y_mean - means @ coef)
+        self.n_features_in_ = n_columns
+        return self
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Predicts the target.
+
+        Parameters:
+        X (sparse matrix or array-like): The features to predict from.
+
+        Returns:
+        np.ndarray: The predictions.
+        """
+        check_is_fitted(self, "coef_")
+        X = check_array(X, accept_sparse="csr", dtype=[np.float64, np.float32])
+        return np.asarray(X @ self.coef_).ravel() + self.intercept_
+
+
 # Context Class for Model Building
 class ModelBuilder:
     def __init__(self, strategy: ModelBuildingStrategy):
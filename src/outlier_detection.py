@@ -5,6 +5,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
+from src.execution_mode import working_copy
+from src.quantile_sketch import ColumnQuantileSketch
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -24,6 +26,21 @@ class OutlierDetectionStrategy(ABC):
         """
         pass
 
+    def detect_outlier_rows(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Detects the rows with an outlier in any column of the given DataFrame.
+
+        Strategies override this to check one column at a time, so only a row mask is kept
+        instead of a boolean frame of the full shape.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features for outlier detection.
+
+        Returns:
+        np.ndarray: A boolean array with one entry per row, True for outlier rows.
+        """
+        return self.detect_outliers(df).to_numpy().any(axis=1)
+
 
 # Concrete Strategy for Z-Score Based Outlier Detection
 class ZScoreOutlierDetection(OutlierDetectionStrategy):
@@ -32,25 +49,98 @@ class ZScoreOutlierDetection(OutlierDetectionStrategy):
 
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         logging.info("Detecting outliers using the Z-score method.")
-        z_scores = np.abs((df - df.mean()) / df.std())
-        outliers = z_scores > self.threshold
+        # The z-scores are computed in place in one float64 buffer, instead of allocating a
+        # full frame for each of the subtraction, division and absolute value
+        means, stds = df.mean().to_numpy(), df.std().to_numpy()
+        z_scores = df.to_numpy(dtype=np.float64, na_value=np.nan)
+        z_scores -= means
+        z_scores /= stds
+        np.abs(z_scores, out=z_scores)
+        outliers = pd.DataFrame(z_scores > self.threshold, index=df.index, columns=df.columns)
         logging.info(f"Outliers detected with Z-score threshold: {self.threshold}.")
         return outliers
 
+    def detect_outlier_rows(self, df: pd.DataFrame) -> np.ndarray:
+        logging.info("Detecting outlier rows using the Z-score method.")
+        means, stds = df.mean().to_numpy(), df.std().to_numpy()
+        outlier_rows = np.zeros(len(df), dtype=bool)
+        # One column buffer at a time, with the same arithmetic as detect_outliers
+        for position, column in enumerate(df.columns):
+            z_scores = df[column].to_numpy(dtype=np.float64, na_value=np.nan) - means[position]
+            z_scores /= stds[position]
+            np.abs(z_scores, out=z_scores)
+            outlier_rows |= z_scores > self.threshold
+        logging.info(
+            f"{outlier_rows.sum()} outlier rows detected with Z-score threshold: {self.threshold}."
+        )
+        return outlier_rows
+
 
 # Concrete Strategy for IQR Based Outlier Detection
+# The quartiles come from an exact quantile call, or from a KLL sketch of each column built
+# in one streaming pass. A sketch built beforehand over every chunk or partition of the data
+# can be passed in, so each chunk is checked against the quartiles of all the data.
 class IQROutlierDetection(OutlierDetectionStrategy):
+    def __init__(
+        self,
+        backend="exact",
+        sketch_size=200,
+        seed=None,
+        sketch: ColumnQuantileSketch = None,
+    ):
+        """
+        Initializes the IQROutlierDetection with the backend of its quartiles.
+
+        Parameters:
+        backend (str): "exact" for DataFrame.quantile, "sketch" for KLL sketch estimates.
+        sketch_size (int): The KLL sketch size per column of the sketch backend.
+        seed (int): The seed of the sketches, for reproducible quartiles.
+        sketch (ColumnQuantileSketch): A sketch of the data to take the quartiles from,
+            e.g. one merged over all chunks. It implies the sketch backend.
+        """
+        if backend not in ("exact", "sketch"):
+            raise ValueError(f"Unsupported quantile backend: {backend}")
+        self.backend = backend
+        self.sketch_size = sketch_size
+        self.seed = seed
+        self.sketch = sketch
+
+    def _quartiles(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Returns the first and third quartiles of every column, one row each."""
+        if self.sketch is not None:
+            return self.sketch.quantile([0.25, 0.75], df.columns)
+        if self.backend == "sketch":
+            sketch = ColumnQuantileSketch(self.sketch_size, self.seed).update(df)
+            return sketch.quantile([0.25, 0.75])
+        # Both quartiles of every column come from a single quantile call
+        return df.quantile([0.25, 0.75])
+
     def detect_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         logging.info("Detecting outliers using the IQR method.")
-        Q1 = df.quantile(0.25)
-        Q3 = df.quantile(0.75)
+        quartiles = self._quartiles(df)
+        Q1, Q3 = quartiles.iloc[0], quartiles.iloc[1]
         IQR = Q3 - Q1
         outliers = (df < (Q1 - 1.5 * IQR)) | (df > (Q3 + 1.5 * IQR))
         logging.info("Outliers detected using the IQR method.")
         return outliers
 
+    def detect_outlier_rows(self, df: pd.DataFrame) -> np.ndarray:
+        logging.info("Detecting outlier rows using the IQR method.")
+        quartiles = self._quartiles(df).to_numpy()
+        IQR = quartiles[1] - quartiles[0]
+        lower, upper = quartiles[0] - 1.5 * IQR, quartiles[1] + 1.5 * IQR
+        outlier_rows = np.zeros(len(df), dtype=bool)
+        for position, column in enumerate(df.columns):
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            outlier_rows |= (values < lower[position]) | (values > upper[position])
+        logging.info(f"{outlier_rows.sum()} outlier rows detected using the IQR method.")
+        return outlier_rows
+
 
 # Context Class for Outlier Detection and Handling
+# Detection and handling can be scoped to a set of columns. The outlier rows are kept as a
+# row mask, which can be detected once and passed to handle_outliers, so the data is not
+# scanned again to remove them.
 class OutlierDetector:
     def __init__(self, strategy: OutlierDetectionStrategy):
         self._strategy = strategy
@@ -63,14 +153,64 @@ class OutlierDetector:
         logging.info("Executing outlier detection strategy.")
         return self._strategy.detect_outliers(df)
 
-    def handle_outliers(self, df: pd.DataFrame, method="remove", **kwargs) -> pd.DataFrame:
-        outliers = self.detect_outliers(df)
+    def detect_outlier_rows(self, df: pd.DataFrame, columns: list = None) -> np.ndarray:
+        """
+        Detects the rows with an outlier in any of the given columns.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing features for outlier detection.
+        columns (list): The columns to check. Defaults to all columns.
+
+        Returns:
+        np.ndarray: A boolean array with one entry per row, True for outlier rows.
+        """
+        logging.info("Executing outlier row detection strategy.")
+        return self._strategy.detect_outlier_rows(df if columns is None else df[columns])
+
+    def handle_outliers(
+        self,
+        df: pd.DataFrame,
+        method="remove",
+        columns: list = None,
+        outlier_rows: np.ndarray = None,
+        sketch: ColumnQuantileSketch = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Removes the outlier rows or caps the outlying values of the given columns.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to clean.
+        method (str): "remove" to drop outlier rows, "cap" to clip values to their 1st and
+            99th percentiles.
+        columns (list): The columns to check or cap. Defaults to all columns.
+        outlier_rows (np.ndarray): A row mask from detect_outlier_rows, to remove without
+            detecting again.
+        sketch (ColumnQuantileSketch): A sketch of the data to take the percentiles of the
+            "cap" method from, e.g. one merged over all chunks. Defaults to exact percentiles.
+
+        Returns:
+        pd.DataFrame: The cleaned dataframe.
+        """
         if method == "remove":
+            if outlier_rows is None:
+                outlier_rows = self.detect_outlier_rows(df, columns)
             logging.info("Removing outliers from the dataset.")
-            df_cleaned = df[(~outliers).all(axis=1)]
+            df_cleaned = df[~outlier_rows]
         elif method == "cap":
+            # Capping needs only the percentiles, not the outliers of the strategy
             logging.info("Capping outliers in the dataset.")
-            df_cleaned = df.clip(lower=df.quantile(0.01), upper=df.quantile(0.99), axis=1)
+            capped = df if columns is None else df[columns]
+            if sketch is None:
+                percentiles = capped.quantile([0.01, 0.99])
+            else:
+                percentiles = sketch.quantile([0.01, 0.99], capped.columns)
+            capped = capped.clip(lower=percentiles.iloc[0], upper=percentiles.iloc[1], axis=1)
+            if columns is None:
+                df_cleaned = capped
+            else:
+                df_cleaned = working_copy(df)
+                df_cleaned[columns] = capped
         else:
             logging.warning(f"Unknown method '{method}'. No outlier handling performed.")
             return df
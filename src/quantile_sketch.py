@@ -0,0 +1,188 @@
+import copy
+
+import numpy as np
+import pandas as pd
+
+# KLL Quantile Sketch
+# -------------------
+# A mergeable sketch that answers quantile queries over a stream in bounded memory.
+# Items live in levels of compactors; an item at level h stands for 2**h stream values.
+# When a level overflows its capacity it is sorted and every other item (from a random
+# offset) is promoted to the next level, halving its size. Capacities shrink geometrically
+# towards the lower levels, so the sketch keeps O(k) items and its rank error is O(1/k).
+#
+# Updates are batched: a whole array is appended to level 0 and compacted with numpy
+# sorts and strided slices, so there is no per-value Python work.
+
+
+class KLLSketch:
+    def __init__(self, k: int = 200, seed: int = None):
+        """
+        Initializes an empty KLLSketch.
+
+        Parameters:
+        k (int): The capacity of the top level. Larger values trade memory for accuracy.
+        seed (int): The seed of the random compaction offsets, for reproducible sketches.
+        """
+        self.k = k
+        self.n = 0
+        self._rng = np.random.default_rng(seed)
+        self._levels = [np.empty(0)]
+
+    def _capacity(self, level: int) -> int:
+        """Returns the capacity of a level, shrinking by 2/3 per level below the top."""
+        depth = len(self._levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        """Compacts every level that exceeds its capacity, from the bottom up."""
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays at this level, so promoted items always come in pairs
+                keep = len(items) % 2
+                promoted = items[keep + self._rng.integers(2) :: 2]
+                self._levels[level] = items[:keep]
+                self._levels[level + 1] = np.concatenate((self._levels[level + 1], promoted))
+            level += 1
+
+    def update(self, values) -> "KLLSketch":
+        """
+        Adds a batch of values to the sketch. NaNs are ignored.
+
+        Parameters:
+        values (array-like): The values to add.
+
+        Returns:
+        KLLSketch: The updated sketch.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if values.size:
+            self.n += values.size
+            self._levels[0] = np.concatenate((self._levels[0], values))
+            self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Merges another sketch into this one, e.g. one built on another chunk or worker.
+
+        Parameters:
+        other (KLLSketch): The sketch to merge in. It is left unchanged.
+
+        Returns:
+        KLLSketch: The merged sketch.
+        """
+        for level, items in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[level] = np.concatenate((self._levels[level], items))
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Estimates one or more quantiles of the values seen so far, interpolating linearly
+        between ranks like DataFrame.quantile. Until the first compaction every value is
+        retained and the estimates are exact.
+
+        Parameters:
+        q (float or array-like): The quantiles to estimate, in [0, 1].
+
+        Returns:
+        float or np.ndarray: The estimated quantiles, NaN when the sketch is empty.
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if self.n == 0:
+            return np.full(q.shape, np.nan)[()]
+
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(len(level_items), 2**level) for level, level_items in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items, weights = items[order], weights[order]
+        # An item stands for a run of 2**level ranks and is placed at the middle of its run
+        centers = np.cumsum(weights) - (weights + 1) / 2
+        return np.interp(q * (self.n - 1), centers, items)[()]
+
+    @property
+    def size(self) -> int:
+        """The number of items the sketch currently retains."""
+        return sum(len(items) for items in self._levels)
+
+
+# Column-wise Quantile Sketch
+# ---------------------------
+# One KLLSketch per column of a DataFrame, so every quantile of every column is answered
+# after a single pass over the data. Chunks are added one at a time and sketches of separate
+# partitions are merged, so the data never has to be in memory at once.
+class ColumnQuantileSketch:
+    def __init__(self, k: int = 200, seed: int = None):
+        """
+        Initializes an empty ColumnQuantileSketch.
+
+        Parameters:
+        k (int): The KLL sketch size per column.
+        seed (int): The seed of the sketches, for reproducible quantiles.
+        """
+        self.k = k
+        self.seed = seed
+        self.sketches = {}
+
+    def update(self, df: pd.DataFrame) -> "ColumnQuantileSketch":
+        """
+        Adds a chunk of rows to the sketches of its columns.
+
+        Parameters:
+        df (pd.DataFrame): The numeric chunk to add.
+
+        Returns:
+        ColumnQuantileSketch: The updated sketch.
+        """
+        for column in df.columns:
+            if column not in self.sketches:
+                self.sketches[column] = KLLSketch(self.k, self.seed)
+            self.sketches[column].update(df[column].to_numpy(dtype=np.float64, na_value=np.nan))
+        return self
+
+    def merge(self, other: "ColumnQuantileSketch") -> "ColumnQuantileSketch":
+        """
+        Merges another sketch into this one, e.g. one built on another partition.
+
+        Parameters:
+        other (ColumnQuantileSketch): The sketch to merge in. It is left unchanged.
+
+        Returns:
+        ColumnQuantileSketch: The merged sketch.
+        """
+        for column, sketch in other.sketches.items():
+            if column in self.sketches:
+                self.sketches[column].merge(sketch)
+            else:
+                self.sketches[column] = copy.deepcopy(sketch)
+        return self
+
+    def quantile(self, q: list, columns: list = None) -> pd.DataFrame:
+        """
+        Estimates quantiles of each column.
+
+        Parameters:
+        q (list): The quantiles to estimate, in [0, 1].
+        columns (list): The columns to estimate them for. Defaults to every sketched column.
+
+        Returns:
+        pd.DataFrame: One row per quantile and one column per column, like DataFrame.quantile
+        with a list of quantiles.
+        """
+        columns = list(self.sketches) if columns is None else list(columns)
+        return pd.DataFrame(
+            {column: np.atleast_1d(self.sketches[column].quantile(q)) for column in columns},
+            index=pd.Index(q, dtype=np.float64),
+        )
@@ -0,0 +1,36 @@
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from src.feature_engineering import FeatureEngineer
+from src.ingest_data import IncrementalDataIngestor
+from zenml import step
+
+
+@step(enable_cache=False)
+def commit_increment_step(
+    new_data: pd.DataFrame,
+    engineered_data: pd.DataFrame,
+    feature_engineer: FeatureEngineer,
+    refitted: bool,
+    trained_model: Pipeline,
+    transforms: list,
+    state_dir: str = ".incremental_state",
+    watermark: str = "period",
+    precision: str = "float64",
+):
+    """
+    Stores the new rows, as ingested and engineered, and advances the watermark.
+
+    The trained model is only taken so this step runs once the model is built: a run that
+    fails before then leaves the watermark where it was, and the next run re-emits its rows.
+    The new rows are the last rows of `engineered_data`; after a refit every row is stored,
+    replacing the previously engineered parts, together with the refitted engineer.
+    """
+    data_ingestor = IncrementalDataIngestor(ingestor=None, state_dir=state_dir, watermark=watermark)
+    engineered = engineered_data if refitted else engineered_data.tail(len(new_data))
+    data_ingestor.commit(
+        new_data,
+        engineered=engineered,
+        engineer=feature_engineer,
+        spec={"transforms": transforms, "precision": precision},
+        refitted=refitted,
+    )
@@ -1,17 +1,74 @@
+import logging
+import time
+
 import pandas as pd
 from src.ingest_data import DataIngestorFactory
-from zenml import step
+from src.ingestion_schema import AMES_SCHEMA, memory_report
+from zenml import log_artifact_metadata, step
 
 
 @step
-def data_ingestion_step(file_path: str) -> pd.DataFrame:
-    """Ingest data from a ZIP file using the appropriate DataIngestor."""
-    # Determine the file extension
-    file_extension = ".zip"  # Since we're dealing with ZIP files, this is hardcoded
+def data_ingestion_step(
+    file_path: str,
+    member: str = None,
+    cache_dir: str = None,
+    use_schema: bool = True,
+    columns: list = None,
+    max_workers: int = None,
+    engine: str = "c",
+    dtype_backend: str = "numpy",
+    query: str = None,
+    fetch_size: int = 10_000,
+) -> pd.DataFrame:
+    """Ingest data from a ZIP/CSV file, a directory or a glob of shards, or a database.
+
+    Directories and glob patterns are parsed shard by shard in a process pool of
+    max_workers and combined in sorted shard order.
+
+    When cache_dir is set, parsed frames are cached there as Parquet and reused
+    until the archive contents change. When use_schema is set, columns are parsed
+    straight into the narrow dtypes declared in AMES_SCHEMA. When columns is set,
+    only those columns are parsed and the pruned ones are logged with the run.
+
+    engine selects the CSV parser ("c" or the multi-threaded "pyarrow"), and
+    dtype_backend selects NumPy-backed ("numpy") or Arrow-backed ("pyarrow") columns.
 
-    # Get the appropriate DataIngestor
-    data_ingestor = DataIngestorFactory.get_data_ingestor(file_extension)
+    When file_path is a database URL, query is streamed from it fetch_size rows at a time.
+    """
+    # Get the appropriate DataIngestor for the file, directory, glob pattern or database URL
+    dtype = AMES_SCHEMA if use_schema else None
+    data_ingestor = DataIngestorFactory.get_data_ingestor_for_path(
+        file_path,
+        member=member,
+        dtype=dtype,
+        usecols=columns,
+        engine=engine,
+        dtype_backend=dtype_backend,
+        cache_dir=cache_dir,
+        max_workers=max_workers,
+        query=query,
+        fetch_size=fetch_size,
+    )
 
     # Ingest the data and load it into a DataFrame
+    start_time = time.perf_counter()
     df = data_ingestor.ingest(file_path)
+    parse_seconds = time.perf_counter() - start_time
+
+    # Report memory against the default inferred dtypes and attach it to the output artifact
+    report = memory_report(df)
+    logging.info(
+        f"Ingested {len(df)} rows in {parse_seconds:.3f}s using {report['memory_bytes']} bytes "
+        f"(default dtypes: {report['inferred_memory_bytes']} bytes, "
+        f"saved {report['saved_fraction']:.1%})."
+    )
+    metadata = {"memory": report, "parse_seconds": round(parse_seconds, 4)}
+
+    if columns is not None:
+        pruned_columns = [column for column in AMES_SCHEMA if column not in columns]
+        logging.info(f"Pruned {len(pruned_columns)} columns at ingestion: {pruned_columns}")
+        metadata["parsed_columns"] = list(columns)
+        metadata["pruned_columns"] = pruned_columns
+
+    log_artifact_metadata(metadata=metadata)
     return df
@@ -1,34 +1,124 @@
+from typing import Annotated, Tuple
+
 import pandas as pd
+from src.execution_mode import set_precision
 from src.feature_engineering import (
+    DerivedFeatures,
     FeatureEngineer,
+    FeatureHashingEncoding,
+    InteractionFeatures,
     LogTransformation,
     MinMaxScaling,
     OneHotEncoding,
     StandardScaling,
+    TargetEncoding,
 )
 from zenml import step
 
+# The keys of a transform spec that are not options of the strategy
+SPEC_KEYS = ("strategy", "features")
 
-@step
-def feature_engineering_step(
-    df: pd.DataFrame, strategy: str = "log", features: list = None
-) -> pd.DataFrame:
-    """Performs feature engineering using FeatureEngineer and selected strategy."""
+# Strategies that learn from the target. They are fitted on the training split only, by the
+# model_transforms of model_building_step, so the test targets never reach them.
+SUPERVISED_STRATEGIES = ("target_encoding", "interaction_features")
 
-    # Ensure features is a list, even if not provided
-    if features is None:
-        features = []  # or raise an error if features are required
 
+def build_strategy(strategy: str, features: list, **options):
+    """
+    Builds the feature engineering strategy named in a transform spec. Any other keys of the
+    spec, such as `sparse` for one-hot encoding, are passed to the strategy as options.
+    Without features, derived and interaction features use their defaults and the other
+    strategies transform nothing.
+    """
+    if features is None and strategy not in ("derived_features", "interaction_features"):
+        features = []
     if strategy == "log":
-        engineer = FeatureEngineer(LogTransformation(features))
+        return LogTransformation(features)
     elif strategy == "standard_scaling":
-        engineer = FeatureEngineer(StandardScaling(features))
+        return StandardScaling(features)
     elif strategy == "minmax_scaling":
-        engineer = FeatureEngineer(MinMaxScaling(features))
+        return MinMaxScaling(features)
     elif strategy == "onehot_encoding":
-        engineer = FeatureEngineer(OneHotEncoding(features))
+        return OneHotEncoding(features, **options)
+    elif strategy == "feature_hashing":
+        return FeatureHashingEncoding(features, **options)
+    elif strategy == "target_encoding":
+        return TargetEncoding(features, **options)
+    elif strategy == "derived_features":
+        return DerivedFeatures(features, **options)
+    elif strategy == "interaction_features":
+        return InteractionFeatures(features, **options)
     else:
         raise ValueError(f"Unsupported feature engineering strategy: {strategy}")
 
+
+def transform_input_columns(transforms: list) -> list:
+    """
+    Returns the columns a transform spec reads: the features of each entry and, for derived
+    features, the columns their expressions read. Ingestion must parse all of them.
+    """
+    columns = []
+    for spec in transforms:
+        if spec["strategy"] == "derived_features":
+            options = {key: value for key, value in spec.items() if key not in SPEC_KEYS}
+            columns += DerivedFeatures(spec.get("features"), **options).input_columns()
+        else:
+            columns += spec.get("features") or []
+    return list(dict.fromkeys(columns))
+
+
+def build_engineer(transforms: list) -> FeatureEngineer:
+    """
+    Builds an unfitted FeatureEngineer for a transform spec applied before the split, so
+    strategies that learn from the target are rejected.
+    """
+    for spec in transforms:
+        if spec["strategy"] in SUPERVISED_STRATEGIES:
+            raise ValueError(
+                f"The {spec['strategy']} strategy learns from the target and must be fitted "
+                "on the training split; pass it to model_building_step as a model transform."
+            )
+
+    return FeatureEngineer(
+        [
+            build_strategy(
+                spec["strategy"],
+                spec.get("features"),
+                **{key: value for key, value in spec.items() if key not in SPEC_KEYS},
+            )
+            for spec in transforms
+        ]
+    )
+
+
+@step
+def feature_engineering_step(
+    df: pd.DataFrame,
+    strategy: str = "log",
+    features: list = None,
+    transforms: list = None,
+    precision: str = "float64",
+) -> Tuple[
+    Annotated[pd.DataFrame, "engineered_data"], Annotated[FeatureEngineer, "feature_engineer"]
+]:
+    """
+    Performs feature engineering using FeatureEngineer and the selected strategies.
+
+    `transforms` is the whole transform spec as an ordered list of
+    {"strategy": ..., "features": [...], **options} entries, applied in one compiled plan.
+    Without it, the single `strategy` is applied to `features`. The fitted engineer is
+    returned too, so the same transforms can be bundled into the exported model.
+    Transformed columns and fitted parameters are kept in the given `precision`.
+
+    This step runs before the train/test split, so strategies that learn from the target
+    are rejected here; they belong in the model_transforms of model_building_step.
+    """
+    set_precision(precision)
+
+    if transforms is None:
+        # Ensure features is a list, even if not provided
+        transforms = [{"strategy": strategy, "features": features or []}]
+
+    engineer = build_engineer(transforms)
     transformed_df = engineer.apply_feature_engineering(df)
-    return transformed_df
+    return transformed_df, engineer
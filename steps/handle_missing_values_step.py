@@ -2,6 +2,7 @@ import pandas as pd
 from src.handle_missing_values import (
     DropMissingValuesStrategy,
     FillMissingValuesStrategy,
+    KNNFillMissingValuesStrategy,
     MissingValueHandler,
 )
 from zenml import step
@@ -15,6 +16,8 @@ def handle_missing_values_step(df: pd.DataFrame, strategy: str = "mean") -> pd.D
         handler = MissingValueHandler(DropMissingValuesStrategy(axis=0))
     elif strategy in ["mean", "median", "mode", "constant"]:
         handler = MissingValueHandler(FillMissingValuesStrategy(method=strategy))
+    elif strategy == "knn":
+        handler = MissingValueHandler(KNNFillMissingValuesStrategy())
     else:
         raise ValueError(f"Unsupported missing value handling strategy: {strategy}")
 
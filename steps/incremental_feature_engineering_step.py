@@ -0,0 +1,58 @@
+import logging
+from typing import Annotated, Tuple
+
+import pandas as pd
+from src.execution_mode import set_precision
+from src.feature_engineering import FeatureEngineer
+from src.ingest_data import IncrementalDataIngestor
+from steps.feature_engineering_step import build_engineer
+from zenml import step
+
+
+@step(enable_cache=False)
+def incremental_feature_engineering_step(
+    new_data: pd.DataFrame,
+    processed_parts: list,
+    engineered_parts: list,
+    transforms: list,
+    state_dir: str = ".incremental_state",
+    precision: str = "float64",
+    refit: bool = False,
+    refit_every: int = None,
+) -> Tuple[
+    Annotated[pd.DataFrame, "engineered_data"],
+    Annotated[FeatureEngineer, "feature_engineer"],
+    Annotated[pd.DataFrame, "raw_data"],
+    Annotated[bool, "refitted"],
+]:
+    """
+    Transforms the new rows with the stored, already fitted feature engineer and appends them
+    to the engineered parts, so the processed rows are not transformed again.
+
+    The engineer is refitted on every accumulated row instead when `refit` is set, when
+    `refit_every` increments were committed since it was fitted, when none is stored yet, or
+    when it was fitted with other transforms or another precision. `raw_data` holds rows as
+    ingested for the input example of the model signature: the new rows, or all of them
+    after a refit.
+    """
+    set_precision(precision)
+    spec = {"transforms": transforms, "precision": precision}
+    data_ingestor = IncrementalDataIngestor(ingestor=None, state_dir=state_dir)
+
+    engineer = None if refit else data_ingestor.load_engineer(spec, refit_every=refit_every)
+    if engineer is None:
+        logging.info("Refitting the feature transforms on all the accumulated rows.")
+        raw_data = IncrementalDataIngestor.combine_parts(processed_parts, new_data)
+        engineer = build_engineer(transforms)
+        engineered_data = engineer.apply_feature_engineering(raw_data)
+        return engineered_data, engineer, raw_data, True
+
+    logging.info(f"Transforming {len(new_data)} new rows with the stored feature transforms.")
+    engineered_data = IncrementalDataIngestor.combine_parts(
+        engineered_parts, engineer.transform(new_data)
+    )
+    raw_data = new_data
+    if raw_data.empty and processed_parts:
+        # The signature example needs rows even when nothing new arrived
+        raw_data = pd.read_parquet(processed_parts[-1])
+    return engineered_data, engineer, raw_data, False
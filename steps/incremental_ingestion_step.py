@@ -0,0 +1,42 @@
+import logging
+from typing import Annotated, Tuple
+
+import pandas as pd
+from src.ingest_data import DataIngestorFactory, IncrementalDataIngestor
+from src.ingestion_schema import AMES_SCHEMA
+from zenml import step
+
+
+@step(enable_cache=False)
+def incremental_ingestion_step(
+    file_path: str,
+    state_dir: str = ".incremental_state",
+    watermark: str = "period",
+    cache_dir: str = None,
+    use_schema: bool = True,
+    columns: list = None,
+) -> Tuple[
+    Annotated[pd.DataFrame, "new_data"],
+    Annotated[list, "processed_parts"],
+    Annotated[list, "engineered_parts"],
+]:
+    """Ingests only the rows past the stored watermark.
+
+    Returns the new rows together with the paths of the previously committed parts, both as
+    ingested and engineered. The engineered parts are reused as they are, so only the new
+    rows are transformed; the ingested ones are only read when the transforms are refitted.
+    """
+    dtype = AMES_SCHEMA if use_schema else None
+    data_ingestor = IncrementalDataIngestor(
+        DataIngestorFactory.get_data_ingestor_for_path(
+            file_path, dtype=dtype, usecols=columns, cache_dir=cache_dir
+        ),
+        state_dir=state_dir,
+        watermark=watermark,
+    )
+
+    new_data = data_ingestor.ingest(file_path)
+    processed_parts = data_ingestor.processed_parts()
+    engineered_parts = data_ingestor.processed_parts(engineered=True)
+    logging.info(f"{len(engineered_parts)} previously engineered parts are reused as-is.")
+    return new_data, processed_parts, engineered_parts
@@ -2,13 +2,27 @@ import logging
 from typing import Annotated
 
 import mlflow
+import numpy as np
 import pandas as pd
+from mlflow.models import infer_signature
 from sklearn.base import RegressorMixin
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.linear_model import LinearRegression
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from src.execution_mode import float_dtype, set_precision
+from src.feature_engineering import (
+    FeatureEngineer,
+    FeatureHashingEncoding,
+    FeatureTransformer,
+    SparseColumnsTransformer,
+    SupervisedFeatureTransformer,
+    TargetTransformedRegressor,
+)
+from src.handle_missing_values import MissingValueImputer
+from src.model_building import SparseLinearRegression
+from steps.feature_engineering_step import SPEC_KEYS, SUPERVISED_STRATEGIES, build_strategy
 from zenml import ArtifactConfig, step
 from zenml.client import Client
 
@@ -24,19 +38,100 @@ model = Model(
 )
 
 
+def widen_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Widens integer columns to int64 and float columns to float64.
+
+    Training data is ingested with narrow dtypes (int16, float32, ...). A signature with the
+    wide dtypes accepts int64 and float64 request frames once serving code has cast them to
+    the signature, as area columns parsed as float32 are declared float64 and often arrive
+    as ints.
+    """
+    return df.astype(
+        {
+            column: "int64" if pd.api.types.is_integer_dtype(dtype) else "float64"
+            for column, dtype in df.dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+        }
+    )
+
+
+def raw_example(
+    raw_data: pd.DataFrame,
+    X_train: pd.DataFrame,
+    feature_engineer: FeatureEngineer,
+    target_column: str,
+) -> pd.DataFrame:
+    """
+    Returns the first rows of the raw data, with the columns the exported model reads.
+
+    A raw column is read if it reaches the model unchanged or if the feature transforms
+    consume it, as hashing consumes its categorical columns. Other raw columns, such as text
+    columns dropped before the split, are left out of the signature.
+    """
+    raw = raw_data.drop(columns=[target_column], errors="ignore").head(5)
+    engineered = feature_engineer.transform(raw)
+    columns = [
+        column
+        for column in raw.columns
+        if column in X_train.columns or column not in engineered.columns
+    ]
+    return raw[columns]
+
+
+def build_model_strategy(spec: dict, target_column: str):
+    """
+    Builds a strategy of the model transform spec. Strategies that learn from the target
+    read it from `target_column` unless the spec names another column.
+    """
+    options = {key: value for key, value in spec.items() if key not in SPEC_KEYS}
+    if spec["strategy"] in SUPERVISED_STRATEGIES:
+        options.setdefault("target_column", target_column)
+    return build_strategy(spec["strategy"], spec.get("features"), **options)
+
+
 @step(enable_cache=False, experiment_tracker=experiment_tracker.name, model=model)
 def model_building_step(
-    X_train: pd.DataFrame, y_train: pd.Series
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    feature_engineer: FeatureEngineer = None,
+    target_column: str = "SalePrice",
+    sparse: bool = False,
+    categorical_encoding: str = "onehot",
+    hash_features: int = 64,
+    precision: str = "float64",
+    raw_data: pd.DataFrame = None,
+    model_transforms: list = None,
 ) -> Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
     """
     Builds and trains a Linear Regression model using scikit-learn wrapped in a pipeline.
 
+    The exported pipeline takes raw features and returns prices: it applies the fitted
+    feature transforms, the preprocessing and the model, then inverts the target transform.
+
     Parameters:
-    X_train (pd.DataFrame): The training data features.
-    y_train (pd.Series): The training data labels/target.
+    X_train (pd.DataFrame): The training data features, already feature engineered.
+    y_train (pd.Series): The training data labels/target, already feature engineered.
+    feature_engineer (FeatureEngineer): The fitted engineer that produced X_train and y_train.
+    target_column (str): The name of the target column in the engineer's plan.
+    sparse (bool): Whether to keep the preprocessed features in a sparse matrix and solve the
+        least-squares problem with a sparse solver, so one-hot columns are never densified.
+    categorical_encoding (str): How categorical columns are encoded, "onehot" or "hashing".
+        Hashing needs no vocabulary and keeps the model width fixed at `hash_features`
+        columns per categorical column, including for categories unseen in training.
+    hash_features (int): The number of hashed columns per categorical column.
+    precision (str): The floating-point precision of the feature matrix and the model
+        parameters, "float64" or "float32".
+    raw_data (pd.DataFrame): The data before feature engineering, for the input example of
+        the logged model signature. Without it the example is recovered by inverting the
+        feature transforms, which fails for transforms that cannot be undone, like hashing.
+    model_transforms (list): Transform specs, like those of feature_engineering_step, for
+        strategies that learn from the target, such as target encoding. They are fitted on
+        X_train and y_train only and bundled into the model pipeline after the feature
+        transforms, so no statistics come from the test split.
 
     Returns:
-    Pipeline: The trained scikit-learn pipeline including preprocessing and the Linear Regression model.
+    Pipeline: The trained scikit-learn pipeline, from raw features to predicted prices.
     """
     # Ensure the inputs are of the correct type
     if not isinstance(X_train, pd.DataFrame):
@@ -44,53 +139,134 @@ def model_building_step(
     if not isinstance(y_train, pd.Series):
         raise TypeError("y_train must be a pandas Series.")
 
-    # Identify categorical and numerical columns
+    # Feature matrices and model parameters use the configured precision
+    set_precision(precision)
+    dtype = float_dtype()
+    logging.info(f"Training in {dtype.name} precision.")
+
+    # Fit the strategies that learn from the target on the training split only and store them
+    # with the model, like the fill values of the imputer below.
+    supervised = None
+    if model_transforms:
+        strategies = [build_model_strategy(spec, target_column) for spec in model_transforms]
+        supervised = SupervisedFeatureTransformer(FeatureEngineer(strategies), target_column)
+        X_train = supervised.fit_transform(X_train, y_train)
+
+    # Identify categorical, numerical and already sparse (e.g. sparse one-hot) columns
     categorical_cols = X_train.select_dtypes(include=["object", "category"]).columns
-    numerical_cols = X_train.select_dtypes(exclude=["object", "category"]).columns
+    sparse_cols = pd.Index(
+        [column for column, dtype in X_train.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+    )
+    numerical_cols = X_train.select_dtypes(exclude=["object", "category"]).columns.difference(
+        sparse_cols, sort=False
+    )
 
     logging.info(f"Categorical columns: {categorical_cols.tolist()}")
     logging.info(f"Numerical columns: {numerical_cols.tolist()}")
+    logging.info(f"Sparse columns: {sparse_cols.tolist()}")
 
-    # Define preprocessing for categorical and numerical features
-    numerical_transformer = SimpleImputer(strategy="mean")
-    categorical_transformer = Pipeline(
-        steps=[
-            ("imputer", SimpleImputer(strategy="most_frequent")),
-            ("onehot", OneHotEncoder(handle_unknown="ignore")),
-        ]
-    )
+    # Define preprocessing for categorical and numerical features.
+    # The imputer learns its fill values from X_train only and is stored with the model.
+    numerical_transformer = MissingValueImputer(method="mean", dtype=dtype)
+    if dtype == np.float32:
+        # Float32 least squares on raw columns (ids, years, areas) loses several digits to
+        # their large offsets and scales. Standardised columns keep it within about 1e-4
+        # of the float64 predictions; in float64 scaling would not change the predictions.
+        numerical_transformer = Pipeline(
+            steps=[("imputer", numerical_transformer), ("scaler", StandardScaler())]
+        )
+    if categorical_encoding == "onehot":
+        categorical_transformer = Pipeline(
+            steps=[
+                ("imputer", SimpleImputer(strategy="most_frequent")),
+                ("onehot", OneHotEncoder(handle_unknown="ignore", dtype=dtype)),
+            ]
+        )
+    elif categorical_encoding == "hashing":
+        # Missing categories hash to no column. The hashed columns are kept sparse.
+        hashing = FeatureHashingEncoding(
+            categorical_cols.tolist(), n_features=hash_features, sparse=True
+        )
+        categorical_transformer = Pipeline(
+            steps=[
+                ("hashing", FeatureTransformer(FeatureEngineer(hashing))),
+                ("sparse", SparseColumnsTransformer()),
+            ]
+        )
+    else:
+        raise ValueError(f"Unsupported categorical encoding: {categorical_encoding}")
 
-    # Bundle preprocessing for numerical and categorical data
+    # Bundle preprocessing for numerical, categorical and sparse data. By default the output
+    # is densified once it is more than 30% non-zero; in sparse mode it always stays sparse.
     preprocessor = ColumnTransformer(
         transformers=[
             ("num", numerical_transformer, numerical_cols),
             ("cat", categorical_transformer, categorical_cols),
-        ]
+            ("sparse", SparseColumnsTransformer(), sparse_cols),
+        ],
+        sparse_threshold=1.0 if sparse else 0.3,
     )
 
-    # Define the model training pipeline
-    pipeline = Pipeline(steps=[("preprocessor", preprocessor), ("model", LinearRegression())])
+    # Without an engineer the features and target are used as they are
+    if feature_engineer is None:
+        feature_engineer = FeatureEngineer([])
+
+    # Define the model training pipeline. X_train and y_train are already transformed, so
+    # the regressor is fitted on them directly and only inverts the target when predicting.
+    regressor = SparseLinearRegression() if sparse else LinearRegression()
+    pipeline = Pipeline(
+        steps=[
+            ("preprocessor", preprocessor),
+            ("model", TargetTransformedRegressor(regressor, feature_engineer, target_column)),
+        ]
+    )
 
     # Start an MLflow run to log the model training process
     if not mlflow.active_run():
         mlflow.start_run()  # Start a new MLflow run if there isn't one active
 
     try:
-        # Enable autologging for scikit-learn to automatically capture model metrics, parameters, and artifacts
-        mlflow.sklearn.autolog()
+        # Enable autologging for scikit-learn to automatically capture model metrics and
+        # parameters. The model itself is logged below, once the feature transforms are added.
+        mlflow.sklearn.autolog(log_models=False)
+        mlflow.log_param("precision", dtype.name)
 
         logging.info("Building and training the Linear Regression model.")
         pipeline.fit(X_train, y_train)
         logging.info("Model training completed.")
 
-        # Log the columns that the model expects
-        onehot_encoder = (
-            pipeline.named_steps["preprocessor"].transformers_[1][1].named_steps["onehot"]
-        )
-        onehot_encoder.fit(X_train[categorical_cols])
-        expected_columns = numerical_cols.tolist() + list(
-            onehot_encoder.get_feature_names_out(categorical_cols)
+        # The exported model starts from raw features, so serving does no transforms itself
+        feature_steps = [("features", FeatureTransformer(feature_engineer, prefit=True))]
+        if supervised is not None:
+            feature_steps.append(("supervised", supervised))
+        pipeline = Pipeline(steps=feature_steps + pipeline.steps)
+        if raw_data is not None:
+            example = raw_example(raw_data, X_train, feature_engineer, target_column)
+        else:
+            try:
+                example = feature_engineer.inverse_transform(X_train.head(5))
+            except ValueError as e:
+                raise ValueError(
+                    "The feature transforms cannot be inverted; pass raw_data to build the "
+                    "model signature."
+                ) from e
+        mlflow.sklearn.log_model(
+            pipeline,
+            "model",
+            signature=infer_signature(widen_dtypes(example), pipeline.predict(example)),
+            code_paths=["src"],
         )
+
+        # Log the columns that the model expects
+        if categorical_encoding == "onehot":
+            onehot_encoder = (
+                pipeline.named_steps["preprocessor"].transformers_[1][1].named_steps["onehot"]
+            )
+            onehot_encoder.fit(X_train[categorical_cols])
+            categorical_features = list(onehot_encoder.get_feature_names_out(categorical_cols))
+        else:
+            categorical_features = hashing.get_feature_names_out()
+        expected_columns = numerical_cols.tolist() + categorical_features + sparse_cols.tolist()
         logging.info(f"Model expects the following columns: {expected_columns}")
 
     except Exception as e:
@@ -30,15 +30,18 @@ def model_evaluator_step(
 
     logging.info("Applying the same preprocessing to the test data.")
 
-    # Apply the preprocessing and model prediction
+    # Apply the transforms fitted on the training split, the preprocessing and model prediction
+    if "supervised" in trained_model.named_steps:
+        X_test = trained_model.named_steps["supervised"].transform(X_test)
     X_test_processed = trained_model.named_steps["preprocessor"].transform(X_test)
 
     # Initialize the evaluator with the regression strategy
     evaluator = ModelEvaluator(strategy=RegressionModelEvaluationStrategy())
 
-    # Perform the evaluation
+    # Perform the evaluation. The test target is on the transformed scale, so the inner
+    # regressor is evaluated rather than the exported model, which inverts the transform.
     evaluation_metrics = evaluator.evaluate(
-        trained_model.named_steps["model"], X_test_processed, y_test
+        trained_model.named_steps["model"].regressor_, X_test_processed, y_test
     )
 
     # Ensure that the evaluation metrics are returned as a dictionary
@@ -6,8 +6,15 @@ from zenml import step
 
 
 @step
-def outlier_detection_step(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
-    """Detects and removes outliers using OutlierDetector."""
+def outlier_detection_step(
+    df: pd.DataFrame, column_name: str, keep_columns: list = None
+) -> pd.DataFrame:
+    """
+    Detects outliers in the given column and removes their rows using OutlierDetector.
+
+    Only numeric columns are passed on, plus the `keep_columns`, such as categorical columns
+    that the model transforms encode after the split.
+    """
     logging.info(f"Starting outlier detection step with DataFrame of shape: {df.shape}")
 
     if df is None:
@@ -21,10 +28,20 @@ def outlier_detection_step(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
     if column_name not in df.columns:
         logging.error(f"Column '{column_name}' does not exist in the DataFrame.")
         raise ValueError(f"Column '{column_name}' does not exist in the DataFrame.")
-        # Ensure only numeric columns are passed
-    df_numeric = df.select_dtypes(include=[int, float])
+    # Ensure only numeric columns are passed
+    df_numeric = df.select_dtypes(include="number")
+    if column_name not in df_numeric.columns:
+        logging.error(f"Column '{column_name}' is not numeric.")
+        raise ValueError(f"Column '{column_name}' must be numeric for outlier detection.")
 
+    # The outlier rows are detected once, on the given column only, and reused for removal
     outlier_detector = OutlierDetector(ZScoreOutlierDetection(threshold=3))
-    outliers = outlier_detector.detect_outliers(df_numeric)
-    df_cleaned = outlier_detector.handle_outliers(df_numeric, method="remove")
+    outlier_rows = outlier_detector.detect_outlier_rows(df_numeric, columns=[column_name])
+    keep_columns = keep_columns or []
+    kept = [
+        column for column in df.columns if column in df_numeric.columns or column in keep_columns
+    ]
+    df_cleaned = outlier_detector.handle_outliers(
+        df[kept], method="remove", outlier_rows=outlier_rows
+    )
     return df_cleaned
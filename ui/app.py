@@ -1,7 +1,6 @@
 import os
 import mlflow
 import pandas as pd
-import numpy as np
 from flask import Flask, request, render_template
 
 # Initialize Flask app
@@ -47,6 +46,14 @@ def get_model():
             raise # Reraise to be caught by the route
     return loaded_model
 
+def cast_to_model_schema(model, input_df):
+    """Casts the input columns to the dtypes of the model's logged input schema."""
+    input_schema = model.metadata.get_input_schema()
+    if input_schema is None:
+        return input_df
+    dtypes = dict(zip(input_schema.input_names(), input_schema.numpy_types()))
+    return input_df.astype({column: dtype for column, dtype in dtypes.items() if column in input_df})
+
 @app.route('/', methods=['GET', 'POST'])
 def predict():
     prediction_result = None
@@ -61,7 +68,6 @@ def predict():
             # Start with a default full feature set (like sample_predict.py)
             # This ensures all columns expected by the model are present.
             # Values will be overridden by form input.
-            # Important: Ensure data types match what the model expects after schema inference.
             data = {
                 "Order": 1, "PID": 5286, "MS SubClass": 20, "Lot Frontage": 80.0, "Lot Area": 9600,
                 "Overall Qual": 7, "Overall Cond": 5, "Year Built": 2005, "Year Remod/Add": 2005,
@@ -77,40 +83,20 @@ def predict():
             # Update with form data, converting to appropriate types
             # These are the fields from the form
             data["Overall Qual"] = int(request.form['OverallQual'])
-            data["Gr Liv Area"] = float(request.form['GrLivArea']) # Will be log1p transformed
+            data["Gr Liv Area"] = float(request.form['GrLivArea'])
             data["Year Built"] = int(request.form['YearBuilt'])
             data["Total Bsmt SF"] = float(request.form['TotalBsmtSF'])
             data["Full Bath"] = int(request.form['FullBath'])
-            data["Garage Cars"] = float(request.form['GarageCars']) # Schema expects double
-
-            # Manually ensure other fields that model schema expects as float are float
-            # (even if their default whole number might make pandas infer int)
-            float_fields_from_schema = ["Lot Frontage", "Mas Vnr Area", "BsmtFin SF 1", "BsmtFin SF 2", 
-                                        "Bsmt Unf SF", "Total Bsmt SF", "Gr Liv Area", "Bsmt Full Bath", 
-                                        "Bsmt Half Bath", "Garage Yr Blt", "Garage Cars", "Garage Area"]
-            for field in float_fields_from_schema:
-                if field in data:
-                    data[field] = float(data[field])
-            
-            # Ensure integer fields are int
-            int_fields_from_schema = ["Order", "PID", "MS SubClass", "Lot Area", "Overall Qual", "Overall Cond", 
-                                      "Year Built", "Year Remod/Add", "1st Flr SF", "2nd Flr SF", "Low Qual Fin SF", 
-                                      "Full Bath", "Half Bath", "Bedroom AbvGr", "Kitchen AbvGr", "TotRms AbvGrd", 
-                                      "Fireplaces", "Wood Deck SF", "Open Porch SF", "Enclosed Porch", 
-                                      "3Ssn Porch", "Screen Porch", "Pool Area", "Misc Val", "Mo Sold", "Yr Sold"]
-            for field in int_fields_from_schema:
-                 if field in data:
-                    data[field] = int(data[field])
-
+            data["Garage Cars"] = float(request.form['GarageCars'])
 
             input_df = pd.DataFrame([data])
-            
-            # Apply log transformation to 'Gr Liv Area' as done during training
-            if 'Gr Liv Area' in input_df.columns:
-                input_df['Gr Liv Area'] = np.log1p(input_df['Gr Liv Area'])
-            
-            raw_prediction = model.predict(input_df)
-            prediction_result = np.expm1(raw_prediction[0])
+
+            # Cast each column to the dtype recorded in the model's input signature, since
+            # the signature declares area columns as float64 but the form data has ints
+            input_df = cast_to_model_schema(model, input_df)
+
+            # The model applies the feature transforms and returns the price itself
+            prediction_result = model.predict(input_df)[0]
 
         except Exception as e:
             error_message = str(e)